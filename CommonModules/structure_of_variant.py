@@ -15,6 +15,8 @@ class KeyTime:
     """Ключи в словаре для параметров времени"""
     modelling = "Modelling Time"
     repeating = "Repeating Time"
+    # Необязательный ключ: зерно генератора случайных чисел для повторения результатов
+    seed = "Seed"
 
 
 class KeyMFR:
@@ -22,6 +22,9 @@ class ChangeTimeParametersWidget(QWidget):
         self.repeating_spin_box.setAlignment(Qt.AlignHCenter)
         self.repeating_spin_box.setRange(1, 100000)
 
+        # Зерно генератора случайных чисел из редактируемого варианта (если задано, сохраняется вместе с вариантом)
+        self.seed = None
+
         # Основная группа виджетов
         self.main_group = QGroupBox("Укажите временные параметры моделируемого варианта")
         # Внутри группы контейнер для компонентов формы
@@ -48,8 +51,11 @@ class ChangeTimeParametersWidget(QWidget):
         :return: Словарь параметров
         :rtype: dict
         """
-        return {KeyTime.modelling: self.modelling_spin_box.value(),
-                KeyTime.repeating: self.repeating_spin_box.value()}
+        parameters = {KeyTime.modelling: self.modelling_spin_box.value(),
+                      KeyTime.repeating: self.repeating_spin_box.value()}
+        if self.seed is not None:
+            parameters[KeyTime.seed] = self.seed
+        return parameters
 
     @parameters.setter
     def parameters(self, new_parameters: dict) -> None:
@@ -62,6 +68,7 @@ class ChangeTimeParametersWidget(QWidget):
         """
         self.modelling_spin_box.setValue(new_parameters[KeyTime.modelling])
         self.repeating_spin_box.setValue(new_parameters[KeyTime.repeating])
+        self.seed = new_parameters.get(KeyTime.seed)
 
     def clear(self) -> None:
         """Очищение введённых от пользователя параметров
@@ -70,3 +77,4 @@ class ChangeTimeParametersWidget(QWidget):
         """
         self.modelling_spin_box.setValue(self.modelling_spin_box.minimum())
         self.repeating_spin_box.setValue(self.repeating_spin_box.minimum())
+        self.seed = None
@@ -47,6 +47,22 @@ def sph2dec_cov_matrix(covariance_matrix_sph: ndarray, coordinate_sph: ndarray)
     return covariance_matrix_dec
 
 
+def sph2dec_cov_matrix_array(covariance_matrices_sph: ndarray, coordinates_sph: ndarray) -> ndarray:
+    """Расчёт ковариационных матриц в декартовых координатах из сферических сразу для набора матриц
+
+    :param covariance_matrices_sph: Ковариационные матрицы сферических координат, массив размера (N, 3, 3)
+    :type covariance_matrices_sph: ndarray
+    :param coordinates_sph: Векторы сферических координат, массив размера (N, 3)
+    :type coordinates_sph: ndarray
+
+    :return: Ковариационные матрицы декартовых координат, массив размера (N, 3, 3)
+    :rtype: ndarray
+    """
+    # Матрицы производных для перехода к декартовым координатам
+    derivative_matrices = calc_dec_derivative_matrix_array(coordinates_sph)
+    return transform_cov_matrix_array(derivative_matrices, covariance_matrices_sph)
+
+
 def dec2sph_cov_matrix(covariance_matrix_dec: ndarray, coordinate_dec: ndarray) -> ndarray:
     """Расчёт ковариационной матрицы в декартовых координатах из сферических
 
@@ -65,6 +81,36 @@ def dec2sph_cov_matrix(covariance_matrix_dec: ndarray, coordinate_dec: ndarray)
     return covariance_matrix_sph
 
 
+def dec2sph_cov_matrix_array(covariance_matrices_dec: ndarray, coordinates_dec: ndarray) -> ndarray:
+    """Расчёт ковариационных матриц в сферических координатах из декартовых сразу для набора матриц
+
+    :param covariance_matrices_dec: Ковариационные матрицы в декартовых координатах, массив размера (N, 3, 3)
+    :type covariance_matrices_dec: ndarray
+    :param coordinates_dec: Векторы декартовых координат, массив размера (N, 3)
+    :type coordinates_dec: ndarray
+
+    :return: Ковариационные матрицы в сферических координатах, массив размера (N, 3, 3)
+    :rtype: ndarray
+    """
+    # Матрицы производных для перехода к сферическим координатам
+    derivative_matrices = calc_sph_derivative_matrix_array(coordinates_dec)
+    return transform_cov_matrix_array(derivative_matrices, covariance_matrices_dec)
+
+
+def transform_cov_matrix_array(derivative_matrices: ndarray, covariance_matrices: ndarray) -> ndarray:
+    """Пересчёт набора ковариационных матриц по матрицам производных: S*K*S' для каждой пары матриц
+
+    :param derivative_matrices: Матрицы производных, массив размера (N, 3, 3)
+    :type derivative_matrices: ndarray
+    :param covariance_matrices: Ковариационные матрицы, массив размера (N, 3, 3)
+    :type covariance_matrices: ndarray
+
+    :return: Пересчитанные ковариационные матрицы, массив размера (N, 3, 3)
+    :rtype: ndarray
+    """
+    return np.einsum("nij,njk,nlk->nil", derivative_matrices, covariance_matrices, derivative_matrices)
+
+
 def calc_derivative_r(coordinate_dec: ndarray) -> ndarray:
     """Расчёт вектора производных дальности по декартовым координатам
 
@@ -161,3 +207,57 @@ def calc_sph_derivative_matrix(coordinate_dec: ndarray) -> ndarray:
                                   calc_derivative_beta(coordinate_dec),
                                   calc_derivative_eps(coordinate_dec)])
     return derivative_matrix
+
+
+def calc_dec_derivative_matrix_array(coordinates_sph: ndarray) -> ndarray:
+    """Расчёт матриц производных декартовых координат по сферическим координатам сразу для массива векторов
+
+    :param coordinates_sph: Векторы сферических координат, массив размера (N, 3)
+    :type coordinates_sph: ndarray
+
+    :return: Матрицы производных для перехода к декартовым координатам, массив размера (N, 3, 3)
+    :rtype: ndarray
+    """
+    r, beta, eps = coordinates_sph.T
+    sin_beta, cos_beta = np.sin(beta), np.cos(beta)
+    sin_eps, cos_eps = np.sin(eps), np.cos(eps)
+    # Формируем элементы матриц производных
+    derivative_matrices = np.zeros((len(coordinates_sph), 3, 3))
+
+    derivative_matrices[:, 0, 0] = cos_beta * cos_eps
+    derivative_matrices[:, 0, 1] = -r * cos_eps * sin_beta
+    derivative_matrices[:, 0, 2] = -r * sin_eps * cos_beta
+
+    derivative_matrices[:, 1, 0] = sin_eps
+    derivative_matrices[:, 1, 2] = r * cos_eps
+
+    derivative_matrices[:, 2, 0] = cos_eps * sin_beta
+    derivative_matrices[:, 2, 1] = r * cos_eps * cos_beta
+    derivative_matrices[:, 2, 2] = -r * sin_eps * sin_beta
+    return derivative_matrices
+
+
+def calc_sph_derivative_matrix_array(coordinates_dec: ndarray) -> ndarray:
+    """Расчёт матриц производных сферических координат по декартовым координатам сразу для массива векторов
+
+    :param coordinates_dec: Векторы декартовых координат, массив размера (N, 3)
+    :type coordinates_dec: ndarray
+
+    :return: Матрицы производных для перехода к сферическим координатам, массив размера (N, 3, 3)
+    :rtype: ndarray
+    """
+    x, y, z = coordinates_dec.T
+    r = np.sqrt(x ** 2 + y ** 2 + z ** 2)
+    hypot_xz = np.hypot(x, z)
+    # Формируем элементы матриц производных
+    derivative_matrices = np.zeros((len(coordinates_dec), 3, 3))
+    # Производные дальности
+    derivative_matrices[:, 0] = coordinates_dec / r[:, np.newaxis]
+    # Производные угла Beta
+    derivative_matrices[:, 1, 0] = -z / hypot_xz ** 2
+    derivative_matrices[:, 1, 2] = x / hypot_xz ** 2
+    # Производные угла Eps
+    derivative_matrices[:, 2, 0] = -x * y / (hypot_xz * r ** 2)
+    derivative_matrices[:, 2, 1] = hypot_xz / r ** 2
+    derivative_matrices[:, 2, 2] = -y * z / (hypot_xz * r ** 2)
+    return derivative_matrices
@@ -25,6 +25,26 @@ def dec2sph(coordinate_dec: ndarray) -> ndarray:
     return coordinate_sph
 
 
+def dec2sph_array(coordinates_dec: ndarray) -> ndarray:
+    """Функция для перехода от прямоугольных декартовых координат к сферическим сразу для массива векторов
+
+    :param coordinates_dec: Векторы декартовых координат, массив размера (N, 3)
+    :type coordinates_dec: ndarray
+
+    :return: Векторы сферических координат, массив размера (N, 3)
+    :rtype: ndarray
+    """
+    x, y, z = coordinates_dec.T
+
+    # Вычисление элементов результирующих векторов
+    r = np.sqrt(np.einsum("ni,ni->n", coordinates_dec, coordinates_dec))
+    beta = np.arctan2(z, x)
+    eps = np.arctan2(y, np.hypot(x, z))
+    # Результирующие векторы
+    coordinates_sph = np.column_stack((r, beta, eps))
+    return coordinates_sph
+
+
 def sph2dec(coordinate_sph: ndarray) -> ndarray:
     """Функция для перехода от сферических координат к прямоугольным декартовым
 
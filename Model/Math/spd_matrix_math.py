@@ -0,0 +1,179 @@
+"""Модуль содержит функции для симметричных положительно определённых матриц 3x3 (ковариационных матриц):
+деление справа и обобщённое расстояние через разложение Холецкого S = L*L'.
+Разложение и обратный к L множитель M считаются по явным формулам один раз и используются для всех нужных
+решений, сама обратная матрица S^-1 = M'*M не формируется.
+Если матрица численно не положительно определена, расчёт идёт через обычное решение систем"""
+from math import sqrt
+
+import numpy as np
+from numpy import ndarray
+from numpy.linalg import inv, solve
+
+
+def calc_inverse_cholesky_factor(matrix: ndarray):
+    """Расчёт элементов матрицы, обратной к нижнетреугольному множителю Холецкого L (S = L*L')
+
+    :param matrix: Симметричная матрица S
+    :type matrix: ndarray
+
+    :return: Элементы обратного множителя (m11, m21, m22, m31, m32, m33) или None,
+    если матрица численно не положительно определена
+    """
+    (a11, a12, a13), (_, a22, a23), (_, _, a33) = matrix.tolist()
+    if a11 <= 0.:
+        return None
+    # Множитель Холецкого
+    l11 = sqrt(a11)
+    l21 = a12 / l11
+    l31 = a13 / l11
+    pivot_22 = a22 - l21 * l21
+    if pivot_22 <= 0.:
+        return None
+    l22 = sqrt(pivot_22)
+    l32 = (a23 - l31 * l21) / l22
+    pivot_33 = a33 - l31 * l31 - l32 * l32
+    if pivot_33 <= 0.:
+        return None
+    l33 = sqrt(pivot_33)
+    # Обратный нижнетреугольный множитель
+    m11 = 1. / l11
+    m22 = 1. / l22
+    m33 = 1. / l33
+    m21 = -l21 * m11 * m22
+    m32 = -l32 * m22 * m33
+    m31 = -(l31 * m11 + l32 * m21) * m33
+    return m11, m21, m22, m31, m32, m33
+
+
+def calc_inverse_cholesky_factor_array(matrices: ndarray) -> tuple:
+    """Расчёт элементов матриц, обратных к множителям Холецкого, сразу для набора матриц
+
+    :param matrices: Симметричные матрицы, массив размера (..., 3, 3)
+    :type matrices: ndarray
+
+    :return: Элементы обратных множителей (m11, m21, m22, m31, m32, m33) в виде массивов размера (...)
+    и признаки положительной определённости
+    :rtype: tuple
+    """
+    a11, a12, a13 = matrices[..., 0, 0], matrices[..., 0, 1], matrices[..., 0, 2]
+    a22, a23, a33 = matrices[..., 1, 1], matrices[..., 1, 2], matrices[..., 2, 2]
+    # Множители Холецкого (для не положительно определённых матриц элементы не используются)
+    l11 = np.sqrt(np.maximum(a11, 0.))
+    l21 = a12 / l11
+    l31 = a13 / l11
+    pivot_22 = a22 - l21 * l21
+    l22 = np.sqrt(np.maximum(pivot_22, 0.))
+    l32 = (a23 - l31 * l21) / l22
+    pivot_33 = a33 - l31 * l31 - l32 * l32
+    l33 = np.sqrt(np.maximum(pivot_33, 0.))
+    is_positive_definite = (a11 > 0.) & (pivot_22 > 0.) & (pivot_33 > 0.)
+    # Обратные нижнетреугольные множители
+    m11 = 1. / l11
+    m22 = 1. / l22
+    m33 = 1. / l33
+    m21 = -l21 * m11 * m22
+    m32 = -l32 * m22 * m33
+    m31 = -(l31 * m11 + l32 * m21) * m33
+    return (m11, m21, m22, m31, m32, m33), is_positive_definite
+
+
+def right_divide_spd_3x3(matrix: ndarray, *numerators: ndarray) -> list:
+    """Деление справа нескольких матриц на одну симметричную положительно определённую матрицу:
+    G*S^-1 = (G*M')*M для каждой G. Разложение матрицы S считается один раз
+
+    :param matrix: Симметричная положительно определённая матрица S
+    :type matrix: ndarray
+    :param numerators: Матрицы G
+
+    :return: Список матриц G*S^-1
+    :rtype: list
+    """
+    inverse_factor = calc_inverse_cholesky_factor(matrix)
+    if inverse_factor is None:
+        return [solve(matrix, numerator.T).T for numerator in numerators]
+    m11, m21, m22, m31, m32, m33 = inverse_factor
+    # Обратный нижнетреугольный множитель Холецкого
+    factor = np.array([[m11, 0., 0.],
+                       [m21, m22, 0.],
+                       [m31, m32, m33]])
+    return [(numerator @ factor.T) @ factor for numerator in numerators]
+
+
+def right_divide_spd_3x3_array(matrices: ndarray, *numerators: ndarray) -> list:
+    """Деление справа нескольких наборов матриц на набор симметричных положительно определённых матриц
+
+    :param matrices: Симметричные положительно определённые матрицы S, массив размера (..., 3, 3)
+    :type matrices: ndarray
+    :param numerators: Матрицы G, массивы размера (..., 3, 3)
+
+    :return: Список массивов матриц G*S^-1
+    :rtype: list
+    """
+    factors = np.zeros(matrices.shape)
+    # Элементы для не положительно определённых матриц не используются, предупреждения для них не нужны
+    with np.errstate(divide="ignore", invalid="ignore"):
+        (m11, m21, m22, m31, m32, m33), is_positive_definite = calc_inverse_cholesky_factor_array(matrices)
+        # Обратные нижнетреугольные множители Холецкого
+        factors[..., 0, 0] = m11
+        factors[..., 1, 0], factors[..., 1, 1] = m21, m22
+        factors[..., 2, 0], factors[..., 2, 1], factors[..., 2, 2] = m31, m32, m33
+        transposed_factors = np.swapaxes(factors, -1, -2)
+        quotients = [(numerator @ transposed_factors) @ factors for numerator in numerators]
+    # Для численно не положительно определённых матриц - через решение систем
+    if not np.all(is_positive_definite):
+        is_not_positive_definite = ~is_positive_definite
+        for quotient, numerator in zip(quotients, numerators):
+            quotient[is_not_positive_definite] = np.swapaxes(
+                solve(matrices[is_not_positive_definite], np.swapaxes(numerator[is_not_positive_definite], -1, -2)),
+                -1, -2)
+    return quotients
+
+
+def mahalanobis_distance_3x3(matrix: ndarray, vector: ndarray) -> float:
+    """Расчёт обобщённого расстояния r*S^-1*r' через разложение Холецкого: |M*r|^2, где M = L^-1
+
+    :param matrix: Симметричная положительно определённая матрица S
+    :type matrix: ndarray
+    :param vector: Вектор r
+    :type vector: ndarray
+
+    :return: Обобщённое расстояние
+    :rtype: float
+    """
+    inverse_factor = calc_inverse_cholesky_factor(matrix)
+    if inverse_factor is None:
+        return vector @ inv(matrix) @ vector.T
+    m11, m21, m22, m31, m32, m33 = inverse_factor
+    r1, r2, r3 = vector.tolist()
+    y1 = m11 * r1
+    y2 = m21 * r1 + m22 * r2
+    y3 = m31 * r1 + m32 * r2 + m33 * r3
+    return y1 * y1 + y2 * y2 + y3 * y3
+
+
+def mahalanobis_distance_3x3_array(matrices: ndarray, vectors: ndarray) -> ndarray:
+    """Расчёт обобщённых расстояний сразу для набора матриц и векторов
+
+    :param matrices: Симметричные положительно определённые матрицы, массив размера (..., 3, 3)
+    :type matrices: ndarray
+    :param vectors: Векторы, массив размера (..., 3)
+    :type vectors: ndarray
+
+    :return: Обобщённые расстояния, массив размера (...)
+    :rtype: ndarray
+    """
+    r1, r2, r3 = vectors[..., 0], vectors[..., 1], vectors[..., 2]
+    # Элементы для не положительно определённых матриц не используются, предупреждения для них не нужны
+    with np.errstate(divide="ignore", invalid="ignore"):
+        (m11, m21, m22, m31, m32, m33), is_positive_definite = calc_inverse_cholesky_factor_array(matrices)
+        y1 = m11 * r1
+        y2 = m21 * r1 + m22 * r2
+        y3 = m31 * r1 + m32 * r2 + m33 * r3
+        distances = y1 * y1 + y2 * y2 + y3 * y3
+    # Для численно не положительно определённых матриц - через обычное обращение
+    if not np.all(is_positive_definite):
+        is_not_positive_definite = ~is_positive_definite
+        distances[is_not_positive_definite] = np.einsum(
+            "ni,nij,nj->n", vectors[is_not_positive_definite], inv(matrices[is_not_positive_definite]),
+            vectors[is_not_positive_definite])
+    return distances
@@ -0,0 +1,50 @@
+"""Модуль содержит планировщик тиков моделирования: пропускает тики, на которых ни у кого нет работы"""
+
+
+class TickScheduler:
+    """Планировщик тиков. Каждый объект моделирования работает периодически, начиная со своего стартового тика,
+    поэтому тик требует обработки, только если он попадает хотя бы в одну из таких периодических сеток"""
+    __slots__ = ("schedule",)
+
+    def __init__(self, schedule: list) -> None:
+        """
+        :param schedule: Список пар (стартовый тик, период в тиках)
+        :type schedule: list
+        """
+        # Расписание без повторов: пары (стартовый тик, период в тиках)
+        self.schedule = sorted({(int(start_tick), int(period)) for start_tick, period in schedule})
+
+    def __repr__(self) -> str:
+        return f"Планировщик тиков с расписанием {self.schedule!r}. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def next_tick(self, tick: int) -> int:
+        """Расчёт ближайшего тика после заданного, на котором что-то должно произойти
+
+        :param tick: Тик, после которого ищем следующий
+        :type tick: int
+
+        :return: Ближайший следующий тик с работой, или -1, если расписание пусто
+        :rtype: int
+        """
+        next_ticks = []
+        for start_tick, period in self.schedule:
+            # До старта объект не работает: первый тик работы - сам стартовый тик
+            if tick < start_tick:
+                next_ticks.append(start_tick)
+            else:
+                next_ticks.append(tick + period - (tick - start_tick) % period)
+        return min(next_ticks, default=-1)
+
+    def due_ticks(self, end_tick: int):
+        """Генератор всех тиков с работой из полуинтервала [0, end_tick)
+
+        :param end_tick: Тик окончания моделирования (не включается)
+        :type end_tick: int
+
+        :return: Генератор тиков
+        """
+        tick = self.next_tick(-1)
+        while 0 <= tick < end_tick:
+            yield tick
+            tick = self.next_tick(tick)
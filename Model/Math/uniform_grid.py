@@ -0,0 +1,52 @@
+"""Модуль содержит равномерную пространственную сетку для быстрого поиска близких точек"""
+from itertools import product
+
+import numpy as np
+from numpy import ndarray
+
+
+class UniformGrid:
+    """Равномерная сетка: точки раскладываются по кубическим ячейкам, поиск идёт только по ячейкам,
+    которые пересекает куб, описанный вокруг шара поиска. Результат поиска - кандидаты, а не точный ответ"""
+    __slots__ = ("cell_size",
+                 "cells")
+
+    def __init__(self, points: ndarray, cell_size: float) -> None:
+        """
+        :param points: Координаты точек, массив размера (N, 3)
+        :type points: ndarray
+        :param cell_size: Размер ребра ячейки (лучше брать не меньше радиуса поиска), неположительный заменяется на 1
+        :type cell_size: float
+        """
+        # Размер ребра ячейки
+        self.cell_size = cell_size if cell_size > 0 else 1.
+        # Словарь: индексы ячейки - список номеров точек в ней
+        self.cells = {}
+        for index, cell in enumerate(map(tuple, np.floor(points / self.cell_size).astype(int).tolist())):
+            self.cells.setdefault(cell, []).append(index)
+
+    def __repr__(self) -> str:
+        return f"Равномерная сетка с размером ячейки {self.cell_size!r} и {len(self.cells)!r} непустыми ячейками. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def query(self, point: ndarray, radius: float) -> list:
+        """Поиск точек, которые могут лежать в шаре заданного радиуса
+
+        :param point: Центр шара
+        :type point: ndarray
+        :param radius: Радиус шара
+        :type radius: float
+
+        :return: Номера точек из ячеек, пересекающих шар
+        :rtype: list
+        """
+        # Диапазоны индексов ячеек по каждой оси
+        low_cell = np.floor((point - radius) / self.cell_size).astype(int).tolist()
+        high_cell = np.floor((point + radius) / self.cell_size).astype(int).tolist()
+        ranges = [range(low, high + 1) for low, high in zip(low_cell, high_cell)]
+        # Если ячеек для перебора больше, чем непустых, то дешевле пройти по непустым
+        if np.prod([len(axis_range) for axis_range in ranges]) > len(self.cells):
+            return [index for cell, indexes in self.cells.items()
+                    if all(low <= axis <= high for axis, low, high in zip(cell, low_cell, high_cell))
+                    for index in indexes]
+        return [index for cell in product(*ranges) for index in self.cells.get(cell, [])]
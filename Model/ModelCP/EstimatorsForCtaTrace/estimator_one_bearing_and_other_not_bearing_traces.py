@@ -2,13 +2,13 @@ from math import sqrt
 
 import numpy as np
 from numpy import dot, ndarray
-from numpy.linalg import inv
 
 from EstimatorsForCtaTrace.abstract_estimator_cta_trace_data import AbstractEstimator
 from calc_covariance_matrix import calc_derivative_beta, calc_derivative_eps, calc_derivative_r
 from calc_covariance_matrix import sph2dec_cov_matrix, dec2sph_cov_matrix, calc_dec_derivative_matrix
 from coordinate_system_math import dec2sph
 from source_trace import SourceTrace
+from spd_matrix_math import right_divide_spd_3x3
 
 
 class EstimatorOneBearingAndOtherNotBearingTraces(AbstractEstimator):
@@ -104,10 +104,8 @@ class EstimatorOneBearingAndOtherNotBearingTraces(AbstractEstimator):
         cov_matrix = self.real_cov_matrix_anj + self.real_cov_matrix_trg - (self.real_cov_matrix_anj_trg + self.real_cov_matrix_trg_anj) / 2
         g_matrix_anj = self.real_cov_matrix_anj - (self.real_cov_matrix_trg_anj + self.real_cov_matrix_anj_trg) / 4
         g_matrix_trg = self.real_cov_matrix_trg - (self.real_cov_matrix_trg_anj + self.real_cov_matrix_anj_trg) / 4
-        # Матрица коэффициентов для цели первого МФР
-        self.coefficient_anj = g_matrix_trg @ inv(cov_matrix)
-        # Матрица коэффициентов для цели второго МФР
-        self.coefficient_trg = g_matrix_anj @ inv(cov_matrix)
+        # Матрицы коэффициентов для целей первого и второго МФР
+        self.coefficient_anj, self.coefficient_trg = right_divide_spd_3x3(cov_matrix, g_matrix_trg, g_matrix_anj)
 
     def calc_anj_cov_matrix(self) -> None:
         """Расчёт настоящей ковариационной матрицы АШП в декартовых координатах,
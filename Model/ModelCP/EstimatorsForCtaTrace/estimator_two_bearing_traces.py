@@ -2,13 +2,13 @@ from math import sqrt
 
 import numpy as np
 from numpy import dot, ndarray
-from numpy.linalg import inv
 
 from abstract_estimator_cta_trace_data import AbstractEstimator
 from calc_covariance_matrix import calc_derivative_eps, calc_derivative_beta, calc_dec_derivative_matrix
 from calc_covariance_matrix import sph2dec_cov_matrix, dec2sph_cov_matrix
 from coordinate_system_math import dec2sph
 from source_trace import SourceTrace
+from spd_matrix_math import right_divide_spd_3x3
 
 
 class EstimatorTwoBearingTraces(AbstractEstimator):
@@ -118,8 +118,9 @@ class EstimatorTwoBearingTraces(AbstractEstimator):
         # Общая ковариационная матрица (в знаменателе выражения для коэффициентов)
         den_matrix = self.real_covariance_matrix_1 + self.real_covariance_matrix_2 - 2 * sum_covariance_matrix
         # Матрицы коэффициентов
-        self.coefficient_1 = (self.real_covariance_matrix_2 - sum_covariance_matrix) @ inv(den_matrix)
-        self.coefficient_2 = (self.real_covariance_matrix_1 - sum_covariance_matrix) @ inv(den_matrix)
+        self.coefficient_1, self.coefficient_2 = right_divide_spd_3x3(
+            den_matrix, self.real_covariance_matrix_2 - sum_covariance_matrix,
+            self.real_covariance_matrix_1 - sum_covariance_matrix)
 
         coordinates = self.coefficient_1 @ self.nearest_point_first_bearing + \
                       self.coefficient_2 @ self.nearest_point_second_bearing
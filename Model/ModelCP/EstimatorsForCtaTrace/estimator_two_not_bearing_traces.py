@@ -1,9 +1,9 @@
 import numpy as np
 from numpy import ndarray
-from numpy.linalg import inv
 
 from abstract_estimator_cta_trace_data import AbstractEstimator
 from source_trace import SourceTrace
+from spd_matrix_math import right_divide_spd_3x3
 
 
 class EstimatorTwoNotBearingTraces(AbstractEstimator):
@@ -26,8 +26,9 @@ class EstimatorTwoNotBearingTraces(AbstractEstimator):
         summary_covariance_matrix = self.first_trace.coordinate_covariance_matrix + \
                                     self.second_trace.coordinate_covariance_matrix
 
-        self.matrix_a = self.second_trace.coordinate_covariance_matrix @ inv(summary_covariance_matrix)
-        self.matrix_b = self.first_trace.coordinate_covariance_matrix @ inv(summary_covariance_matrix)
+        self.matrix_a, self.matrix_b = right_divide_spd_3x3(summary_covariance_matrix,
+                                                            self.second_trace.coordinate_covariance_matrix,
+                                                            self.first_trace.coordinate_covariance_matrix)
 
         return self.matrix_a @ self.first_trace.coordinates + self.matrix_b @ self.second_trace.coordinates
 
@@ -0,0 +1,404 @@
+"""Модуль содержит оцениватели координат, скоростей и ковариационных матриц сразу для группы трасс ЕМТ
+с одинаковым видом оценивателя. Формулы те же, что и у оценивателей одной трассы ЕМТ,
+но все величины хранятся в массивах размера (N, ...), где N - число трасс ЕМТ в группе"""
+import numpy as np
+from numpy import ndarray
+
+from abstract_estimator_cta_trace_data import AbstractEstimator
+from calc_covariance_matrix import calc_dec_derivative_matrix_array, calc_sph_derivative_matrix_array
+from calc_covariance_matrix import transform_cov_matrix_array
+from coordinate_system_math import dec2sph_array
+from spd_matrix_math import right_divide_spd_3x3_array
+
+
+def bilinear_form_array(first_vectors: ndarray, matrices: ndarray, second_vectors: ndarray) -> ndarray:
+    """Расчёт билинейных форм u*K*v' для каждой тройки из массивов
+
+    :param first_vectors: Векторы u, массив размера (N, 3)
+    :type first_vectors: ndarray
+    :param matrices: Матрицы K, массив размера (N, 3, 3)
+    :type matrices: ndarray
+    :param second_vectors: Векторы v, массив размера (N, 3)
+    :type second_vectors: ndarray
+
+    :return: Значения билинейных форм, массив размера (N,)
+    :rtype: ndarray
+    """
+    return np.einsum("ni,nij,nj->n", first_vectors, matrices, second_vectors)
+
+
+def dot_array(first_vectors: ndarray, second_vectors: ndarray) -> ndarray:
+    """Расчёт скалярных произведений для каждой пары векторов
+
+    :param first_vectors: Первые векторы, массив размера (N, 3)
+    :type first_vectors: ndarray
+    :param second_vectors: Вторые векторы, массив размера (N, 3)
+    :type second_vectors: ndarray
+
+    :return: Скалярные произведения, массив размера (N,)
+    :rtype: ndarray
+    """
+    return np.einsum("ni,ni->n", first_vectors, second_vectors)
+
+
+def matrix_vector_array(matrices: ndarray, vectors: ndarray) -> ndarray:
+    """Произведение матрицы на вектор для каждой пары из массивов
+
+    :param matrices: Матрицы, массив размера (N, 3, 3)
+    :type matrices: ndarray
+    :param vectors: Векторы, массив размера (N, 3)
+    :type vectors: ndarray
+
+    :return: Произведения, массив размера (N, 3)
+    :rtype: ndarray
+    """
+    return np.einsum("nij,nj->ni", matrices, vectors)
+
+
+def transpose_array(matrices: ndarray) -> ndarray:
+    """Транспонирование каждой матрицы из массива
+
+    :param matrices: Матрицы, массив размера (N, 3, 3)
+    :type matrices: ndarray
+
+    :return: Транспонированные матрицы, массив размера (N, 3, 3)
+    :rtype: ndarray
+    """
+    return matrices.transpose(0, 2, 1)
+
+
+class EstimatorOnlyHeadSourceTraceArray(AbstractEstimator):
+    """Оцениватель для группы трасс ЕМТ без дополнительных источников"""
+
+    def __init__(self, head_traces: list) -> None:
+        """
+        :param head_traces: Трассы головных источников
+        :type head_traces: list
+        """
+        self._coordinates = np.array([trace.coordinates for trace in head_traces])
+        self._velocities = np.array([trace.velocities for trace in head_traces])
+        self._coordinates_covariance_matrix = np.array([trace.coordinate_covariance_matrix for trace in head_traces])
+
+    @property
+    def coordinates(self) -> ndarray:
+        """
+        :return: Векторы координат трасс головных источников, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        :return: Векторы скоростей трасс головных источников, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._velocities
+
+    @property
+    def coordinates_covariance_matrix(self) -> ndarray:
+        """
+        :return: Ковариационные матрицы координат трасс головных источников, массив размера (N, 3, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates_covariance_matrix
+
+
+class EstimatorTwoNotBearingTracesArray(AbstractEstimator):
+    """Оцениватель для группы трасс ЕМТ, у которых два источника и оба не под АШП"""
+
+    def __init__(self, first_traces: list, second_traces: list) -> None:
+        """
+        :param first_traces: Трассы головных источников
+        :type first_traces: list
+        :param second_traces: Трассы первых дополнительных источников
+        :type second_traces: list
+        """
+        first_covariance_matrices = np.array([trace.coordinate_covariance_matrix for trace in first_traces])
+        second_covariance_matrices = np.array([trace.coordinate_covariance_matrix for trace in second_traces])
+        first_coordinates = np.array([trace.coordinates for trace in first_traces])
+        second_coordinates = np.array([trace.coordinates for trace in second_traces])
+
+        matrices_a, matrices_b = right_divide_spd_3x3_array(first_covariance_matrices + second_covariance_matrices,
+                                                            second_covariance_matrices, first_covariance_matrices)
+
+        self._coordinates = matrix_vector_array(matrices_a, first_coordinates) + \
+            matrix_vector_array(matrices_b, second_coordinates)
+        # Пока оценка скоростей - скорость трассы головного источника
+        self._velocities = np.array([trace.velocities for trace in first_traces])
+        self._coordinates_covariance_matrix = transform_cov_matrix_array(matrices_a, first_covariance_matrices) + \
+            transform_cov_matrix_array(matrices_b, second_covariance_matrices)
+
+    @property
+    def coordinates(self) -> ndarray:
+        """
+        :return: Линейные оценки координат с минимальной дисперсией, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        :return: Скорости трасс головных источников, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._velocities
+
+    @property
+    def coordinates_covariance_matrix(self) -> ndarray:
+        """
+        :return: Ковариационные матрицы получившихся оценок, массив размера (N, 3, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates_covariance_matrix
+
+
+class EstimatorTwoBearingTracesArray(AbstractEstimator):
+    """Оцениватель триангуляционных точек для группы трасс ЕМТ, у которых оба источника - пеленги.
+    Обозначения как в EstimatorTwoBearingTraces"""
+
+    def __init__(self, first_traces: list, second_traces: list) -> None:
+        """
+        :param first_traces: Трассы первых пеленгов
+        :type first_traces: list
+        :param second_traces: Трассы вторых пеленгов
+        :type second_traces: list
+        """
+        cov_matrix_1 = np.array([trace.coordinate_covariance_matrix for trace in first_traces])
+        cov_matrix_2 = np.array([trace.coordinate_covariance_matrix for trace in second_traces])
+        mfr_position_1 = np.array([trace.mfr_position for trace in first_traces])
+        mfr_position_2 = np.array([trace.mfr_position for trace in second_traces])
+        # Векторы координат измерений в МЗСК МФР
+        mfr_anj_1 = np.array([trace.coordinates for trace in first_traces]) - mfr_position_1
+        mfr_anj_2 = np.array([trace.coordinates for trace in second_traces]) - mfr_position_2
+        # Векторы базы между МФР
+        base = mfr_position_1 - mfr_position_2
+
+        # Коэффициенты
+        a = dot_array(mfr_anj_1, mfr_anj_2)
+        b = dot_array(mfr_anj_2, mfr_anj_2)
+        c = dot_array(base, mfr_anj_2)
+        d = dot_array(mfr_anj_1, mfr_anj_1)
+        f = dot_array(base, mfr_anj_1)
+        # Числители коэффициентов t и s и их общий знаменатель
+        num_t = c * d - a * f
+        num_s = a * c - f * b
+        den_ts = b * d - a ** 2
+        square_den_ts = (den_ts ** 2)[:, np.newaxis]
+        # Столбцы для умножения на векторы производных
+        a_, b_, c_, d_, f_ = (value[:, np.newaxis] for value in (a, b, c, d, f))
+        num_t_, num_s_, den_ts_ = num_t[:, np.newaxis], num_s[:, np.newaxis], den_ts[:, np.newaxis]
+
+        # Производные коэффициентов по декартовым координатам первой и второй трасс
+        a_derivative_1, d_derivative_1, f_derivative_1 = mfr_anj_2, 2 * mfr_anj_1, base
+        a_derivative_2, b_derivative_2, c_derivative_2 = mfr_anj_1, 2 * mfr_anj_2, base
+        den_ts_derivative_1 = b_ * d_derivative_1 - 2 * a_ * a_derivative_1
+        den_ts_derivative_2 = d_ * b_derivative_2 - 2 * a_ * a_derivative_2
+        # Производные t и s по соответсвующим координатам
+        num_t_derivative_1 = c_ * d_derivative_1 - f_ * a_derivative_1 - a_ * f_derivative_1
+        t_derivative_1 = (num_t_derivative_1 * den_ts_ - den_ts_derivative_1 * num_t_) / square_den_ts
+        num_t_derivative_2 = d_ * c_derivative_2 - f_ * a_derivative_2
+        t_derivative_2 = (num_t_derivative_2 * den_ts_ - den_ts_derivative_2 * num_t_) / square_den_ts
+        num_s_derivative_1 = a_derivative_1 * c_ - f_derivative_1 * b_
+        s_derivative_1 = (num_s_derivative_1 * den_ts_ - den_ts_derivative_1 * num_s_) / square_den_ts
+        num_s_derivative_2 = c_derivative_2 * a_ + a_derivative_2 * c_ - b_derivative_2 * f_
+        s_derivative_2 = (num_s_derivative_2 * den_ts_ - den_ts_derivative_2 * num_s_) / square_den_ts
+
+        # Дисперсии коэффициентов s и t и их ковариация
+        variance_s = bilinear_form_array(s_derivative_1, cov_matrix_1, s_derivative_1) + \
+            bilinear_form_array(s_derivative_2, cov_matrix_2, s_derivative_2)
+        variance_t = bilinear_form_array(t_derivative_1, cov_matrix_1, t_derivative_1) + \
+            bilinear_form_array(t_derivative_2, cov_matrix_2, t_derivative_2)
+        covariance_st = bilinear_form_array(s_derivative_1, cov_matrix_1, t_derivative_1) + \
+            bilinear_form_array(s_derivative_2, cov_matrix_2, t_derivative_2)
+
+        # Матрицы производных сферических координат (строки: дальность, азимут, угол места)
+        sph_derivative_matrix_1 = calc_sph_derivative_matrix_array(mfr_anj_1)
+        sph_derivative_matrix_2 = calc_sph_derivative_matrix_array(mfr_anj_2)
+        beta_derivative_1, eps_derivative_1 = sph_derivative_matrix_1[:, 1], sph_derivative_matrix_1[:, 2]
+        beta_derivative_2, eps_derivative_2 = sph_derivative_matrix_2[:, 1], sph_derivative_matrix_2[:, 2]
+
+        # Ближайшие точки на пеленгах
+        nearest_point_first_bearing = mfr_position_1 + (num_s / den_ts)[:, np.newaxis] * mfr_anj_1
+        nearest_point_second_bearing = mfr_position_2 + (num_t / den_ts)[:, np.newaxis] * mfr_anj_2
+        # Матрицы производных декартовых координат ближайших точек по сферическим
+        derivative_matrix_1 = calc_dec_derivative_matrix_array(dec2sph_array(nearest_point_first_bearing -
+                                                                             mfr_position_1))
+        derivative_matrix_2 = calc_dec_derivative_matrix_array(dec2sph_array(nearest_point_second_bearing -
+                                                                             mfr_position_2))
+
+        # Реальные ковариационные матрицы ближайших точек на пеленгах
+        sph_covariance_matrix_1 = transform_cov_matrix_array(sph_derivative_matrix_1, cov_matrix_1)
+        sph_covariance_matrix_1[:, 0, 0] = d * variance_s
+        sph_covariance_matrix_1[:, 0, 1] = sph_covariance_matrix_1[:, 1, 0] = \
+            np.sqrt(d) * bilinear_form_array(s_derivative_1, cov_matrix_1, beta_derivative_1)
+        sph_covariance_matrix_1[:, 0, 2] = sph_covariance_matrix_1[:, 2, 0] = \
+            np.sqrt(d) * bilinear_form_array(s_derivative_1, cov_matrix_1, eps_derivative_1)
+        real_covariance_matrix_1 = transform_cov_matrix_array(derivative_matrix_1, sph_covariance_matrix_1)
+
+        sph_covariance_matrix_2 = transform_cov_matrix_array(sph_derivative_matrix_2, cov_matrix_2)
+        sph_covariance_matrix_2[:, 0, 0] = b * variance_t
+        sph_covariance_matrix_2[:, 0, 1] = sph_covariance_matrix_2[:, 1, 0] = \
+            np.sqrt(b) * bilinear_form_array(t_derivative_2, cov_matrix_2, beta_derivative_2)
+        sph_covariance_matrix_2[:, 0, 2] = sph_covariance_matrix_2[:, 2, 0] = \
+            np.sqrt(b) * bilinear_form_array(t_derivative_2, cov_matrix_2, eps_derivative_2)
+        real_covariance_matrix_2 = transform_cov_matrix_array(derivative_matrix_2, sph_covariance_matrix_2)
+
+        # Матрицы ковариаций между ближайшими точками от первой и второй трассы
+        sph_covariance_matrix_12 = np.zeros((len(first_traces), 3, 3))
+        sph_covariance_matrix_12[:, 0, 0] = np.sqrt(b * d) * covariance_st
+        sph_covariance_matrix_12[:, 0, 1] = np.sqrt(d) * bilinear_form_array(s_derivative_2, cov_matrix_2,
+                                                                             beta_derivative_2)
+        sph_covariance_matrix_12[:, 0, 2] = np.sqrt(d) * bilinear_form_array(s_derivative_2, cov_matrix_2,
+                                                                             eps_derivative_2)
+        sph_covariance_matrix_12[:, 1, 0] = np.sqrt(b) * bilinear_form_array(t_derivative_1, cov_matrix_1,
+                                                                             beta_derivative_1)
+        sph_covariance_matrix_12[:, 2, 0] = np.sqrt(b) * bilinear_form_array(t_derivative_1, cov_matrix_1,
+                                                                             eps_derivative_1)
+        covariance_matrix_12 = derivative_matrix_1 @ sph_covariance_matrix_12 @ transpose_array(derivative_matrix_2)
+        covariance_matrix_21 = transpose_array(covariance_matrix_12)
+
+        # Матрицы коэффициентов
+        sum_covariance_matrix = (covariance_matrix_12 + covariance_matrix_21) / 4
+        coefficient_1, coefficient_2 = right_divide_spd_3x3_array(
+            real_covariance_matrix_1 + real_covariance_matrix_2 - 2 * sum_covariance_matrix,
+            real_covariance_matrix_2 - sum_covariance_matrix, real_covariance_matrix_1 - sum_covariance_matrix)
+
+        self._coordinates = matrix_vector_array(coefficient_1, nearest_point_first_bearing) + \
+            matrix_vector_array(coefficient_2, nearest_point_second_bearing)
+        # По одному единичному измерению нельзя определить скорость
+        self._velocities = np.zeros((len(first_traces), 3))
+        self._coordinates_covariance_matrix = transform_cov_matrix_array(coefficient_1, real_covariance_matrix_1) + \
+            transform_cov_matrix_array(coefficient_2, real_covariance_matrix_2) + \
+            coefficient_1 @ covariance_matrix_12 @ transpose_array(coefficient_2) + \
+            coefficient_2 @ covariance_matrix_21 @ transpose_array(coefficient_1)
+
+    @property
+    def coordinates(self) -> ndarray:
+        """
+        :return: Координаты триангуляционных точек, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        :return: Нулевые скорости триангуляционных точек, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._velocities
+
+    @property
+    def coordinates_covariance_matrix(self) -> ndarray:
+        """
+        :return: Ковариационные матрицы координат триангуляционных точек, массив размера (N, 3, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates_covariance_matrix
+
+
+class EstimatorOneBearingAndOtherNotBearingTracesArray(AbstractEstimator):
+    """Оцениватель общих точек для группы трасс ЕМТ, у которых один источник - пеленг, а другой - чистая цель.
+    Обозначения как в EstimatorOneBearingAndOtherNotBearingTraces"""
+
+    def __init__(self, first_traces: list, second_traces: list) -> None:
+        """
+        :param first_traces: Трассы головных источников
+        :type first_traces: list
+        :param second_traces: Трассы первых дополнительных источников
+        :type second_traces: list
+        """
+        # Разделяем трассы пеленгов и трассы чистых целей
+        jammer_traces = [first if first.is_bearing else second for first, second in zip(first_traces, second_traces)]
+        target_traces = [second if first.is_bearing else first for first, second in zip(first_traces, second_traces)]
+        anj_cov_matrix = np.array([trace.coordinate_covariance_matrix for trace in jammer_traces])
+        trg_cov_matrix = np.array([trace.coordinate_covariance_matrix for trace in target_traces])
+        anj_coordinates = np.array([trace.coordinates for trace in jammer_traces])
+        trg_coordinates = np.array([trace.coordinates for trace in target_traces])
+        mfr_position = np.array([trace.mfr_position for trace in jammer_traces])
+
+        # Вспомогательные векторы
+        mfr_anj = anj_coordinates - mfr_position
+        trg_anj = anj_coordinates - trg_coordinates
+        mfr_anj_mult = dot_array(mfr_anj, mfr_anj)
+        mfr_anj_dot_trg_anj = dot_array(mfr_anj, trg_anj)
+        mfr_anj_mult_ = mfr_anj_mult[:, np.newaxis]
+        # Предсказанные координаты пеленга
+        est_coordinates_anj = (-mfr_anj_dot_trg_anj / mfr_anj_mult)[:, np.newaxis] * mfr_anj + anj_coordinates
+
+        # Производные коэфициента по координатам трасс АЦ и АШП
+        coeff_derivative_trg = mfr_anj / mfr_anj_mult_
+        coeff_derivative_anj = (-(trg_anj + mfr_anj) * mfr_anj_mult_ +
+                                2 * mfr_anj * mfr_anj_dot_trg_anj[:, np.newaxis]) / mfr_anj_mult_ ** 2
+        # Производные сферических координат по координатам трассы АШП в СК МФР АШП
+        anj_sph_derivative_matrix = calc_sph_derivative_matrix_array(mfr_anj)
+
+        # Матрица ошибок метода в сферических координатах
+        method_cov_matrix_sph = np.zeros((len(first_traces), 3, 3))
+        method_cov_matrix_sph[:, 0, 0] = mfr_anj_mult * (
+                bilinear_form_array(coeff_derivative_anj, anj_cov_matrix, coeff_derivative_anj) +
+                bilinear_form_array(coeff_derivative_trg, trg_cov_matrix, coeff_derivative_trg))
+        method_cov_matrix_sph[:, 0, 1] = method_cov_matrix_sph[:, 1, 0] = np.sqrt(mfr_anj_mult) * \
+            bilinear_form_array(coeff_derivative_anj, anj_cov_matrix, anj_sph_derivative_matrix[:, 1])
+        method_cov_matrix_sph[:, 0, 2] = method_cov_matrix_sph[:, 2, 0] = np.sqrt(mfr_anj_mult) * \
+            bilinear_form_array(coeff_derivative_anj, anj_cov_matrix, anj_sph_derivative_matrix[:, 2])
+        # Матрица ошибок измерений в сферических координатах (как и у одной трассы - по координатам без сдвига)
+        measure_cov_matrix_sph = transform_cov_matrix_array(calc_sph_derivative_matrix_array(anj_coordinates),
+                                                            anj_cov_matrix)
+        # Необходимое обнуление элементов, связанных с дальностью
+        measure_cov_matrix_sph[:, 0, :] = measure_cov_matrix_sph[:, :, 0] = 0.
+        # Ковариационная матрица координат АШП в декартовых координатах
+        derivative_matrix_anj = calc_dec_derivative_matrix_array(dec2sph_array(est_coordinates_anj - mfr_position))
+        real_cov_matrix_anj = transform_cov_matrix_array(derivative_matrix_anj,
+                                                         measure_cov_matrix_sph + method_cov_matrix_sph)
+
+        # Матрица ковариаций между координатами точек постановщика АШП и чистой цели
+        trg_coords = trg_coordinates - mfr_position
+        trg_sph_derivative_matrix = calc_sph_derivative_matrix_array(trg_coords)
+        cov_matrix_anj_trg = np.zeros((len(first_traces), 3, 3))
+        cov_matrix_anj_trg[:, 0] = np.sqrt(mfr_anj_mult)[:, np.newaxis] * \
+            np.einsum("ni,nij,nkj->nk", coeff_derivative_trg, trg_cov_matrix, trg_sph_derivative_matrix)
+        derivative_matrix_trg = calc_dec_derivative_matrix_array(dec2sph_array(trg_coords))
+        real_cov_matrix_anj_trg = derivative_matrix_anj @ cov_matrix_anj_trg @ transpose_array(derivative_matrix_trg)
+        real_cov_matrix_trg_anj = transpose_array(real_cov_matrix_anj_trg)
+
+        # Матрицы коэффициентов
+        sum_cov_matrix = real_cov_matrix_anj_trg + real_cov_matrix_trg_anj
+        coefficient_anj, coefficient_trg = right_divide_spd_3x3_array(
+            real_cov_matrix_anj + trg_cov_matrix - sum_cov_matrix / 2,
+            trg_cov_matrix - sum_cov_matrix / 4, real_cov_matrix_anj - sum_cov_matrix / 4)
+
+        self._coordinates = matrix_vector_array(coefficient_anj, est_coordinates_anj) + \
+            matrix_vector_array(coefficient_trg, trg_coordinates)
+        # Скорость от пеленга не сильно поможет, поэтому скорость трассы чистой цели
+        self._velocities = np.array([trace.velocities for trace in target_traces])
+        cross_cov_matrix = coefficient_anj @ real_cov_matrix_anj_trg @ transpose_array(coefficient_trg)
+        self._coordinates_covariance_matrix = transform_cov_matrix_array(coefficient_anj, real_cov_matrix_anj) + \
+            transform_cov_matrix_array(coefficient_trg, trg_cov_matrix) + \
+            cross_cov_matrix + transpose_array(cross_cov_matrix)
+
+    @property
+    def coordinates(self) -> ndarray:
+        """
+        :return: Координаты общих точек для пеленга и чистой цели, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        :return: Скорости трасс чистых целей, массив размера (N, 3)
+        :rtype: ndarray
+        """
+        return self._velocities
+
+    @property
+    def coordinates_covariance_matrix(self) -> ndarray:
+        """
+        :return: Ковариационные матрицы координат общих точек, массив размера (N, 3, 3)
+        :rtype: ndarray
+        """
+        return self._coordinates_covariance_matrix
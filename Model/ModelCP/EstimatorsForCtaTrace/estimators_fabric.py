@@ -2,11 +2,19 @@ from estimator_one_bearing_and_other_not_bearing_traces import EstimatorOneBeari
 from estimator_only_head_source_trace import EstimatorOnlyHeadSourceTrace
 from estimator_two_bearing_traces import EstimatorTwoBearingTraces
 from estimator_two_not_bearing_traces import EstimatorTwoNotBearingTraces
+from estimators_array import EstimatorOneBearingAndOtherNotBearingTracesArray, EstimatorOnlyHeadSourceTraceArray
+from estimators_array import EstimatorTwoBearingTracesArray, EstimatorTwoNotBearingTracesArray
 from source_trace import SourceTrace
 
 
 class EstimatorsFabric:
     """ Фабрика для оценивателей координат, скоростей и ковариационной матрицы трассы ЕМТ"""
+    # Оцениватели сразу для группы трасс ЕМТ с одинаковым видом оценивателя
+    array_estimators = {EstimatorOnlyHeadSourceTrace: EstimatorOnlyHeadSourceTraceArray,
+                        EstimatorTwoBearingTraces: EstimatorTwoBearingTracesArray,
+                        EstimatorTwoNotBearingTraces: EstimatorTwoNotBearingTracesArray,
+                        EstimatorOneBearingAndOtherNotBearingTraces: EstimatorOneBearingAndOtherNotBearingTracesArray}
+
     @classmethod
     def generate(cls, source_trace_list: list):
         """Метод для генерации оценивателя
@@ -16,18 +24,42 @@ class EstimatorsFabric:
 
         :return: Оцениватель координат, скоростей и ковариационной матрицы
         """
+        # Оценивателю нужны трасса головного источника и первая дополнительная трасса, если она есть
+        return cls.get_estimator_class(source_trace_list)(*source_trace_list[:2])
+
+    @classmethod
+    def generate_array(cls, estimator_class: type, source_trace_lists: list):
+        """Метод для генерации оценивателя сразу для группы трасс ЕМТ с одинаковым видом оценивателя
+
+        :param estimator_class: Вид оценивателя одной трассы ЕМТ, общий для всей группы
+        :type estimator_class: type
+        :param source_trace_lists: Списки со всеми трассами источников по каждой трассе ЕМТ группы
+        :type source_trace_lists: list
+
+        :return: Оцениватель координат, скоростей и ковариационных матриц в виде массивов по группе
+        """
+        # Трассы головных источников и, если они есть, первые дополнительные трассы
+        return cls.array_estimators[estimator_class](*zip(*(source_traces[:2] for source_traces in source_trace_lists)))
+
+    @staticmethod
+    def get_estimator_class(source_trace_list: list) -> type:
+        """Выбор вида оценивателя
+
+        :param source_trace_list: Список со всеми трассами источника по трассе ЕМТ
+        :type source_trace_list: list
+
+        :return: Класс оценивателя
+        :rtype: type
+        """
         head_trace, *other_traces = source_trace_list
         head_trace: SourceTrace
         # Если дополнительных трасс нет
         if not other_traces:
-            estimator = EstimatorOnlyHeadSourceTrace(head_trace)
-        else:
-            add_trace: SourceTrace = other_traces[0]
-            # Выбор оценивателя исходя из признака пеленга у каждой трассы
-            if head_trace.is_bearing and add_trace.is_bearing:
-                estimator = EstimatorTwoBearingTraces(head_trace, add_trace)
-            elif not head_trace.is_bearing and not add_trace.is_bearing:
-                estimator = EstimatorTwoNotBearingTraces(head_trace, add_trace)
-            else:
-                estimator = EstimatorOneBearingAndOtherNotBearingTraces(head_trace, add_trace)
-        return estimator
+            return EstimatorOnlyHeadSourceTrace
+        add_trace: SourceTrace = other_traces[0]
+        # Выбор оценивателя исходя из признака пеленга у каждой трассы
+        if head_trace.is_bearing and add_trace.is_bearing:
+            return EstimatorTwoBearingTraces
+        if not head_trace.is_bearing and not add_trace.is_bearing:
+            return EstimatorTwoNotBearingTraces
+        return EstimatorOneBearingAndOtherNotBearingTraces
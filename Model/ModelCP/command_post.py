@@ -1,6 +1,7 @@
 from common_trace_array import CommonTraceArray
 from cta_trace import CTATrace
 from multi_functional_radar import MultiFunctionalRadar
+from registration_buffer import CP_REGISTRATION_DTYPE, RegistrationBuffer
 from residuals_estimator import ResidualsEstimator
 from source_trace_list import SourceTraceList
 
@@ -14,7 +15,8 @@ class CommandPost:
                  "adjustment_dict",
                  "source_trace_list",
                  "common_trace_array",
-                 "registration")
+                 "registration",
+                 "profiler")
 
     def __init__(self, mfr_list: list) -> None:
         # Время начала работы ПБУ
@@ -31,8 +33,10 @@ class CommandPost:
         self.source_trace_list = SourceTraceList([], self.adjustment_dict)
         # Единый массив трасс
         self.common_trace_array = CommonTraceArray([])
-        # Массив информации о каждой трассе этого ПБУ
-        self.registration = []
+        # Буфер информации о каждой трассе этого ПБУ
+        self.registration = RegistrationBuffer(CP_REGISTRATION_DTYPE)
+        # Профилировщик этапов работы (StageProfiler), по умолчанию профилирование выключено
+        self.profiler = None
 
     def __repr__(self) -> str:
         return f"ПБУ. В подчинении {len(self.mfr_list)!r} МФР." \
@@ -66,7 +70,7 @@ class CommandPost:
         # Признак разрешения работы ПБУ (время неотрицательно, темп работы при этом 1 секунда)
         can_operate = not self.tick % self.tick_period and self.tick >= 0
         # Если можно, то ПБУ работает
-        if can_operate:
+        if can_operate and self.profiler is None:
             # Формирование массива трасс источников
             self.formation_source_trace_list()
             # Оценка поправок от юстировки
@@ -75,6 +79,25 @@ class CommandPost:
             self.formation_common_trace_array()
             # Регистрация работы ПБУ
             self.register()
+        elif can_operate:
+            # Те же этапы с измерением времени, размер формируемых массивов берётся после этапа
+            self.profiler.run("cp.formation_source_trace_list", self.formation_source_trace_list,
+                              size=lambda: len(self.source_trace_list))
+            self.profiler.run("cp.analyze_adjustment", self.analyze_adjustment, size=len(self.adjustment_dict))
+            self.profiler.run("cp.formation_common_trace_array", self.formation_common_trace_array,
+                              size=lambda: len(self.common_trace_array))
+            self.profiler.run("cp.register", self.register, size=len(self.common_trace_array))
+
+    def set_profiler(self, profiler) -> None:
+        """Включение (или выключение, если None) профилирования этапов ПБУ и ЕМТ
+
+        :param profiler: Профилировщик этапов
+        :type profiler: StageProfiler
+
+        :return: None
+        """
+        self.profiler = profiler
+        self.common_trace_array.profiler = profiler
 
     def formation_source_trace_list(self) -> None:
         """Формирование массива трасс источников
@@ -116,5 +139,5 @@ class CommandPost:
         for cta_trace in self.common_trace_array:
             cta_trace: CTATrace
             # Хотим регистрировать следующее: текущее время и данные трассы ЕМТ
-            registration_row = [self.tick, *cta_trace.registration]
+            registration_row = (self.tick, *cta_trace.registration)
             self.registration.append(registration_row)
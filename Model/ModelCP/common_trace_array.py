@@ -1,17 +1,58 @@
+from heapq import heappop, heappush
+
 from cta_trace import CTATrace
+from estimators_fabric import EstimatorsFabric
+from identification_engine import IdentificationEngine
 from source_trace import SourceTrace
 from source_trace_list import SourceTraceList
 
 
-class CommonTraceArray(list):
-    """Класс, описывающий работу ЕМТ, наследуется от обычного списка"""
+class CommonTraceArray:
+    """Класс, описывающий работу ЕМТ. Трассы ЕМТ хранятся в словаре по номерам,
+    поэтому удаление не требует поиска, а порядок трасс - порядок их добавления"""
+    __slots__ = ("free_numbers",
+                 "next_number",
+                 "cta_trace_dict",
+                 "profiler")
+
     def __init__(self, initial_list: list) -> None:
         """Инициализация обычным списком
 
         :param initial_list: Список ЕМТ трасс
         :type initial_list: list
         """
-        super().__init__(initial_list)
+        # Свободные номера трасс ЕМТ (освобождаются при удалении трасс, выдаются начиная с наименьшего)
+        self.free_numbers = []
+        # Следующий ещё не выданный номер
+        self.next_number = 0
+        # Словарь: номер трассы ЕМТ - трасса ЕМТ, в порядке добавления трасс
+        self.cta_trace_dict = {}
+        # Профилировщик этапов формирования ЕМТ (StageProfiler), по умолчанию профилирование выключено
+        self.profiler = None
+        for cta_trace in initial_list:
+            cta_trace.number = self.allocate_number()
+            self.cta_trace_dict[cta_trace.number] = cta_trace
+
+    def __repr__(self) -> str:
+        return f"ЕМТ из {len(self)!r} трасс. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def __len__(self) -> int:
+        return len(self.cta_trace_dict)
+
+    def __iter__(self):
+        return iter(self.cta_trace_dict.values())
+
+    def __getitem__(self, index: [int, slice]) -> [CTATrace, list]:
+        """Трасса ЕМТ по порядковому номеру (за линейное время, для разового доступа)
+
+        :param index: Порядковый номер трассы ЕМТ или срез
+        :type index: int или slice
+
+        :return: Трасса ЕМТ или список трасс ЕМТ
+        :rtype: CTATrace или list
+        """
+        return list(self.cta_trace_dict.values())[index]
 
     def formation(self, source_trace_list: SourceTraceList) -> None:
         """Формирование единого массива трасс
@@ -21,14 +62,23 @@ class CommonTraceArray(list):
 
         :return: None
         """
-        # Отождествление трасс источников
-        self.identification(source_trace_list)
-        # Сортировка источников в трассах ЕМТ
-        self.sort_sources_in_cta_traces()
-        # Исключение дублирующихся трасс
-        self.replicate_trace_excluding()
-        # Формирование оценок в трассах ЕМТ
-        self.calculate_data_in_cta_traces()
+        if self.profiler is None:
+            # Отождествление трасс источников
+            self.identification(source_trace_list)
+            # Сортировка источников в трассах ЕМТ
+            self.sort_sources_in_cta_traces()
+            # Исключение дублирующихся трасс
+            self.replicate_trace_excluding()
+            # Формирование оценок в трассах ЕМТ
+            self.calculate_data_in_cta_traces()
+        else:
+            # Те же этапы с измерением времени, размер отождествления - число сравниваемых пар новых трасс и трасс ЕМТ
+            new_source_trace_count = sum(not trace.is_in_common_trace_array for trace in source_trace_list)
+            self.profiler.run("cta.identification", self.identification, source_trace_list,
+                              size=new_source_trace_count * len(self))
+            self.profiler.run("cta.sort_sources_in_cta_traces", self.sort_sources_in_cta_traces, size=len(self))
+            self.profiler.run("cta.replicate_trace_excluding", self.replicate_trace_excluding, size=len(self))
+            self.profiler.run("cta.calculate_data_in_cta_traces", self.calculate_data_in_cta_traces, size=len(self))
 
     def identification(self, source_trace_list: SourceTraceList) -> None:
         """Отождествление трасс источников с трассами ЕМТ
@@ -38,35 +88,48 @@ class CommonTraceArray(list):
 
         :return: None
         """
+        # Расстояния между новыми трассами и трассами ЕМТ считаются сразу для всех пар
+        new_source_traces = [trace for trace in source_trace_list if not trace.is_in_common_trace_array]
+        identification_engine = IdentificationEngine(self, new_source_traces)
         # Проходимся по всем трассам в массиве источников трасс
         for source_trace in source_trace_list:
             source_trace: SourceTrace
             # Если трасса не присутствует в ЕМТ, то отождествляем её со всеми остальными трассами ЕМТ
             if not source_trace.is_in_common_trace_array:
-                self.identification_with_others_cta_traces_for_new_source_trace(source_trace)
+                self.identification_with_others_cta_traces_for_new_source_trace(source_trace, identification_engine)
             # Если трасса дополнительного источника, то отождествляем её с головным по той же трассе ЕМТ
             elif not source_trace.is_head_source:
-                self.identification_with_head_source_trace_for_additional_source_trace(source_trace)
+                self.identification_with_head_source_trace_for_additional_source_trace(source_trace,
+                                                                                       identification_engine)
 
-    def identification_with_others_cta_traces_for_new_source_trace(self, new_source_trace: SourceTrace) -> None:
+    def identification_with_others_cta_traces_for_new_source_trace(
+            self, new_source_trace: SourceTrace, identification_engine: IdentificationEngine = None) -> None:
         """Отождествление новой трассы источника с остальными трассами ЕМТ
 
         :param new_source_trace: Новая трасса источника
         :type new_source_trace: SourceTrace
+        :param identification_engine: Отождествление с заранее посчитанными расстояниями, если None - по одной паре
+        :type identification_engine: IdentificationEngine
 
         :return: None
         """
         # Очищаем вспомогательный словарь для хранения трасс ЕМТ, с которыми отождествились
         new_source_trace.clear_identified_number_cta_trace_dict()
-        for cta_trace in self:
-            cta_trace: CTATrace
-            # Если нужно отождествить, то отождествляем
-            if cta_trace.must_identify_with_source_trace(new_source_trace):
-                new_source_trace.identification_with_trace(cta_trace.head_source_trace)
+        if identification_engine is not None:
+            identification_engine.identify(new_source_trace, self)
+        else:
+            for cta_trace in self:
+                cta_trace: CTATrace
+                # Если нужно отождествить, то отождествляем
+                if cta_trace.must_identify_with_source_trace(new_source_trace):
+                    new_source_trace.identification_with_trace(cta_trace.head_source_trace)
         # Если трасса отождествилась хотя бы с одной трассой ЕМТ
         if new_source_trace.identified_number_cta_trace_dict:
             # Добавление в трассу ЕМТ дополнительного иоточника
             self.append_new_additional_source_trace_in_cta_trace(new_source_trace)
+            # Состав трассы ЕМТ изменился
+            if identification_engine is not None:
+                identification_engine.update_cta_mfr_mask(self.cta_trace_dict[new_source_trace.cta_number])
         # Если ни с какой трассой из ЕМТ не отождествилось, то добавляем трассу как новую трассу ЕМТ
         else:
             # Добавляем трассу в ЕМТ
@@ -83,28 +146,33 @@ class CommonTraceArray(list):
         # Индекс трассы ЕМТ с минимальным расстоянием
         index_min_range = new_additional_source_trace.num_cta_trace_with_min_distance
         # Трасса ЕМТ с минимальным расстоянием
-        min_distance_cta_trace = self[index_min_range]
+        min_distance_cta_trace = self.cta_trace_dict[index_min_range]
         # Добавление наиболее близкой трассы из всех отождествившихся в массив дополнительных трасс ЕМТ
         min_distance_cta_trace.add_new_source_trace(new_additional_source_trace)
 
-    def identification_with_head_source_trace_for_additional_source_trace(self,
-                                                                          additional_source_trace: SourceTrace) -> None:
+    def identification_with_head_source_trace_for_additional_source_trace(
+            self, additional_source_trace: SourceTrace, identification_engine: IdentificationEngine = None) -> None:
         """Отождествление трассы дополнительного источника с трассой головного источника по той же трассе ЕМТ
 
         :param additional_source_trace: Трасса дополнительного источника
         :type additional_source_trace: SourceTrace
+        :param identification_engine: Отождествление новых трасс в текущем цикле, если есть
+        :type identification_engine: IdentificationEngine
 
         :return: None
         """
         # Очищаем вспомогательный словарь для хранения трасс ЕМТ, с которыми отождествились
         additional_source_trace.clear_identified_number_cta_trace_dict()
         # Трасса ЕМТ, с которой работает эта трасса источника
-        cta_trace: CTATrace = self[additional_source_trace.cta_number]
+        cta_trace: CTATrace = self.cta_trace_dict[additional_source_trace.cta_number]
         additional_source_trace.identification_with_trace(cta_trace.head_source_trace)
         # Если если трасса дополнительного источника не отождествилась с трассой головного источника
         if not additional_source_trace.identified_number_cta_trace_dict:
             # Удаляем трассу этого источника из дополнительных
             cta_trace.del_additional_source_trace(additional_source_trace)
+            # Состав трассы ЕМТ изменился
+            if identification_engine is not None:
+                identification_engine.update_cta_mfr_mask(cta_trace)
             # Добавляем трассу в ЕМТ
             self.append(additional_source_trace)
 
@@ -122,9 +190,12 @@ class CommonTraceArray(list):
 
         :return: None
         """
-        # Цикл по всем трассам в ЕМТ
-        for cta_trace in self:
+        # Цикл по всем трассам в ЕМТ на начало исключения, так как трассы удаляются во время цикла
+        for cta_trace in list(self):
             cta_trace: CTATrace
+            # Уже удалённые трассы пропускаем
+            if self.cta_trace_dict.get(cta_trace.number) is not cta_trace:
+                continue
             self.identification_with_others_cta_traces_for_cta_trace(cta_trace)
 
     def identification_with_others_cta_traces_for_cta_trace(self, identifying_cta_trace: CTATrace) -> None:
@@ -160,7 +231,7 @@ class CommonTraceArray(list):
         :return: None
         """
         # Объединение в один лист всех трасс ЕМТ с указанными номерами
-        identified_traces = [self[number] for number in identified_traces_numbers]
+        identified_traces = [self.cta_trace_dict[number] for number in identified_traces_numbers]
         # Сортировка трасс ЕМТ
         sorted_identified_traces = self.get_sorted_traces(identified_traces)
         # Удаление всех менее точных трасс из ЕМТ
@@ -200,22 +271,35 @@ class CommonTraceArray(list):
             self.remove(cta_trace)
 
     def calculate_data_in_cta_traces(self) -> None:
-        """Вычисление данных в трассах ЕМТ (координаты и скорость, мб что-то ещё)
+        """Вычисление данных в трассах ЕМТ (координаты и скорость, мб что-то ещё).
+        Трассы ЕМТ группируются по виду оценивателя, и каждая группа оценивается сразу целиком
 
         :return: None
         """
+        # Словарь: класс оценивателя - трассы ЕМТ, которым он нужен
+        estimator_groups = {}
         for cta_trace in self:
-            cta_trace.calculate_self_data()
+            cta_trace: CTATrace
+            estimator_class = EstimatorsFabric.get_estimator_class(cta_trace.all_source_traces)
+            estimator_groups.setdefault(estimator_class, []).append(cta_trace)
 
-    def update_numbers_in_cta_traces(self) -> None:
-        """Обновление номеров трасс ЕМТ
-        Изменение номера трасс в ЕМТ и у всех трасс источников на индекс трассы ЕМТ
+        for estimator_class, cta_traces in estimator_groups.items():
+            estimator = EstimatorsFabric.generate_array(estimator_class,
+                                                        [cta_trace.all_source_traces for cta_trace in cta_traces])
+            for cta_trace, coordinates, velocities, coordinate_covariance_matrix in zip(
+                    cta_traces, estimator.coordinates, estimator.velocities, estimator.coordinates_covariance_matrix):
+                cta_trace.set_self_data(coordinates, velocities, coordinate_covariance_matrix)
 
-        :return: None
+    def allocate_number(self) -> int:
+        """Выдача номера для новой трассы ЕМТ: наименьший из освободившихся или следующий новый
+
+        :return: Номер трассы ЕМТ
+        :rtype: int
         """
-        for cta_trace in self:
-            cta_trace: CTATrace
-            cta_trace.change_numbers(self.index(cta_trace))
+        if self.free_numbers:
+            return heappop(self.free_numbers)
+        self.next_number += 1
+        return self.next_number - 1
 
     def append(self, trace: SourceTrace) -> None:
         """Добавление трассы в ЕМТ
@@ -227,15 +311,15 @@ class CommonTraceArray(list):
         """
         # Создаём новую трассу ЕМТ
         new_cta_trace = CTATrace(head_source_trace=trace)
-        # Добавляем в ЕМТ
-        super().append(new_cta_trace)
         # Даём новой трассе новый номер
-        new_cta_trace.number = self.index(new_cta_trace)
+        new_cta_trace.number = self.allocate_number()
+        # Добавляем в ЕМТ
+        self.cta_trace_dict[new_cta_trace.number] = new_cta_trace
         # Добавляем информацию и номер трассы ЕМТ в трассу источника
         trace.append_cta_info_and_number(num=new_cta_trace.number, is_head=True)
 
     def remove(self, cta_trace: CTATrace) -> None:
-        """Удаление трассы из ЕМТ
+        """Удаление трассы из ЕМТ, порядок остальных трасс не меняется
 
         :param cta_trace: Трасса ЕМТ, которую необходимо удалить
         :type cta_trace: CTATrace
@@ -244,7 +328,7 @@ class CommonTraceArray(list):
         """
         # Удаляем все признаки присутствия в ЕМТ у трасс источников
         cta_trace.delete_sources_traces()
-        # Удаляем трассу из ЕМТ
-        super().remove(cta_trace)
-        # Обновление номеров всех оставшихся трасс
-        self.update_numbers_in_cta_traces()
+        # Удаляем трассу из ЕМТ, номера остальных трасс не меняются
+        del self.cta_trace_dict[cta_trace.number]
+        # Номер удалённой трассы можно выдать снова
+        heappush(self.free_numbers, cta_trace.number)
@@ -1,7 +1,7 @@
 import numpy as np
+from numpy import ndarray
 
 from calc_covariance_matrix import elements_of_covariance_matrix
-from estimators_fabric import EstimatorsFabric
 from source_trace import SourceTrace
 
 
@@ -145,24 +145,18 @@ class CTATrace:
         self.head_source_trace = None
         self.additional_source_trace_array = []
 
-    def change_numbers(self, num: int) -> None:
-        """Изменение номера трассы ЕМТ и связанных номеров трасс источников
+    def set_self_data(self, coordinates: ndarray, velocities: ndarray, coordinate_covariance_matrix: ndarray) -> None:
+        """Запись итоговой оценки координат, скорости и ковариационной матрицы, посчитанной вне трассы ЕМТ
 
-        :param num: Номер трассы ЕМТ
-        :type num: int
+        :param coordinates: Координаты
+        :type coordinates: ndarray
+        :param velocities: Скорость
+        :type velocities: ndarray
+        :param coordinate_covariance_matrix: Ковариационная матрица координат
+        :type coordinate_covariance_matrix: ndarray
 
         :return: None
         """
-        self.number = num
-        for source_trace in self.all_source_traces:
-            source_trace.cta_number = self.number
-
-    def calculate_self_data(self) -> None:
-        """Получение итоговой оценки координат, скорости и ковариационной матрицы
-
-        :return: None
-        """
-        estimator = EstimatorsFabric.generate(self.all_source_traces)
-        self.coordinates = estimator.coordinates
-        self.velocities = estimator.velocities
-        self.coordinate_covariance_matrix = estimator.coordinates_covariance_matrix
+        self.coordinates = coordinates
+        self.velocities = velocities
+        self.coordinate_covariance_matrix = coordinate_covariance_matrix
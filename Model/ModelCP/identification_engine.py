@@ -0,0 +1,225 @@
+from itertools import islice
+
+import numpy as np
+from numpy import ndarray
+
+from source_trace import SourceTrace
+from uniform_grid import UniformGrid
+
+
+class IdentificationEngine:
+    """Класс, описывающий отождествление новых трасс источников с трассами ЕМТ за один цикл формирования ЕМТ.
+    При создании сразу считает матрицу обобщённых расстояний между новыми трассами чистых целей
+    и головными трассами ЕМТ, а также маску номеров МФР трасс ЕМТ. Пары с пеленгами и трассы ЕМТ,
+    появившиеся во время цикла, отождествляются по одной, как и раньше.
+    Заведомо далёкие пары отсекаются стробом: обобщённое расстояние не меньше квадрата длины отрезка между трассами,
+    делённого на сумму максимальных собственных чисел ковариационных матриц, поэтому отсечение не меняет результат"""
+    __slots__ = ("cta_count",
+                 "cta_traces",
+                 "cta_rows",
+                 "source_rows",
+                 "mfr_columns",
+                 "cta_mfr_mask",
+                 "is_target_head",
+                 "head_coordinates",
+                 "head_mfr_positions",
+                 "head_max_eigenvalues",
+                 "generalized_distances")
+
+    def __init__(self, cta_traces: list, new_source_traces: list) -> None:
+        """
+        :param cta_traces: Трассы ЕМТ на начало цикла отождествления
+        :type cta_traces: list
+        :param new_source_traces: Трассы источников, которых нет в ЕМТ
+        :type new_source_traces: list
+        """
+        # Число трасс ЕМТ, для которых посчитаны расстояния (во время цикла трассы ЕМТ только добавляются в конец)
+        self.cta_count = len(cta_traces)
+        # Трассы ЕМТ на начало цикла, порядок совпадает со строками матриц
+        self.cta_traces = list(cta_traces)
+        # Строки матриц для номеров трасс ЕМТ
+        self.cta_rows = {cta_trace.number: row for row, cta_trace in enumerate(cta_traces)}
+        # Трассы головных источников
+        head_source_traces = [cta_trace.head_source_trace for cta_trace in cta_traces]
+        # Новые трассы чистых целей
+        target_source_traces = [trace for trace in new_source_traces if not trace.is_bearing]
+        # Строки матрицы расстояний для новых трасс чистых целей
+        self.source_rows = {id(trace): row for row, trace in enumerate(target_source_traces)}
+        # Столбцы маски для номеров МФР
+        mfr_numbers = {trace.mfr_number for trace in new_source_traces}
+        mfr_numbers.update(trace.mfr_number for cta_trace in cta_traces for trace in cta_trace.all_source_traces)
+        self.mfr_columns = {mfr_number: column for column, mfr_number in enumerate(sorted(mfr_numbers))}
+        # Маска номеров МФР, от которых есть трассы источников в каждой трассе ЕМТ
+        self.cta_mfr_mask = np.zeros((self.cta_count, len(self.mfr_columns)), dtype=bool)
+        for cta_trace in cta_traces:
+            self.update_cta_mfr_mask(cta_trace)
+        # Признак того, что головная трасса ЕМТ - трасса чистой цели
+        self.is_target_head = np.array([not trace.is_bearing for trace in head_source_traces], dtype=bool)
+        # Координаты, точки стояния МФР и максимальные собственные числа ковариационных матриц головных трасс
+        self.head_coordinates = np.array([trace.coordinates for trace in head_source_traces]).reshape(-1, 3)
+        self.head_mfr_positions = np.array([trace.mfr_position for trace in head_source_traces]).reshape(-1, 3)
+        self.head_max_eigenvalues = self.calc_max_eigenvalues(head_source_traces)
+        # Обобщённые расстояния между новыми трассами чистых целей и головными трассами ЕМТ
+        self.generalized_distances = self.calc_generalized_distances(target_source_traces, head_source_traces)
+
+    def __repr__(self) -> str:
+        return f"Отождествление {len(self.source_rows)!r} новых трасс с {self.cta_count!r} трассами ЕМТ. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def calc_generalized_distances(self, source_traces: list, head_source_traces: list) -> ndarray:
+        """Расчёт матрицы обобщённых расстояний между трассами чистых целей,
+        для головных трасс по постановщикам АШП расстояние бесконечно
+
+        :param source_traces: Новые трассы чистых целей
+        :type source_traces: list
+        :param head_source_traces: Трассы головных источников ЕМТ
+        :type head_source_traces: list
+
+        :return: Матрица обобщённых расстояний размера (число новых трасс, число трасс ЕМТ)
+        :rtype: ndarray
+        """
+        generalized_distances = np.full((len(source_traces), self.cta_count), np.inf)
+        head_indexes = np.flatnonzero(self.is_target_head)
+        if not source_traces or not len(head_indexes):
+            return generalized_distances
+        # Координаты и максимальные собственные числа ковариационных матриц новых трасс и головных трасс чистых целей
+        coordinates = np.array([trace.coordinates for trace in source_traces])
+        max_eigenvalues = self.calc_max_eigenvalues(source_traces)
+        head_coordinates = self.head_coordinates[head_indexes]
+        head_max_eigenvalues = self.head_max_eigenvalues[head_indexes]
+        # Сетка по головным трассам, ребро ячейки - наибольший возможный радиус строба
+        threshold = SourceTrace.identification_threshold_3d
+        uniform_grid = UniformGrid(head_coordinates, np.sqrt(threshold * (max_eigenvalues.max() +
+                                                                          head_max_eigenvalues.max())))
+        # Пары (новая трасса, головная трасса), прошедшие строб
+        rows, columns = [], []
+        for row, (point, max_eigenvalue) in enumerate(zip(coordinates, max_eigenvalues)):
+            candidates = np.array(uniform_grid.query(point, np.sqrt(threshold * (max_eigenvalue +
+                                                                                 head_max_eigenvalues.max()))),
+                                  dtype=int)
+            # Строб для каждой пары
+            squared_ranges = np.sum((head_coordinates[candidates] - point) ** 2, axis=1)
+            in_gate = squared_ranges <= threshold * (max_eigenvalue + head_max_eigenvalues[candidates])
+            rows.extend([row] * np.count_nonzero(in_gate))
+            columns.extend(candidates[in_gate].tolist())
+        if not rows:
+            return generalized_distances
+        rows, columns = np.array(rows), np.array(columns)
+        # Отрезки между целями трасс и итоговые матрицы ошибок для пар в стробе
+        source_covariance_matrices = np.array([trace.coordinate_covariance_matrix for trace in source_traces])
+        head_covariance_matrices = np.array([head_source_traces[index].coordinate_covariance_matrix
+                                             for index in head_indexes])
+        ranges_between_traces = head_coordinates[columns] - coordinates[rows]
+        summary_covariance_matrices = head_covariance_matrices[columns] + source_covariance_matrices[rows]
+        generalized_distances[rows, head_indexes[columns]] = SourceTrace.calculate_generalized_distance_array(
+            summary_covariance_matrices, ranges_between_traces)
+        return generalized_distances
+
+    @staticmethod
+    def calc_max_eigenvalues(source_traces: list) -> ndarray:
+        """Расчёт максимальных собственных чисел ковариационных матриц координат трасс
+
+        :param source_traces: Трассы источников
+        :type source_traces: list
+
+        :return: Массив максимальных собственных чисел
+        :rtype: ndarray
+        """
+        if not source_traces:
+            return np.zeros(0)
+        covariance_matrices = np.array([trace.coordinate_covariance_matrix for trace in source_traces])
+        return np.linalg.eigvalsh(covariance_matrices)[:, -1]
+
+    @staticmethod
+    def is_in_bearing_gate(jammer_coordinates: ndarray, mfr_positions: ndarray, jammer_max_eigenvalues: ndarray,
+                           target_coordinates: ndarray, target_max_eigenvalues: ndarray) -> ndarray:
+        """Строб вдоль пеленга для пар постановщик АШП - чистая цель (аргументы согласованы по размерам):
+        точка на пеленге, ближайшая к цели, должна быть не дальше радиуса строба,
+        который растёт вдоль пеленга так же, как ковариационная матрица предполагаемого положения АШП
+
+        :param jammer_coordinates: Координаты трасс постановщиков АШП
+        :type jammer_coordinates: ndarray
+        :param mfr_positions: Точки стояния МФР, от которых получены пеленги
+        :type mfr_positions: ndarray
+        :param jammer_max_eigenvalues: Максимальные собственные числа ковариационных матриц пеленгов
+        :type jammer_max_eigenvalues: ndarray
+        :param target_coordinates: Координаты трасс чистых целей
+        :type target_coordinates: ndarray
+        :param target_max_eigenvalues: Максимальные собственные числа ковариационных матриц трасс целей
+        :type target_max_eigenvalues: ndarray
+
+        :return: Признаки попадания пар в строб
+        :rtype: ndarray
+        """
+        # Вспомогательные векторы (как в SourceTrace.calc_est_anj_coords_and_cov_matrix_for_jammer_and_target)
+        mfr_anj = jammer_coordinates - mfr_positions
+        trg_anj = jammer_coordinates - target_coordinates
+        squared_mfr_anj = np.sum(mfr_anj ** 2, axis=-1)
+        # Предполагаемое положение постановщика АШП на пеленге
+        coefficient_for_anj_range = - np.sum(mfr_anj * trg_anj, axis=-1) / squared_mfr_anj
+        est_anj_coordinates = coefficient_for_anj_range[..., np.newaxis] * mfr_anj + jammer_coordinates
+        # Коэффициент роста ковариационной матрицы вдоль пеленга
+        coefficient_for_anj_cov_matrix = np.sum((est_anj_coordinates - mfr_positions) ** 2, axis=-1) / squared_mfr_anj
+        # Строб
+        squared_ranges = np.sum((est_anj_coordinates - target_coordinates) ** 2, axis=-1)
+        gate = coefficient_for_anj_cov_matrix * jammer_max_eigenvalues + target_max_eigenvalues
+        return squared_ranges <= SourceTrace.identification_threshold_2d * gate
+
+    def update_cta_mfr_mask(self, cta_trace) -> None:
+        """Обновление маски номеров МФР для трассы ЕМТ после изменения её состава
+
+        :param cta_trace: Трасса ЕМТ
+        :type cta_trace: CTATrace
+
+        :return: None
+        """
+        row = self.cta_rows.get(cta_trace.number)
+        # Для трасс ЕМТ, появившихся во время цикла, маска не хранится
+        if row is None:
+            return
+        self.cta_mfr_mask[row] = False
+        for source_trace in cta_trace.all_source_traces:
+            self.cta_mfr_mask[row, self.mfr_columns[source_trace.mfr_number]] = True
+
+    def identify(self, new_source_trace: SourceTrace, cta_traces: list) -> None:
+        """Отождествление новой трассы источника со всеми трассами ЕМТ,
+        результат записывается в словарь отождествившихся трасс ЕМТ трассы источника
+
+        :param new_source_trace: Новая трасса источника
+        :type new_source_trace: SourceTrace
+        :param cta_traces: Текущий массив трасс ЕМТ (новые трассы добавляются в конец)
+        :type cta_traces: CommonTraceArray
+
+        :return: None
+        """
+        # От одного МФР не отождествляем
+        column = self.mfr_columns.get(new_source_trace.mfr_number)
+        must_identify = np.ones(self.cta_count, dtype=bool) if column is None else ~self.cta_mfr_mask[:, column]
+        row = self.source_rows.get(id(new_source_trace))
+        if row is not None:
+            # Пары чистых целей отождествляются по заранее посчитанным расстояниям
+            generalized_distances = self.generalized_distances[row]
+            is_identified = must_identify & (generalized_distances <= SourceTrace.identification_threshold_3d)
+            for index in np.flatnonzero(is_identified):
+                new_source_trace.identified_number_cta_trace_dict[generalized_distances[index]] = \
+                    self.cta_traces[index].number
+            # Остальные пары - с пеленгами
+            must_identify &= ~self.is_target_head
+        # Пары пеленг - чистая цель сначала проверяются стробом вдоль пеленга
+        is_mixed_pair = self.is_target_head == new_source_trace.is_bearing
+        if must_identify[is_mixed_pair].any():
+            max_eigenvalue = self.calc_max_eigenvalues([new_source_trace])[0]
+            if new_source_trace.is_bearing:
+                in_gate = self.is_in_bearing_gate(new_source_trace.coordinates, new_source_trace.mfr_position,
+                                                  max_eigenvalue, self.head_coordinates, self.head_max_eigenvalues)
+            else:
+                in_gate = self.is_in_bearing_gate(self.head_coordinates, self.head_mfr_positions,
+                                                  self.head_max_eigenvalues, new_source_trace.coordinates,
+                                                  max_eigenvalue)
+            must_identify &= ~is_mixed_pair | in_gate
+        for index in np.flatnonzero(must_identify):
+            new_source_trace.identification_with_trace(self.cta_traces[index].head_source_trace)
+        # Трассы ЕМТ, появившиеся во время цикла отождествления
+        for cta_trace in islice(cta_traces, self.cta_count, None):
+            if cta_trace.must_identify_with_source_trace(new_source_trace):
+                new_source_trace.identification_with_trace(cta_trace.head_source_trace)
@@ -12,6 +12,12 @@ class SourceTraceList(list):
         if adjustment_dict is None:
             adjustment_dict = {}
         self.adjustment_dict = adjustment_dict
+        # Индекс трасс массива по id объектов (трассы источников сравниваются по идентичности)
+        self.trace_ids = {id(trace) for trace in initial_list}
+        # Трассы, добавленные при последнем формировании
+        self.added_traces = list(initial_list)
+        # Трассы, удалённые при последнем формировании
+        self.removed_traces = []
 
     def formation(self, init_list: list, tick: int) -> None:
         """Формирование массива трасс источников
@@ -23,15 +29,18 @@ class SourceTraceList(list):
 
         :return: None
         """
+        # Индекс трасс из нового списка
+        init_ids = {id(trace) for trace in init_list}
+
         # Удаление трасс, которых не осталось в списке трасс источников
-        for trace in self:
-            if trace not in init_list:
-                self.remove(trace)
+        self.removed_traces = [trace for trace in self if id(trace) not in init_ids]
+        if self.removed_traces:
+            self[:] = [trace for trace in self if id(trace) in init_ids]
 
         # Добавление трасс, которых не было на предудыщий тик работы
-        for trace in init_list:
-            if trace not in self:
-                self.append(trace)
+        self.added_traces = [trace for trace in init_list if id(trace) not in self.trace_ids]
+        self.extend(self.added_traces)
+        self.trace_ids = init_ids
 
         self.update(tick)
         self.adjustment(init_list)
@@ -12,7 +12,12 @@ class PositionAntennaData:
     """Класс, описывающий положение антенны, поддерживает пересчёт координат и ковариационных матриц"""
     __slots__ = ("height",
                  "mobile_part_data",
-                 "fixed_part_data")
+                 "fixed_part_data",
+                 "transform_matrix",
+                 "height_acs",
+                 "corrupted_inverse_transform_matrix",
+                 "corrupted_height_dec",
+                 "corrupted_covariance_transform_matrix")
 
     def __init__(self, errors: SurveillanceErrors = SurveillanceErrors(0, 0)) -> None:
         # Высота антенного полотна
@@ -21,6 +26,19 @@ class PositionAntennaData:
         self.mobile_part_data = MobilePartData(errors.Beta)
         # Данные по неподвижной части антенны
         self.fixed_part_data = FixedPartData(errors.Beta_north)
+        # Матрицы антенны не меняются, поэтому их произведения считаются один раз
+        # Матрица перехода от МЗСК к АСК
+        self.transform_matrix = self.fixed_part_data.transform_matrix @ self.mobile_part_data.transform_matrix
+        # Смещение антенного полотна в АСК
+        self.height_acs = self.fixed_part_data.transform_matrix @ np.array([0., self.height, 0.])
+        # Матрица перехода от АСК к МЗСК, определённая с ошибками
+        self.corrupted_inverse_transform_matrix = self.mobile_part_data.corrupted_transform_matrix.T @ \
+            self.fixed_part_data.corrupted_transform_matrix.T
+        # Смещение антенного полотна в МЗСК, определённое с ошибками
+        self.corrupted_height_dec = self.mobile_part_data.corrupted_transform_matrix.T @ np.array([0., self.height, 0.])
+        # Матрица пересчёта ковариационных матриц из АСК в МЗСК, определённая с ошибками
+        self.corrupted_covariance_transform_matrix = self.fixed_part_data.corrupted_transform_matrix.T @ \
+            self.mobile_part_data.corrupted_transform_matrix.T
 
     def dec2bcs(self, coordinates_dec: ndarray, velocities_dec: ndarray) -> tuple:
         """Расчёт координат и скоростей в БСК из МЗСК МФР
@@ -50,16 +68,29 @@ class PositionAntennaData:
         :return: Вектор координат, вектор скоростей в АСК
         :rtype: tuple
         """
-        # Обозначения для удобства записи
-        matrix_a = self.fixed_part_data.transform_matrix
-        matrix_b = self.mobile_part_data.transform_matrix
-        height = self.height
         # Переход к прямоугольным координатам в АСК
-        coordinate_acs = matrix_a @ (matrix_b @ coordinates_dec - np.array([0., height, 0.]))
+        coordinate_acs = self.transform_matrix @ coordinates_dec - self.height_acs
         # Скорость в АСК
-        velocity_acs = matrix_a @ matrix_b @ velocities_dec
+        velocity_acs = self.transform_matrix @ velocities_dec
         return coordinate_acs, velocity_acs
 
+    def dec2bcs_array(self, coordinates_dec: ndarray, velocities_dec: ndarray) -> tuple:
+        """Расчёт координат и скоростей в БСК из МЗСК МФР сразу для массива векторов
+
+        :param coordinates_dec: Массив координат в прямоугольной декартовой СК размера (N, 3)
+        :type coordinates_dec: ndarray
+        :param velocities_dec: Массив скоростей в прямоугольной декартовой СК размера (N, 3)
+        :type velocities_dec: ndarray
+
+        :return: Массив координат, массив скоростей в БСК размера (N, 3)
+        :rtype: tuple
+        """
+        # Переход к АСК от декартовых (векторы - строки массивов, поэтому умножаем на транспонированную матрицу)
+        coordinates_acs = coordinates_dec @ self.transform_matrix.T - self.height_acs
+        velocities_acs = velocities_dec @ self.transform_matrix.T
+        # Переход к БСК от АСК
+        return self.acs2bcs_array(coordinates_acs, velocities_acs)
+
     @staticmethod
     def acs2bcs(coordinates_acs: ndarray, velocities_acs: ndarray) -> tuple:
         """Расчёт координат из декартовой АСК к БСК
@@ -90,6 +121,32 @@ class PositionAntennaData:
         velocity_bcs = np.array([vr, v_phi_v, v_phi_n])
         return coordinate_bcs, velocity_bcs
 
+    @staticmethod
+    def acs2bcs_array(coordinates_acs: ndarray, velocities_acs: ndarray) -> tuple:
+        """Расчёт координат из декартовой АСК к БСК сразу для массива векторов
+
+        :param coordinates_acs: Массив координат в АСК размера (N, 3)
+        :type coordinates_acs: ndarray
+        :param velocities_acs: Массив скоростей в АСК размера (N, 3)
+        :type velocities_acs: ndarray
+
+        :return: Массив координат, массив скоростей в БСК размера (N, 3)
+        :rtype: tuple
+        """
+        # Координаты в АСК
+        x, y, z = coordinates_acs.T
+        # Скорости в АСК
+        vx, vy, vz = velocities_acs.T
+        # Расчёт координат в БСК
+        r = np.sqrt(x ** 2 + y ** 2 + z ** 2)
+        phi_v = np.arcsin(y / r)
+        phi_n = np.arcsin(z / r)
+        # Расчёт скоростей в БСК
+        vr = (x * vx + y * vy + z * vz) / r
+        v_phi_v = (vy * r - y * vr) / (r * np.sqrt(r ** 2 - y ** 2))
+        v_phi_n = (vz * r - z * vr) / (r * np.sqrt(r ** 2 - z ** 2))
+        return np.column_stack((r, phi_v, phi_n)), np.column_stack((vr, v_phi_v, v_phi_n))
+
     def acs2dec(self, coordinates_acs: ndarray, velocities_acs: ndarray) -> tuple:
         """Функция для перехода от АСК к МЗСК
 
@@ -101,16 +158,28 @@ class PositionAntennaData:
         :return: Веткор координат, вектор скоростей в прямоугольной декартовой СК
         :rtype: tuple
         """
-        # Обозначения для удобства записи
-        matrix_a = self.fixed_part_data.corrupted_transform_matrix
-        matrix_b = self.mobile_part_data.corrupted_transform_matrix
-        height = self.height
         # Переход от АСК к МЗСК для координат
-        coordinate_dec = matrix_b.T @ (matrix_a.T @ coordinates_acs + np.array([0., height, 0.]))
+        coordinate_dec = self.corrupted_inverse_transform_matrix @ coordinates_acs + self.corrupted_height_dec
         # Переход от АСК к МЗСК для скоростей
-        velocity_dec = matrix_b.T @ (matrix_a.T @ velocities_acs)
+        velocity_dec = self.corrupted_inverse_transform_matrix @ velocities_acs
         return coordinate_dec, velocity_dec
 
+    def acs2dec_array(self, coordinates_acs: ndarray, velocities_acs: ndarray) -> tuple:
+        """Функция для перехода от АСК к МЗСК сразу для массива векторов
+
+        :param coordinates_acs: Массив координат в АСК размера (N, 3)
+        :type coordinates_acs: ndarray
+        :param velocities_acs: Массив скоростей в АСК размера (N, 3)
+        :type velocities_acs: ndarray
+
+        :return: Массив координат, массив скоростей в прямоугольной декартовой СК размера (N, 3)
+        :rtype: tuple
+        """
+        # Векторы - строки массивов, поэтому умножаем на транспонированную матрицу
+        coordinates_dec = coordinates_acs @ self.corrupted_inverse_transform_matrix.T + self.corrupted_height_dec
+        velocities_dec = velocities_acs @ self.corrupted_inverse_transform_matrix.T
+        return coordinates_dec, velocities_dec
+
     def bcs2dec(self, coordinates_bcs: ndarray, velocities_bcs: ndarray) -> tuple:
         """Функция для расчёта координат и скоростей в МЗСК из БСК
 
@@ -126,6 +195,20 @@ class PositionAntennaData:
         coordinates_dec, velocities_dec = self.acs2dec(coordinates_acs, velocities_acs)
         return coordinates_dec, velocities_dec
 
+    def bcs2dec_array(self, coordinates_bcs: ndarray, velocities_bcs: ndarray) -> tuple:
+        """Функция для расчёта координат и скоростей в МЗСК из БСК сразу для массива векторов
+
+        :param coordinates_bcs: Массив координат в БСК размера (N, 3)
+        :type coordinates_bcs: ndarray
+        :param velocities_bcs: Массив скоростей в БСК размера (N, 3)
+        :type velocities_bcs: ndarray
+
+        :return: Массив координат, массив скоростей в прямоугольной декартовой СК размера (N, 3)
+        :rtype: tuple
+        """
+        coordinates_acs, velocities_acs = self.bcs2acs_array(coordinates_bcs, velocities_bcs)
+        return self.acs2dec_array(coordinates_acs, velocities_acs)
+
     @staticmethod
     def bcs2acs(coordinates_bcs: ndarray, velocities_bcs: ndarray) -> tuple:
         """Функция для перехода от БСК к АСК
@@ -161,6 +244,36 @@ class PositionAntennaData:
         velocity_acs = np.array([vx_acs, vy_acs, vz_acs])
         return coordinate_acs, velocity_acs
 
+    @staticmethod
+    def bcs2acs_array(coordinates_bcs: ndarray, velocities_bcs: ndarray) -> tuple:
+        """Функция для перехода от БСК к АСК сразу для массива векторов
+
+        :param coordinates_bcs: Массив координат в БСК размера (N, 3)
+        :type coordinates_bcs: ndarray
+        :param velocities_bcs: Массив скоростей в БСК размера (N, 3)
+        :type velocities_bcs: ndarray
+
+        :return: Массив координат, массив скоростей в АСК размера (N, 3)
+        :rtype: tuple
+        """
+        # Введём обозначения координат и скоростей для упрощения записи
+        r, theta_v, theta_n = coordinates_bcs.T
+        vr, v_theta_v, v_theta_n = velocities_bcs.T
+        # Переменные для удобства записи
+        sin_n = np.sin(theta_n)
+        sin_v = np.sin(theta_v)
+        sin_2n = np.sin(2. * theta_n)
+        sin_2v = np.sin(2. * theta_v)
+        # Координаты в АСК
+        x_acs = r * np.sqrt(1 - sin_n ** 2 - sin_v ** 2)
+        y_acs = r * sin_v
+        z_acs = r * sin_n
+        # Скорость в АСК
+        vx_acs = (vr * x_acs / r) - (r ** 2 * (sin_2n * v_theta_n + sin_2v * v_theta_v)) / (2. * x_acs)
+        vy_acs = vr * sin_v + r * np.cos(theta_v) * v_theta_v
+        vz_acs = vr * sin_n + r * np.cos(theta_n) * v_theta_n
+        return np.column_stack((x_acs, y_acs, z_acs)), np.column_stack((vx_acs, vy_acs, vz_acs))
+
     def calc_dec_covariance_matrix_from_bcs(self, covariance_matrix_bcs: ndarray, coordinate_bcs: ndarray) -> ndarray:
         """Расчёт ковариационной матрицы в декартовых координатах МФР из БСК
 
@@ -217,10 +330,54 @@ class PositionAntennaData:
         :return: Ковариационная матрица в прямоугольной декартовой СК
         """
         # Обозначения для удобства записи
-        matrix_a = self.fixed_part_data.corrupted_transform_matrix
-        matrix_b = self.mobile_part_data.corrupted_transform_matrix
-        matrix_f = matrix_a.T @ matrix_b.T
+        matrix_f = self.corrupted_covariance_transform_matrix
 
         # Ковариационная матрица в декартовых координатах равна B'*A'*K_acs*A*B
         covariance_matrix_dec = matrix_f @ covariance_matrix_acs @ matrix_f.T
         return covariance_matrix_dec
+
+    def calc_dec_covariance_matrix_from_bcs_array(self, variances_bcs: ndarray, coordinates_bcs: ndarray) -> ndarray:
+        """Расчёт ковариационных матриц в декартовых координатах МФР по дисперсиям в БСК сразу для массива векторов
+        (ковариационные матрицы в БСК диагональные)
+
+        :param variances_bcs: Дисперсии координат в БСК, массив размера (N, 3)
+        :type variances_bcs: ndarray
+        :param coordinates_bcs: Координаты в БСК, массив размера (N, 3)
+        :type coordinates_bcs: ndarray
+
+        :return: Ковариационные матрицы в прямоугольной декартовой СК, массив размера (N, 3, 3)
+        :rtype: ndarray
+        """
+        # Матрицы производных для перехода от БСК к МЗСК: B'*A'*F
+        derivative_matrices = np.einsum("ij,njk->nik",
+                                        self.corrupted_covariance_transform_matrix,
+                                        self.calc_acs_derivative_matrix_array(coordinates_bcs))
+        # Ковариационная матрица в декартовых координатах равна G*diag(D)*G', где G - матрица производных
+        return np.einsum("nij,nj,nkj->nik", derivative_matrices, variances_bcs, derivative_matrices)
+
+    @staticmethod
+    def calc_acs_derivative_matrix_array(coordinates_bcs: ndarray) -> ndarray:
+        """Расчёт матриц производных координат АСК по координатам БСК сразу для массива векторов
+
+        :param coordinates_bcs: Координаты в БСК, массив размера (N, 3)
+        :type coordinates_bcs: ndarray
+
+        :return: Матрицы производных, массив размера (N, 3, 3)
+        :rtype: ndarray
+        """
+        r, phi_v, phi_n = coordinates_bcs.T
+        sin_v, cos_v = np.sin(phi_v), np.cos(phi_v)
+        sin_n, cos_n = np.sin(phi_n), np.cos(phi_n)
+        # Формируем элементы матриц производных
+        derivative_matrices = np.zeros((len(coordinates_bcs), 3, 3))
+
+        derivative_matrices[:, 0, 0] = np.sqrt(1 - sin_n ** 2 - sin_v ** 2)
+        derivative_matrices[:, 0, 1] = -r * cos_n * sin_n / derivative_matrices[:, 0, 0]
+        derivative_matrices[:, 0, 2] = -r * cos_v * sin_v / derivative_matrices[:, 0, 0]
+
+        derivative_matrices[:, 1, 0] = sin_v
+        derivative_matrices[:, 1, 2] = r * cos_v
+
+        derivative_matrices[:, 2, 0] = sin_n
+        derivative_matrices[:, 2, 1] = r * cos_n
+        return derivative_matrices
@@ -0,0 +1,155 @@
+from math import exp, sqrt, log10, fabs
+
+import numpy as np
+from numpy import ndarray
+
+
+class AlphaBetaTable:
+    """Класс, описывающий таблицу коэффициентов alpha, beta альфа-бета фильтра по десятичному логарифму
+    интенсивности манёвра. Коэффициенты зависят только от интенсивности манёвра, поэтому одна таблица
+    используется всеми фильтрами. Между узлами коэффициенты линейно интерполируются.
+
+    Вблизи излома формул (lg = 0.2) beta имеет особенность корневого типа, поэтому там, как и вне таблицы,
+    коэффициенты считаются по точным формулам. При параметрах по умолчанию (шаг 5e-4, полоса 0.05)
+    ошибка alpha и beta не больше 1e-7"""
+    __slots__ = ("step",
+                 "exact_band",
+                 "position_offset",
+                 "last_position",
+                 "alpha_nodes",
+                 "beta_nodes",
+                 "alpha_slopes",
+                 "beta_slopes",
+                 "nodes_list")
+
+    # Десятичный логарифм интенсивности манёвра, на котором формулы коэффициентов меняются
+    lg_manoeuvre_level_break = 0.2
+
+    def __init__(self, lg_min: float = -4.8, lg_max: float = 3.2, step: float = 5e-4,
+                 exact_band: float = 0.05) -> None:
+        """
+        :param lg_min: Нижняя граница таблицы по десятичному логарифму интенсивности манёвра
+        :type lg_min: float
+        :param lg_max: Верхняя граница таблицы по десятичному логарифму интенсивности манёвра
+        :type lg_max: float
+        :param step: Шаг таблицы
+        :type step: float
+        :param exact_band: Полуширина полосы вокруг излома формул, где коэффициенты считаются точно
+        :type exact_band: float
+        """
+        # Шаг таблицы
+        self.step = step
+        # Полуширина полосы точного расчёта вокруг излома формул
+        self.exact_band = exact_band
+        # Узлы выбираются так, чтобы излом формул попадал в узел
+        lower_node_count = round((self.lg_manoeuvre_level_break - lg_min) / step)
+        upper_node_count = round((lg_max - self.lg_manoeuvre_level_break) / step)
+        # Положение в таблице (в шагах от первого узла) равно lg / step + position_offset
+        self.position_offset = lower_node_count - self.lg_manoeuvre_level_break / step
+        # Положение последнего узла, до которого можно интерполировать
+        self.last_position = lower_node_count + upper_node_count
+        # Коэффициенты в узлах таблицы
+        lg_manoeuvre_level_nodes = self.lg_manoeuvre_level_break + step * np.arange(-lower_node_count,
+                                                                                   upper_node_count + 1)
+        alpha_nodes, beta_nodes = self.calc_alpha_beta_exact_array(lg_manoeuvre_level_nodes)
+        # Коэффициенты и их приращения до следующего узла (последний узел только правая граница)
+        self.alpha_nodes = alpha_nodes[:-1]
+        self.beta_nodes = beta_nodes[:-1]
+        self.alpha_slopes = np.diff(alpha_nodes)
+        self.beta_slopes = np.diff(beta_nodes)
+        # Те же данные списком кортежей, для быстрого поиска одного значения
+        self.nodes_list = list(zip(self.alpha_nodes.tolist(), self.beta_nodes.tolist(),
+                                   self.alpha_slopes.tolist(), self.beta_slopes.tolist()))
+
+    def __repr__(self) -> str:
+        return f"Таблица коэффициентов alpha, beta из {self.last_position + 1!r} узлов с шагом {self.step!r}. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def calc_alpha_beta(self, manoeuvre_level: float) -> tuple:
+        """Коэффициенты alpha, beta для одной интенсивности манёвра
+
+        :param manoeuvre_level: Интенсивность манёвра
+        :type manoeuvre_level: float
+
+        :return: Коэффициенты alpha и beta
+        :rtype: tuple
+        """
+        # Десятичный логарифм интенсивности манёвра
+        lg_manoeuvre_level = log10(manoeuvre_level)
+        # Положение в таблице в шагах
+        position = lg_manoeuvre_level / self.step + self.position_offset
+        # Вне таблицы и вблизи излома формул коэффициенты считаются точно
+        if not 0. <= position < self.last_position or \
+                fabs(lg_manoeuvre_level - self.lg_manoeuvre_level_break) < self.exact_band:
+            return self.calc_alpha_beta_exact(lg_manoeuvre_level)
+        # Линейная интерполяция между соседними узлами
+        index = int(position)
+        fraction = position - index
+        alpha, beta, alpha_slope, beta_slope = self.nodes_list[index]
+        return alpha + fraction * alpha_slope, beta + fraction * beta_slope
+
+    def calc_alpha_beta_array(self, manoeuvre_level: ndarray) -> tuple:
+        """Коэффициенты alpha, beta сразу для массива интенсивностей манёвра
+
+        :param manoeuvre_level: Массив интенсивностей манёвра
+        :type manoeuvre_level: ndarray
+
+        :return: Массивы коэффициентов alpha и beta той же формы
+        :rtype: tuple
+        """
+        # Десятичный логарифм интенсивности манёвра
+        lg_manoeuvre_level = np.log10(manoeuvre_level)
+        # Положения в таблице в шагах, номера левых узлов (вне таблицы - крайние узлы) и доли шага
+        position = lg_manoeuvre_level / self.step + self.position_offset
+        index = np.clip(position, 0., self.last_position - 1).astype(np.intp)
+        fraction = position - index
+        # Линейная интерполяция между соседними узлами
+        alpha = self.alpha_nodes.take(index) + fraction * self.alpha_slopes.take(index)
+        beta = self.beta_nodes.take(index) + fraction * self.beta_slopes.take(index)
+        # Вне таблицы и вблизи излома формул коэффициенты считаются точно
+        is_exact = (position < 0.) | (position >= self.last_position) | \
+                   (np.abs(lg_manoeuvre_level - self.lg_manoeuvre_level_break) < self.exact_band)
+        if np.any(is_exact):
+            alpha[is_exact], beta[is_exact] = self.calc_alpha_beta_exact_array(lg_manoeuvre_level[is_exact])
+        return alpha, beta
+
+    @classmethod
+    def calc_alpha_beta_exact(cls, lg_manoeuvre_level: float) -> tuple:
+        """Расчёт коэффициентов alpha, beta по точным формулам
+
+        :param lg_manoeuvre_level: Десятичный логарифм интенсивности манёвра
+        :type lg_manoeuvre_level: float
+
+        :return: Коэффициенты alpha и beta
+        :rtype: tuple
+        """
+        if lg_manoeuvre_level <= cls.lg_manoeuvre_level_break:
+            alpha = 0.5 * exp(-fabs(lg_manoeuvre_level - cls.lg_manoeuvre_level_break) ** 1.9 / 4.077422742688568)
+            beta = 2 * (1 - alpha - sqrt(1 - 2 * alpha))
+        else:
+            alpha = 0.5 * exp(-fabs(lg_manoeuvre_level - cls.lg_manoeuvre_level_break) ** 1.7 / 5.9802200226099)
+            beta = 2 * (1 - alpha + sqrt(1 - 2 * alpha))
+        return alpha, beta
+
+    @classmethod
+    def calc_alpha_beta_exact_array(cls, lg_manoeuvre_level: ndarray) -> tuple:
+        """Расчёт коэффициентов alpha, beta по точным формулам сразу для массива
+
+        :param lg_manoeuvre_level: Массив десятичных логарифмов интенсивности манёвра
+        :type lg_manoeuvre_level: ndarray
+
+        :return: Массивы коэффициентов alpha и beta той же формы
+        :rtype: tuple
+        """
+        is_low_level = lg_manoeuvre_level <= cls.lg_manoeuvre_level_break
+        deviation = np.abs(lg_manoeuvre_level - cls.lg_manoeuvre_level_break)
+        alpha = np.where(is_low_level,
+                         0.5 * np.exp(-deviation ** 1.9 / 4.077422742688568),
+                         0.5 * np.exp(-deviation ** 1.7 / 5.9802200226099))
+        root = np.sqrt(1 - 2 * alpha)
+        beta = np.where(is_low_level, 2 * (1 - alpha - root), 2 * (1 - alpha + root))
+        return alpha, beta
+
+
+# Общая таблица коэффициентов для всех альфа-бета фильтров
+default_alpha_beta_table = AlphaBetaTable()
@@ -1,14 +1,16 @@
-from math import exp, sqrt, log10, fabs, pi
+from math import pi
 
 import numpy as np
 
+from alpha_beta_table import default_alpha_beta_table
 from current_track_data import CurrentTrackData
 from previous_track_data import PreviousTrackData
 from prolong_track_data import ProlongTrackData
 
 
 class FilterAB:
-    """Класс для фильтрации биконических координат"""
+    """Класс для фильтрации биконических координат одной трассы.
+    В моделировании трассы фильтруются банком фильтров МФР (FilterBankAB), этот класс - эталон для его проверки"""
     __slots__ = ("counter",
                  "frame_time",
                  "manoeuvre_overload",
@@ -19,6 +21,9 @@ class FilterAB:
                  "current_data",
                  "prolong_data")
 
+    # Таблица коэффициентов alpha, beta, общая для всех фильтров
+    alpha_beta_table = default_alpha_beta_table
+
     def __init__(self, frame_time: float, manoeuvre_overload: float) -> None:
         # Счётчик фильтра
         self.counter = 0
@@ -86,22 +91,13 @@ class FilterAB:
         """
         # Если фильтр только начал работу (нет скорости и экстраполированных значений с пред. такта)
         if self.counter < 2:
-            self.alpha_array = np.ones(3)
-            self.beta_array = np.ones(3)
+            # Заполняем уже созданные массивы, новые не нужны
+            self.alpha_array.fill(1.)
+            self.beta_array.fill(1.)
         else:
-            # По всем интенсивностям манёвра в биконических координатах формируем коэфф. alpha и beta
-            for index, manoeuvre_level in enumerate(self.manoeuvre_level_array):
-                # Десятичный логарифм интенсивности манёвра
-                lg_manoeuvre_level = log10(manoeuvre_level)
-                if lg_manoeuvre_level <= 0.2:
-                    alpha = 0.5 * exp(-fabs(lg_manoeuvre_level - 0.2) ** 1.9 / 4.077422742688568)
-                    beta = 2 * (1 - alpha - sqrt(1 - 2 * alpha))
-                else:
-                    alpha = 0.5 * exp(-fabs(lg_manoeuvre_level - 0.2) ** 1.7 / 5.9802200226099)
-                    beta = 2 * (1 - alpha + sqrt(1 - 2 * alpha))
-                # Изменение коэффициента по каждой биконической координате
-                self.alpha_array[index] = alpha
-                self.beta_array[index] = beta
+            # По всем интенсивностям манёвра в биконических координатах берём коэфф. alpha и beta из таблицы
+            for index, manoeuvre_level in enumerate(self.manoeuvre_level_array.tolist()):
+                self.alpha_array[index], self.beta_array[index] = self.alpha_beta_table.calc_alpha_beta(manoeuvre_level)
 
     def filtrate_coord_and_vel(self) -> None:
         """Alpha-Beta фильтрация координат и производных
@@ -112,7 +108,7 @@ class FilterAB:
         meas_coord = self.current_data.measure_coordinates
         # Экстраполированная оценка координат с прошлого шага
         # Для обработки начального состояния фильтра, чтобы корректно считалась скорость
-        ext_coord = meas_coord if self.counter is 0 else self.current_data.extrapolate_coordinates
+        ext_coord = meas_coord if self.counter == 0 else self.current_data.extrapolate_coordinates
         # Экстраполированная оценка координат с прошлого шага
         ext_vel = self.current_data.extrapolate_velocities
         # Коэффициент alpha
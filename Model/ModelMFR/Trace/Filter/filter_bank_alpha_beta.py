@@ -0,0 +1,275 @@
+from math import pi
+
+import numpy as np
+from numpy import ndarray
+
+from alpha_beta_table import default_alpha_beta_table
+
+
+class FilterBankAB:
+    """Банк альфа-бета фильтров: хранит состояние фильтров всех трасс одного МФР в массивах размера (N, 3)
+    и выполняет один шаг фильтрации для любой группы строк одной векторной операцией.
+    Алгоритм повторяет FilterAB, каждая строка банка соответствует одному фильтру"""
+    __slots__ = ("capacity",
+                 "free_rows",
+                 "counter",
+                 "frame_time",
+                 "manoeuvre_overload",
+                 "manoeuvre_level_array",
+                 "alpha_array",
+                 "beta_array",
+                 "measure_coordinates",
+                 "sigma_bcs",
+                 "estimate_coordinates",
+                 "estimate_velocities",
+                 "extrapolate_coordinates",
+                 "extrapolate_velocities",
+                 "variance_estimate_coordinates",
+                 "variance_extrapolate_coordinates",
+                 "covariance_est_coord_vel",
+                 "variance_estimate_velocities")
+
+    # Таблица коэффициентов alpha, beta, общая для всех фильтров
+    alpha_beta_table = default_alpha_beta_table
+
+    # Имена массивов состояния размера (N, 3)
+    vector_fields = ("manoeuvre_level_array",
+                     "alpha_array",
+                     "beta_array",
+                     "measure_coordinates",
+                     "sigma_bcs",
+                     "estimate_coordinates",
+                     "estimate_velocities",
+                     "extrapolate_coordinates",
+                     "extrapolate_velocities",
+                     "variance_estimate_coordinates",
+                     "variance_extrapolate_coordinates",
+                     "covariance_est_coord_vel",
+                     "variance_estimate_velocities")
+
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        :param capacity: Начальное число строк в банке, при нехватке банк расширяется
+        :type capacity: int
+        """
+        # Число строк в банке
+        self.capacity = capacity
+        # Свободные строки банка
+        self.free_rows = list(reversed(range(capacity)))
+        # Счётчики фильтров
+        self.counter = np.zeros(capacity, dtype=int)
+        # Время между сопровождением в секундах
+        self.frame_time = np.zeros(capacity)
+        # Перегрузка при манёвре цели
+        self.manoeuvre_overload = np.zeros(capacity)
+        # Массивы состояния фильтров
+        for field in self.vector_fields:
+            setattr(self, field, np.zeros((capacity, 3)))
+
+    def __repr__(self) -> str:
+        return f"Банк альфа-бета фильтров, занято {self.capacity - len(self.free_rows)!r} из {self.capacity!r} строк. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def append(self, frame_time: float, manoeuvre_overload: float) -> int:
+        """Добавление нового фильтра в банк
+
+        :param frame_time: Время между сопровождением в секундах
+        :type frame_time: float
+        :param manoeuvre_overload: Перегрузка при манёвре цели
+        :type manoeuvre_overload: float
+
+        :return: Номер строки банка, выделенной под фильтр
+        :rtype: int
+        """
+        if not self.free_rows:
+            self._grow()
+        row = self.free_rows.pop()
+        # Начальное состояние фильтра
+        self.counter[row] = 0
+        self.frame_time[row] = frame_time
+        self.manoeuvre_overload[row] = manoeuvre_overload
+        for field in self.vector_fields:
+            getattr(self, field)[row] = 0.
+        return row
+
+    def remove(self, row: int) -> None:
+        """Удаление фильтра из банка, строка становится свободной
+
+        :param row: Номер строки банка
+        :type row: int
+
+        :return: None
+        """
+        self.free_rows.append(row)
+
+    def _grow(self) -> None:
+        """Увеличение числа строк банка в два раза
+
+        :return: None
+        """
+        old_capacity = self.capacity
+        self.capacity = 2 * old_capacity
+        for field in ("counter", "frame_time", "manoeuvre_overload", *self.vector_fields):
+            old_array = getattr(self, field)
+            new_array = np.zeros((self.capacity, *old_array.shape[1:]), dtype=old_array.dtype)
+            new_array[:old_capacity] = old_array
+            setattr(self, field, new_array)
+        self.free_rows.extend(reversed(range(old_capacity, self.capacity)))
+
+    def set_measurements(self, rows: ndarray, measure_coordinates: ndarray, sigma_bcs: ndarray) -> None:
+        """Обновление информации о текущих измерениях и СКО единичных измерений
+
+        :param rows: Номера строк банка
+        :type rows: ndarray
+        :param measure_coordinates: Измеренные координаты, массив размера (len(rows), 3)
+        :type measure_coordinates: ndarray
+        :param sigma_bcs: СКО измерений, массив размера (len(rows), 3) или (3,)
+        :type sigma_bcs: ndarray
+
+        :return: None
+        """
+        self.measure_coordinates[rows] = measure_coordinates
+        self.sigma_bcs[rows] = sigma_bcs
+
+    def get_current_data(self, rows: ndarray) -> dict:
+        """Копии текущих данных фильтров для указанных строк (дальнейшая работа банка их не изменит)
+
+        :param rows: Номера строк банка
+        :type rows: ndarray
+
+        :return: Словарь с массивами размера (len(rows), 3), ключи совпадают с полями CurrentTrackData
+        :rtype: dict
+        """
+        return {field: getattr(self, field)[rows] for field in ("measure_coordinates",
+                                                                 "estimate_coordinates",
+                                                                 "estimate_velocities",
+                                                                 "extrapolate_coordinates",
+                                                                 "extrapolate_velocities",
+                                                                 "variance_estimate_coordinates",
+                                                                 "variance_extrapolate_coordinates")}
+
+    def operate(self, rows: ndarray) -> None:
+        """Основной алгоритм работы: шаг фильтрации для указанных строк банка, порядок вызова функций важен.
+        Перед вызовом в строки должны быть записаны измеренные координаты и СКО измерений
+
+        :param rows: Номера строк банка, фильтры которых работают на этом такте
+        :type rows: ndarray
+
+        :return: None
+        """
+        # Оценить интенсивность манёвра
+        self.calc_manoeuvre_level(rows)
+        # Расчитать коэффициенты alpha и beta
+        self.calc_alpha_beta(rows)
+        # Фильтрация координат и производных
+        self.filtrate_coord_and_vel(rows)
+        # Вычисление ошибок фильтра
+        self.calculate_sigma(rows)
+        # Инкрементация состояния фильтров на следующий шаг
+        self.counter[rows] += 1
+
+    def calc_manoeuvre_level(self, rows: ndarray) -> None:
+        """Вычисление относительной интенсивности манёвра
+
+        :param rows: Номера строк банка
+        :type rows: ndarray
+
+        :return: None
+        """
+        # Ускорение свободного падения
+        g_earth = 9.80665
+        # Относительная интенсивность манёвра
+        manoeuvre_level = 2 * self.manoeuvre_overload[rows] * g_earth * self.frame_time[rows] ** 2 / pi
+        # Дальность до цели
+        target_range = self.measure_coordinates[rows, 0]
+        # Для дальности делим на СКО, для углов на СКО, умноженное на дальность
+        divisor = self.sigma_bcs[rows]
+        divisor[:, 1:] *= target_range[:, np.newaxis]
+        self.manoeuvre_level_array[rows] = manoeuvre_level[:, np.newaxis] / divisor
+
+    def calc_alpha_beta(self, rows: ndarray) -> None:
+        """Вычисление коэффициентов alpha, beta для каждого такта фильтрации
+
+        :param rows: Номера строк банка
+        :type rows: ndarray
+
+        :return: None
+        """
+        # Если фильтр только начал работу (нет скорости и экстраполированных значений с пред. такта)
+        is_starting = self.counter[rows] < 2
+        self.alpha_array[rows[is_starting]] = 1.
+        self.beta_array[rows[is_starting]] = 1.
+        # Для остальных фильтров берём коэфф. alpha и beta из таблицы по интенсивностям манёвра
+        working_rows = rows[~is_starting]
+        if working_rows.size:
+            alpha, beta = self.alpha_beta_table.calc_alpha_beta_array(self.manoeuvre_level_array[working_rows])
+            self.alpha_array[working_rows] = alpha
+            self.beta_array[working_rows] = beta
+
+    def filtrate_coord_and_vel(self, rows: ndarray) -> None:
+        """Alpha-Beta фильтрация координат и производных, экстраполяция на следующий шаг
+
+        :param rows: Номера строк банка
+        :type rows: ndarray
+
+        :return: None
+        """
+        # Измеренные координаты
+        meas_coord = self.measure_coordinates[rows]
+        # Экстраполированная оценка координат с прошлого шага
+        # Для обработки начального состояния фильтра, чтобы корректно считалась скорость
+        is_first_step = (self.counter[rows] == 0)[:, np.newaxis]
+        ext_coord = np.where(is_first_step, meas_coord, self.extrapolate_coordinates[rows])
+        # Экстраполированная оценка скорости с прошлого шага
+        ext_vel = self.extrapolate_velocities[rows]
+        # Коэффициенты alpha и beta
+        alpha = self.alpha_array[rows]
+        beta = self.beta_array[rows]
+        # Время в секундах между сопровождением
+        dt = self.frame_time[rows, np.newaxis]
+        # Вычисление оценки координат
+        est_coord = alpha * meas_coord + (1 - alpha) * ext_coord
+        # Вычисление оценки скорости
+        est_vel = (beta / dt) * (meas_coord - ext_coord) + ext_vel
+        self.estimate_coordinates[rows] = est_coord
+        self.estimate_velocities[rows] = est_vel
+        # Экстраполяция координат и скорости на след. шаг
+        self.extrapolate_coordinates[rows] = est_coord + dt * est_vel
+        self.extrapolate_velocities[rows] = est_vel
+
+    def calculate_sigma(self, rows: ndarray) -> None:
+        """Вычисление ошибок фильтра
+
+        :param rows: Номера строк банка
+        :type rows: ndarray
+
+        :return: None
+        """
+        # Обозначения для упрощения записи
+        dt = self.frame_time[rows, np.newaxis]
+        alpha = self.alpha_array[rows]
+        beta = self.beta_array[rows]
+        prev_cov_est_coord_vel = self.covariance_est_coord_vel[rows]
+        prev_var_est_vel = self.variance_estimate_velocities[rows]
+        cur_var_ext_coord = self.variance_extrapolate_coordinates[rows]
+        # Дисперсия текущего измерения
+        cur_var_meas_coord = self.sigma_bcs[rows] ** 2
+        # Ковариация экстраполированных на текущий такт координаты и оценки скорости с пред. шага
+        cov_ext_coord_est_vel = prev_cov_est_coord_vel + prev_var_est_vel * dt
+        # Ковариация оценки координат и скоростей на текущий шаг
+        cur_cov_est_coord_vel = alpha * beta * cur_var_meas_coord / dt
+        cur_cov_est_coord_vel -= (1 - alpha) * beta * cur_var_ext_coord / dt
+        cur_cov_est_coord_vel += (1 - alpha) * cov_ext_coord_est_vel
+        # Дисперсия оценки оценки скорости на текущий шаг
+        cur_var_est_vel = (beta / dt) ** 2 * (cur_var_meas_coord + cur_var_ext_coord)
+        cur_var_est_vel -= 2 * beta * cov_ext_coord_est_vel / dt
+        cur_var_est_vel += prev_var_est_vel
+        # Дисперсия оценки координат на текущий шаг
+        cur_var_est_coord = alpha ** 2 * cur_var_meas_coord + (1 - alpha) ** 2 * cur_var_ext_coord
+        # Дисперсия экстраполированных координат на следующий такт
+        prolong_var_ext_coord = cur_var_est_coord + 2 * cur_cov_est_coord_vel * dt + cur_var_est_vel * dt ** 2
+        # Запись вычисленных значений в банк
+        self.covariance_est_coord_vel[rows] = cur_cov_est_coord_vel
+        self.variance_estimate_velocities[rows] = cur_var_est_vel
+        self.variance_estimate_coordinates[rows] = cur_var_est_coord
+        self.variance_extrapolate_coordinates[rows] = prolong_var_ext_coord
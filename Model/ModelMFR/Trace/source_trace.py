@@ -1,9 +1,9 @@
 import numpy as np
 from numpy import cross, dot, ndarray
-from numpy.linalg import inv
 
 from calc_covariance_matrix import elements_of_covariance_matrix
 from model_time import time_in_tick
+from spd_matrix_math import mahalanobis_distance_3x3, mahalanobis_distance_3x3_array
 
 
 class SourceTrace:
@@ -305,4 +305,18 @@ class SourceTrace:
         :return: Обобщённое расстояние
         :rtype: float
         """
-        return range_between_traces @ inv(covariance_matrix) @ range_between_traces.T
+        return mahalanobis_distance_3x3(covariance_matrix, range_between_traces)
+
+    @staticmethod
+    def calculate_generalized_distance_array(covariance_matrices: ndarray, ranges_between_traces: ndarray) -> ndarray:
+        """Расчёт обобщённых расстояний сразу для набора пар трасс (через разложение Холецкого, без обращения матриц)
+
+        :param covariance_matrices: Суммарные ковариационные матрицы, массив размера (..., 3, 3)
+        :type covariance_matrices: ndarray
+        :param ranges_between_traces: Векторы разности между координатами трасс, массив размера (..., 3)
+        :type ranges_between_traces: ndarray
+
+        :return: Обобщённые расстояния, массив размера (...)
+        :rtype: ndarray
+        """
+        return mahalanobis_distance_3x3_array(covariance_matrices, ranges_between_traces)
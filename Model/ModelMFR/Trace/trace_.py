@@ -1,9 +1,7 @@
 import numpy as np
-import numpy.random as rand
 from numpy import ndarray
 
 from coordinate_system_math import dec2sph, sph2dec
-from filter_alpha_beta import FilterAB
 from model_time import time_in_tick
 from source_trace import SourceTrace
 from target import Target
@@ -21,14 +19,19 @@ class Trace:
                  "is_auto_tracking",
                  "default_range",
                  "frame_tick",
-                 "filter",
+                 "frame_time",
+                 "manoeuvre_overload",
+                 "filter_row",
                  "coordinates_data",
                  "velocities_data",
                  "variance_bcs_data",
                  "covariance_matrix_data",
                  "source_trace")
 
-    def __init__(self, target: Target, mfr_number: int, mfr_stable_point: ndarray) -> None:
+    def __init__(self,
+                 target: Target,
+                 mfr_number: int,
+                 mfr_stable_point: ndarray) -> None:
         # Текущее время в тиках
         self.estimate_tick = 0
         # Цель
@@ -40,10 +43,12 @@ class Trace:
         # Априорная дальность (для постановщика АШП)
         self.default_range = 50_000.
         # Временных тиков между измерениями
-        self.frame_tick = 2 if self.is_auto_tracking else 20
-        frame_time = self.frame_tick * time_in_tick
-        # Собственный фильтр
-        self.filter = FilterAB(frame_time, manoeuvre_overload=4)
+        self.frame_tick = self.calc_frame_tick(self.is_auto_tracking)
+        # Темп обновления информации и перегрузка манёвра для строки в банке фильтров МФР
+        self.frame_time = self.frame_tick * time_in_tick
+        self.manoeuvre_overload = 4
+        # Номер строки в банке фильтров МФР (если трасса фильтруется банком фильтров, иначе -1)
+        self.filter_row = -1
         # Данные по координатам
         self.coordinates_data = TraceCoordinatesData()
         # Данные по скоростям
@@ -59,13 +64,27 @@ class Trace:
         return f"Трасса по цели с номером {self.target.number!r}." \
                f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
 
-    def measure(self, real_coord_bcs: ndarray, sig_meas_bcs: ndarray) -> None:
+    @staticmethod
+    def calc_frame_tick(is_auto_tracking: bool) -> int:
+        """Темп сопровождения трассы в тиках
+
+        :param is_auto_tracking: Признак АС
+        :type is_auto_tracking: bool
+
+        :return: Число временных тиков между измерениями
+        :rtype: int
+        """
+        return 2 if is_auto_tracking else 20
+
+    def measure(self, real_coord_bcs: ndarray, sig_meas_bcs: ndarray, standard_normal: ndarray) -> None:
         """Производит измерение координат цели, как нормально распределённую величинус известным распредлением
 
         :param real_coord_bcs: Настоящие координаты цели в БСК
         :type real_coord_bcs: ndarray
         :param sig_meas_bcs: Сигмы измерений координат в БСК
         :type sig_meas_bcs: ndarray
+        :param standard_normal: Три стандартные нормальные величины из поставщика шума МФР
+        :type standard_normal: ndarray
 
         :return: None
         """
@@ -74,56 +93,32 @@ class Trace:
         # Обновление информации о ошибках измерения
         self.variance_bcs_data.update_errors_measure_data(sig_meas_bcs)
         # Измерение координат цели как нормально распредлённая величина с СКО, заданным МФР
-        self.coordinates_data.measure_coordinates_bcs = rand.normal(real_coord_bcs, sig_meas_bcs)
+        self.coordinates_data.measure_coordinates_bcs = real_coord_bcs + sig_meas_bcs * standard_normal
         # Если пеленг, то измерение дальности невозможно: вместо него априорная дальность
         if self.is_bearing:
             self.coordinates_data.measure_coordinates_bcs[0] = self.default_range
 
-    def filtrate(self) -> None:
-        """Работа с собственным фильтром трассы
-
-        :return: None
-        """
-        # Обновление информации в фильтре
-        self.update_filter_data()
-        # Запуск работы фильтра
-        self.run_filter()
-        # Обновление данных трассы результатами работы фильтра
-        self.update_self_data()
-
-    def update_filter_data(self) -> None:
-        """Обновление информации в фильтре
-
-        :return: None
-        """
-        # Обновление информации о текущем измерении трассы
-        self.filter.current_data.measure_coordinates = self.coordinates_data.measure_coordinates_bcs
-        # Обновление информации о СКО единичных измерений
-        self.filter.current_data.sigma_bcs = self.variance_bcs_data.sigma_measure_coordinates
-
-    def run_filter(self) -> None:
-        """Запуск работы фильтра
-
-        :return: None
-        """
-        self.filter.operate()
+    def update_self_data_from_filter_bank(self, filtered_data: dict, index: int) -> None:
+        """Обновление данных трассы результатами работы банка фильтров
 
-    def update_self_data(self) -> None:
-        """Обновление данных трассы результатами работы фильтра
+        :param filtered_data: Словарь с массивами результатов банка фильтров по всем отфильтрованным трассам,
+        ключи совпадают с именами полей текущих данных фильтра
+        :type filtered_data: dict
+        :param index: Номер трассы в массивах результатов
+        :type index: int
 
         :return: None
         """
-        # Текущие данные от фильтра
-        current_data = self.filter.current_data
         # Координаты
-        self.coordinates_data.measure_coordinates_bcs = current_data.measure_coordinates
-        self.coordinates_data.estimate_coordinates_bcs = current_data.estimate_coordinates
-        self.coordinates_data.extrapolate_coordinates_bcs = current_data.extrapolate_coordinates
+        self.coordinates_data.measure_coordinates_bcs = filtered_data["measure_coordinates"][index]
+        self.coordinates_data.estimate_coordinates_bcs = filtered_data["estimate_coordinates"][index]
+        self.coordinates_data.extrapolate_coordinates_bcs = filtered_data["extrapolate_coordinates"][index]
         # Скорость
-        self.velocities_data.extrapolate_velocities_bcs = current_data.extrapolate_velocities
+        self.velocities_data.extrapolate_velocities_bcs = filtered_data["extrapolate_velocities"][index]
         # Дисперсии
-        self.variance_bcs_data.variance_estimate_coordinates = current_data.variance_estimate_coordinates
-        self.variance_bcs_data.variance_extrapolate_coordinates = current_data.variance_extrapolate_coordinates
+        self.variance_bcs_data.variance_estimate_coordinates = filtered_data["variance_estimate_coordinates"][index]
+        self.variance_bcs_data.variance_extrapolate_coordinates = \
+            filtered_data["variance_extrapolate_coordinates"][index]
 
     def calculate_dec_coord_and_vel(self, func, residuals: [None, ndarray]) -> None:
         """Расчёт координат и скоростей в МЗСК МФР
@@ -143,8 +138,28 @@ class Trace:
         meas_coord, ext_vel = func(coordinates_data.measure_coordinates_bcs, extrapolate_velocities_bcs)
         est_coord, _ = func(coordinates_data.estimate_coordinates_bcs, extrapolate_velocities_bcs)
         ext_coord, _ = func(coordinates_data.extrapolate_coordinates_bcs, extrapolate_velocities_bcs)
-
         # Запись полученных значений
+        self.update_dec_coord_and_vel(meas_coord, est_coord, ext_coord, ext_vel, residuals)
+
+    def update_dec_coord_and_vel(self, meas_coord: ndarray, est_coord: ndarray, ext_coord: ndarray,
+                                 ext_vel: ndarray, residuals: [None, ndarray]) -> None:
+        """Запись координат и скоростей в МЗСК МФР, уже пересчитанных из БСК (в том числе для всех трасс сразу)
+
+        :param meas_coord: Измеренные координаты в МЗСК МФР
+        :type meas_coord: ndarray
+        :param est_coord: Оцененные координаты в МЗСК МФР
+        :type est_coord: ndarray
+        :param ext_coord: Экстраполированные координаты в МЗСК МФР
+        :type ext_coord: ndarray
+        :param ext_vel: Экстраполированная скорость в МЗСК МФР
+        :type ext_vel: ndarray
+        :param residuals: Вектор поправок для сферических координат МФР или None
+        :type residuals: ndarray
+
+        :return: None
+        """
+        # Данные о координатах
+        coordinates_data = self.coordinates_data
         # Для координат в зависимости от наличия поправки
         coordinates_data.measure_coordinates_dec = self.calc_with_residuals(meas_coord, residuals)
         coordinates_data.estimate_coordinates_dec = self.calc_with_residuals(est_coord, residuals)
@@ -180,6 +195,23 @@ class Trace:
         extrapolate_covariance_matrix = func(np.diag(self.variance_bcs_data.variance_extrapolate_coordinates),
                                              self.coordinates_data.extrapolate_coordinates_bcs)
         # Запись полученных значений
+        self.update_dec_covariance_matrix(measure_covariance_matrix,
+                                          estimate_covariance_matrix,
+                                          extrapolate_covariance_matrix)
+
+    def update_dec_covariance_matrix(self, measure_covariance_matrix: ndarray, estimate_covariance_matrix: ndarray,
+                                     extrapolate_covariance_matrix: ndarray) -> None:
+        """Запись ковариационных матриц в МЗСК МФР, уже пересчитанных из БСК (в том числе для всех трасс сразу)
+
+        :param measure_covariance_matrix: Ковариационная матрица измеренных координат
+        :type measure_covariance_matrix: ndarray
+        :param estimate_covariance_matrix: Ковариационная матрица оцененных координат
+        :type estimate_covariance_matrix: ndarray
+        :param extrapolate_covariance_matrix: Ковариационная матрица экстраполированных координат
+        :type extrapolate_covariance_matrix: ndarray
+
+        :return: None
+        """
         self.covariance_matrix_data.measure_covariance_matrix = measure_covariance_matrix
         self.covariance_matrix_data.estimate_covariance_matrix = estimate_covariance_matrix
         self.covariance_matrix_data.extrapolate_covariance_matrix = extrapolate_covariance_matrix
@@ -1,7 +1,11 @@
 import numpy as np
 from numpy import ndarray
+from numpy.random import SeedSequence
 
 from errors_namedtuple import SurveillanceErrors
+from filter_bank_alpha_beta import FilterBankAB
+from noise_provider import NoiseProvider
+from registration_buffer import MFR_REGISTRATION_DTYPE, RegistrationBuffer
 from surveillance_data import SurveillanceData
 from target import Target
 from trace_ import Trace
@@ -15,16 +19,22 @@ class MultiFunctionalRadar:
                  "stable_point",
                  "is_adjustment",
                  "residuals",
+                 "seed_sequence",
+                 "generator",
+                 "noise_provider",
                  "surveillance_data",
                  "target_list",
-                 "trace_list",
-                 "registration")
+                 "filter_bank",
+                 "trace_dict",
+                 "registration",
+                 "profiler")
 
     def __init__(self,
                  target_list: list,
                  stable_point: ndarray = np.zeros(3),
                  mfr_number: int = 1,
-                 errors: SurveillanceErrors = SurveillanceErrors(0, 0)) -> None:
+                 errors: SurveillanceErrors = SurveillanceErrors(0, 0),
+                 seed_sequence: SeedSequence = None) -> None:
         # Время начала работы МФР
         self.start_tick = 0.
         # Текущее время в тиках
@@ -37,21 +47,46 @@ class MultiFunctionalRadar:
         self.is_adjustment = True if self.number == 1 else False
         # Вектор поправок
         self.residuals = None
+        # Зерно МФР в дереве зёрен варианта: от него порождается генератор МФР
+        self.seed_sequence = SeedSequence() if seed_sequence is None else seed_sequence
+        # Собственный генератор случайных чисел МФР
+        self.generator = np.random.default_rng(self.seed_sequence)
+        # Поставщик шума для измерений всех трасс МФР
+        self.noise_provider = NoiseProvider(self.generator)
         # Параметры обзора
         self.surveillance_data = SurveillanceData(errors)
         # Массив целей, которых пытается сопровождать МФР
         self.target_list = target_list
-        # Массив трасс
-        self.trace_list = [Trace(target=trg,
-                                 mfr_number=self.number,
-                                 mfr_stable_point=self.stable_point) for trg in target_list]
-        # Массив информации о каждой трассе этого МФР
-        self.registration = []
+        # Банк фильтров всех трасс МФР
+        self.filter_bank = FilterBankAB()
+        # Словарь трасс: ключ - цель, по которой ведётся трасса (порядок трасс - порядок их появления)
+        self.trace_dict = {trg: self.create_trace(trg) for trg in target_list}
+        # Буфер информации о каждой трассе этого МФР
+        self.registration = RegistrationBuffer(MFR_REGISTRATION_DTYPE)
+        # Профилировщик этапов работы (StageProfiler), по умолчанию профилирование выключено
+        self.profiler = None
 
     def __repr__(self) -> str:
         return f"МФР c номером {self.number!r}, c точкой стояния {self.stable_point!r}. " \
                f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
 
+    @property
+    def trace_list(self) -> list:
+        """
+        :return: Массив трасс
+        :rtype: list
+        """
+        return list(self.trace_dict.values())
+
+    @property
+    def frame_ticks(self) -> set:
+        """Темпы сопровождения всех трасс, которые могут появиться у этого МФР
+
+        :return: Множество чисел тиков между измерениями
+        :rtype: set
+        """
+        return {Trace.calc_frame_tick(target.is_auto_tracking[self.number]) for target in self.target_list}
+
     def operate(self, ticks: int) -> None:
         """Основной алгоритм работы
 
@@ -62,7 +97,7 @@ class MultiFunctionalRadar:
         """
         # Текущее время в тиках
         self.tick = ticks - self.start_tick
-        if self.tick >= 0:
+        if self.tick >= 0 and self.profiler is None:
             # Добавление или удаление трасс из состава трасс МФР
             self.update_trace_list()
             # Сопровождение целей: измерение, фильтрация, пересчёт в МЗСК МФР
@@ -71,6 +106,12 @@ class MultiFunctionalRadar:
             self.update_source_traces()
             # Регистрация нужных переменных
             self.register()
+        elif self.tick >= 0:
+            # Те же этапы с измерением времени
+            self.profiler.run("mfr.update_trace_list", self.update_trace_list, size=len(self.target_list))
+            self.profiler.run("mfr.tracking", self.tracking, size=len(self.trace_dict))
+            self.profiler.run("mfr.update_source_traces", self.update_source_traces, size=len(self.trace_dict))
+            self.profiler.run("mfr.register", self.register, size=len(self.trace_dict))
 
     def update_trace_list(self) -> None:
         """Алгоритм обновления массива трасс
@@ -101,11 +142,9 @@ class MultiFunctionalRadar:
         :return: None
         """
         # Если не было трассы по такой цели
-        if not any(target is trace.target for trace in self.trace_list):
+        if target not in self.trace_dict:
             # то добавить трассу
-            self.trace_list.append(Trace(target=target,
-                                         mfr_number=self.number,
-                                         mfr_stable_point=self.stable_point))
+            self.trace_dict[target] = self.create_trace(target)
 
     def remove_trace_for_target(self, target: Target) -> None:
         """Удаление трассы по цели
@@ -115,44 +154,121 @@ class MultiFunctionalRadar:
 
         :return: None
         """
-        self.trace_list = list(filter(lambda trace: trace.target is not target, self.trace_list))
+        trace = self.trace_dict.pop(target, None)
+        if trace is not None:
+            # Освобождение строки банка фильтров
+            self.filter_bank.remove(trace.filter_row)
+
+    def set_seed_sequence(self, seed_sequence: SeedSequence) -> None:
+        """Замена зерна МФР (например, для копии МФР в очередной реализации).
+        Генератор МФР и поставщик шума для измерений всех его трасс порождаются заново
+
+        :param seed_sequence: Новое зерно МФР
+        :type seed_sequence: SeedSequence
+
+        :return: None
+        """
+        self.seed_sequence = seed_sequence
+        self.generator = np.random.default_rng(seed_sequence)
+        self.noise_provider = NoiseProvider(self.generator)
+
+    def create_trace(self, target: Target) -> Trace:
+        """Создание трассы по цели, фильтр трассы размещается в банке фильтров МФР
+
+        :param target: Цель, по которой создаётся трасса
+        :type target: Target
+
+        :return: Новая трасса
+        :rtype: Trace
+        """
+        trace = Trace(target=target,
+                      mfr_number=self.number,
+                      mfr_stable_point=self.stable_point)
+        trace.filter_row = self.filter_bank.append(trace.frame_time, trace.manoeuvre_overload)
+        return trace
 
     def tracking(self) -> None:
         """Алгоритм сопровождения
 
         :return: None
         """
-        for trace in self.trace_list:
-            # В зависимости от темпа сопровождения
-            if not self.tick % trace.frame_tick:
-                # Измерение
-                self.create_measurement(trace)
-                # Фильтрация
-                trace.filtrate()
-                # Пересчёт в декартовые координаты
-                self.calculate_trace_to_dec(trace)
+        # Трассы, у которых в зависимости от темпа сопровождения сейчас такт работы
+        traces = self.get_due_traces()
+        if not traces:
+            return
+        # Измерение
+        self.create_measurements(traces)
+        # Фильтрация всех трасс одним шагом банка фильтров
+        self.filtrate(traces)
+        # Пересчёт в декартовые координаты
+        self.calculate_traces_to_dec(traces)
+
+    def get_due_traces(self) -> list:
+        """
+        :return: Трассы, у которых в зависимости от темпа сопровождения сейчас такт работы
+        :rtype: list
+        """
+        return [trace for trace in self.trace_dict.values() if not self.tick % trace.frame_tick]
+
+    def filtrate(self, traces: list) -> None:
+        """Фильтрация трасс банком фильтров
+
+        :param traces: Трассы, которые фильтруются на этом такте
+        :type traces: list
+
+        :return: None
+        """
+        rows = np.array([trace.filter_row for trace in traces])
+        # Обновление информации о текущих измерениях и СКО единичных измерений
+        self.filter_bank.set_measurements(rows,
+                                          [trace.coordinates_data.measure_coordinates_bcs for trace in traces],
+                                          [trace.variance_bcs_data.sigma_measure_coordinates for trace in traces])
+        # Запуск работы фильтров
+        self.filter_bank.operate(rows)
+        # Обновление данных трасс результатами работы фильтров
+        filtered_data = self.filter_bank.get_current_data(rows)
+        for index, trace in enumerate(traces):
+            trace.update_self_data_from_filter_bank(filtered_data, index)
 
     def create_measurement(self, trace: Trace) -> None:
-        """Измерение координат целей
+        """Измерение координат цели
 
         :param trace: Трасса цели
         :type trace: Trace
 
         :return: None
         """
-        # Пересчёт координат и производных реального положения цели в прямоугольную декартовую МЗСК МФР
-        coordinates_dec = trace.target.coordinates - self.stable_point
-        velocities_dec = trace.target.velocities
+        self.create_measurements([trace])
+
+    def create_measurements(self, traces: list, standard_normals: ndarray = None) -> None:
+        """Измерение координат целей, пересчёт координат выполняется сразу для всех трасс
+
+        :param traces: Трассы целей
+        :type traces: list
+        :param standard_normals: Стандартные нормальные величины размера (N, 3) для ошибок измерений,
+        по умолчанию берутся у поставщика шума этого МФР
+        :type standard_normals: ndarray
+
+        :return: None
+        """
+        # Пересчёт координат и производных реального положения целей в прямоугольную декартовую МЗСК МФР
+        coordinates_dec = np.array([trace.target.coordinates for trace in traces]) - self.stable_point
+        velocities_dec = np.array([trace.target.velocities for trace in traces])
 
-        # Пересчёт координат и производных реального положения цели в БСК МФР
-        dec2bcs = self.surveillance_data.position_antenna_data.dec2bcs
-        coordinates_bcs, velocities_bcs = dec2bcs(coordinates_dec, velocities_dec)
+        # Пересчёт координат и производных реального положения целей в БСК МФР
+        dec2bcs_array = self.surveillance_data.position_antenna_data.dec2bcs_array
+        coordinates_bcs, _ = dec2bcs_array(coordinates_dec, velocities_dec)
 
         # Выбор СКО для координат в БСК
         sigma_bcs = self.surveillance_data.sigma_bcs
 
+        # Стандартные нормальные величины для всех трасс из общего блока МФР
+        if standard_normals is None:
+            standard_normals = self.noise_provider.take(len(traces))
+
         # Измерение биконических координат цели, каждая из которых - нормально распредлённая величина
-        trace.measure(coordinates_bcs, sigma_bcs)
+        for trace, coordinate_bcs, standard_normal in zip(traces, coordinates_bcs, standard_normals):
+            trace.measure(coordinate_bcs, sigma_bcs, standard_normal)
 
     def calculate_trace_to_dec(self, trace: Trace) -> None:
         """Пересчёт координат и ковариационных матриц в МЗСК МФР
@@ -162,22 +278,56 @@ class MultiFunctionalRadar:
 
         :return: None
         """
-        # Выбор функции для пересчёта координат и скоростей
-        bcs2dec = self.surveillance_data.position_antenna_data.bcs2dec
-        # Расчёт координат и скоростей в декартовой прямоугольной МЗСК МФР, c учетом поправок
-        trace.calculate_dec_coord_and_vel(bcs2dec, self.residuals)
+        self.calculate_traces_to_dec([trace])
+
+    def calculate_traces_to_dec(self, traces: list, residuals_list: list = None) -> None:
+        """Пересчёт координат и ковариационных матриц в МЗСК МФР, координаты пересчитываются сразу для всех трасс
+
+        :param traces: Трассы целей
+        :type traces: list
+        :param residuals_list: Векторы поправок для каждой трассы, по умолчанию вектор поправок этого МФР
+        :type residuals_list: list
 
-        # Выбор функциия для пересчёта ковариационных матриц
-        bsc2dec_for_matrix = self.surveillance_data.position_antenna_data.calc_dec_covariance_matrix_from_bcs
+        :return: None
+        """
+        # Число трасс
+        count = len(traces)
+        # Измеренные, оцененные и экстраполированные координаты всех трасс одним массивом размера (3N, 3)
+        coordinates_bcs = np.array([coordinates for trace in traces for coordinates in (
+            trace.coordinates_data.measure_coordinates_bcs,
+            trace.coordinates_data.estimate_coordinates_bcs,
+            trace.coordinates_data.extrapolate_coordinates_bcs)]).reshape(3 * count, 3)
+        # Экстраполированная скорость, одна на каждую тройку координат
+        velocities_bcs = np.repeat([trace.velocities_data.extrapolate_velocities_bcs for trace in traces], 3, axis=0)
+        # Дисперсии координат в БСК в том же порядке, что и координаты
+        variances_bcs = np.array([variances for trace in traces for variances in (
+            trace.variance_bcs_data.variance_measure_coordinates,
+            trace.variance_bcs_data.variance_estimate_coordinates,
+            trace.variance_bcs_data.variance_extrapolate_coordinates)]).reshape(3 * count, 3)
+
+        # Расчёт координат и скоростей в декартовой прямоугольной МЗСК МФР
+        position_antenna_data = self.surveillance_data.position_antenna_data
+        coordinates_dec, velocities_dec = position_antenna_data.bcs2dec_array(coordinates_bcs, velocities_bcs)
         # Расчёт ковариационных матриц в декартовой прямоугольной МЗСК МФР
-        trace.calculate_dec_covariance_matrix(bsc2dec_for_matrix)
+        covariance_matrices = position_antenna_data.calc_dec_covariance_matrix_from_bcs_array(variances_bcs,
+                                                                                              coordinates_bcs)
+
+        if residuals_list is None:
+            residuals_list = [self.residuals] * count
+
+        for index, (trace, residuals) in enumerate(zip(traces, residuals_list)):
+            # Запись координат и скоростей, c учетом поправок
+            meas_coord, est_coord, ext_coord = coordinates_dec[3 * index: 3 * index + 3]
+            trace.update_dec_coord_and_vel(meas_coord, est_coord, ext_coord, velocities_dec[3 * index], residuals)
+            # Запись ковариационных матриц измеренных, оцененных и экстраполированных координат
+            trace.update_dec_covariance_matrix(*covariance_matrices[3 * index: 3 * index + 3])
 
     def update_source_traces(self) -> None:
         """Обновление данных трасс источника, которыми пользуется ПБУ
 
         :return: None
         """
-        for trace in self.trace_list:
+        for trace in self.trace_dict.values():
             # В зависимости от темпа сопровождения
             if not self.tick % trace.frame_tick:
                 trace.update_source_trace()
@@ -188,9 +338,9 @@ class MultiFunctionalRadar:
         :return: None
         """
         # Цикл по всем трассам
-        for trace in self.trace_list:
+        for trace in self.trace_dict.values():
             # В зависимости от темпа сопровождения
             if not self.tick % trace.frame_tick:
                 # Хотим регистрировать следующее:
-                registration_row = [self.tick, self.number, self.is_adjustment, *trace.target.registration, *trace.source_trace.registration]
+                registration_row = (self.tick, self.number, self.is_adjustment, *trace.target.registration, *trace.source_trace.registration)
                 self.registration.append(registration_row)
@@ -0,0 +1,120 @@
+import numpy as np
+
+from multi_functional_radar import MultiFunctionalRadar
+
+
+class MultiFunctionalRadarGroup:
+    """Класс группы копий одного МФР из разных реализаций моделирования.
+    Цели во всех реализациях одни и те же, различается только шум измерений, поэтому измерение, фильтрация
+    и пересчёт в МЗСК МФР всех копий выполняются одним вызовом на общем банке фильтров.
+    Каждая копия остаётся отдельным МФР своей реализации: у неё свои трассы, поправки, шум и регистрация"""
+    __slots__ = ("mfr_list",
+                 "profiler")
+
+    def __init__(self, mfr_list: list) -> None:
+        """Переносит фильтры трасс всех копий в банк фильтров первой копии.
+        Копии должны быть только что созданы (ещё не работали), иначе состояние фильтров будет потеряно
+
+        :param mfr_list: Копии одного МФР из разных реализаций
+        :type mfr_list: list
+        """
+        # Копии МФР, первая копия ведёт общий банк фильтров
+        self.mfr_list = mfr_list
+        filter_bank = mfr_list[0].filter_bank
+        for mfr in mfr_list[1:]:
+            for trace in mfr.trace_dict.values():
+                trace.filter_row = filter_bank.append(trace.frame_time, trace.manoeuvre_overload)
+            mfr.filter_bank = filter_bank
+        # Профилировщик этапов работы всех копий (StageProfiler), по умолчанию профилирование выключено
+        self.profiler = None
+
+    def __repr__(self) -> str:
+        return f"Группа из {len(self.mfr_list)!r} копий МФР с номером {self.leader.number!r}. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def __len__(self) -> int:
+        return len(self.mfr_list)
+
+    @property
+    def leader(self) -> MultiFunctionalRadar:
+        """
+        :return: Копия МФР, через которую выполняются общие вычисления
+        :rtype: MultiFunctionalRadar
+        """
+        return self.mfr_list[0]
+
+    def operate(self, ticks: int) -> None:
+        """Основной алгоритм работы, повторяет MultiFunctionalRadar.operate для всех копий сразу
+
+        :param ticks: Текущее время в тиках
+        :type ticks: int
+
+        :return: None
+        """
+        for mfr in self.mfr_list:
+            # Текущее время в тиках
+            mfr.tick = ticks - mfr.start_tick
+        if self.leader.tick >= 0 and self.profiler is None:
+            # Добавление или удаление трасс из состава трасс МФР
+            self.update_trace_list()
+            # Сопровождение целей всех копий: измерение, фильтрация, пересчёт в МЗСК МФР
+            self.tracking()
+            # Формирование сообщений на ПБУ
+            self.update_source_traces()
+            # Регистрация нужных переменных
+            self.register()
+        elif self.leader.tick >= 0:
+            # Те же этапы с измерением времени, размер - число трасс всех копий
+            trace_count = sum(len(mfr.trace_dict) for mfr in self.mfr_list)
+            self.profiler.run("mfr.update_trace_list", self.update_trace_list,
+                              size=len(self.leader.target_list) * len(self.mfr_list))
+            self.profiler.run("mfr.tracking", self.tracking, size=trace_count)
+            self.profiler.run("mfr.update_source_traces", self.update_source_traces, size=trace_count)
+            self.profiler.run("mfr.register", self.register, size=trace_count)
+
+    def update_trace_list(self) -> None:
+        """Обновление массивов трасс всех копий
+
+        :return: None
+        """
+        for mfr in self.mfr_list:
+            mfr.update_trace_list()
+
+    def update_source_traces(self) -> None:
+        """Обновление трасс источника всех копий
+
+        :return: None
+        """
+        for mfr in self.mfr_list:
+            mfr.update_source_traces()
+
+    def register(self) -> None:
+        """Регистрация работы всех копий
+
+        :return: None
+        """
+        for mfr in self.mfr_list:
+            mfr.register()
+
+    def tracking(self) -> None:
+        """Алгоритм сопровождения для трасс всех копий. Шум измерений каждая копия берёт у своего поставщика шума,
+        поэтому результат каждой копии совпадает с результатом отдельного МФР с тем же зерном
+
+        :return: None
+        """
+        traces = []
+        standard_normals = []
+        residuals_list = []
+        for mfr in self.mfr_list:
+            mfr_traces = mfr.get_due_traces()
+            traces.extend(mfr_traces)
+            standard_normals.append(mfr.noise_provider.take(len(mfr_traces)))
+            residuals_list.extend([mfr.residuals] * len(mfr_traces))
+        if not traces:
+            return
+        # Измерение
+        self.leader.create_measurements(traces, np.concatenate(standard_normals))
+        # Фильтрация всех трасс одним шагом общего банка фильтров
+        self.leader.filtrate(traces)
+        # Пересчёт в декартовые координаты
+        self.leader.calculate_traces_to_dec(traces, residuals_list)
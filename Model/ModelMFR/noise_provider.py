@@ -0,0 +1,63 @@
+import numpy as np
+from numpy import ndarray
+from numpy.random import Generator
+
+
+class NoiseProvider:
+    """Поставщик стандартных нормальных случайных величин для ошибок измерений МФР.
+    Величины генерируются большими блоками одним вызовом генератора и выдаются тройками (по одной на трассу),
+    при исчерпании блока генерируется следующий. Последовательность зависит только от генератора,
+    а не от того, по сколько троек их запрашивают"""
+    __slots__ = ("generator",
+                 "block_size",
+                 "block",
+                 "position")
+
+    def __init__(self, generator: Generator, block_size: int = 4096) -> None:
+        """
+        :param generator: Генератор случайных чисел МФР
+        :type generator: Generator
+        :param block_size: Число троек в одном блоке
+        :type block_size: int
+        """
+        # Генератор случайных чисел
+        self.generator = generator
+        # Число троек в одном блоке
+        self.block_size = block_size
+        # Текущий блок, генерируется при первом запросе
+        self.block = np.empty((0, 3))
+        # Номер первой невыданной тройки в блоке
+        self.position = 0
+
+    def __repr__(self) -> str:
+        return f"Поставщик шума с блоком из {self.block_size!r} троек, " \
+               f"осталось {len(self.block) - self.position!r}. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def take(self, count: int) -> ndarray:
+        """Выдаёт очередные тройки стандартных нормальных величин
+
+        :param count: Число троек
+        :type count: int
+
+        :return: Массив размера (count, 3)
+        :rtype: ndarray
+        """
+        if self.position + count > len(self.block):
+            self._refill(count)
+        noise = self.block[self.position:self.position + count]
+        self.position += count
+        return noise
+
+    def _refill(self, count: int) -> None:
+        """Генерация нового блока, невыданный остаток старого блока идёт в его начало
+
+        :param count: Число троек, которое нужно выдать сразу после генерации
+        :type count: int
+
+        :return: None
+        """
+        rest = self.block[self.position:]
+        new_block_size = max(self.block_size, count - len(rest))
+        self.block = np.concatenate((rest, self.generator.standard_normal((new_block_size, 3))))
+        self.position = 0
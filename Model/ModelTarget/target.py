@@ -6,7 +6,8 @@ from model_time import time_in_tick
 
 class Target:
     """Класс цели"""
-    __slots__ = ("ticks",
+    __slots__ = ("own_ticks",
+                 "swarm",
                  "number",
                  "coordinates",
                  "velocities",
@@ -44,8 +45,10 @@ class Target:
             is_auto_tracking = {num: False for num in range(1, 4)}
         if is_anj is None:
             is_anj = {num: False for num in range(1, 4)}
-        # Текущее время в тиках
-        self.ticks = 0
+        # Собственное текущее время в тиках (если цель движется сама, а не в группе целей)
+        self.own_ticks = 0
+        # Группа целей, которая двигает цель (если есть, время цели берётся из неё)
+        self.swarm = None
         # Номер цели
         self.number = number
         # Вектор координат на текущий момент
@@ -63,6 +66,28 @@ class Target:
         return f"Цель c номером {self.number!r}, типа {self.type!r}, c координатами {self.coordinates!r}. " \
                f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
 
+    @property
+    def ticks(self) -> int:
+        """
+        :return: Текущее время в тиках: время группы целей, если цель в ней, иначе собственное
+        :rtype: int
+        """
+        return self.own_ticks if self.swarm is None else self.swarm.ticks
+
+    @ticks.setter
+    def ticks(self, ticks: int) -> None:
+        """Устанавливает собственное текущее время цели. Время цели в группе целей задаёт только группа,
+        поэтому запись для неё - ошибка
+
+        :param ticks: Текущее время в тиках
+        :type ticks: int
+
+        :return: None
+        """
+        if self.swarm is not None:
+            raise AttributeError(f"Время цели с номером {self.number!r} задаётся группой целей")
+        self.own_ticks = ticks
+
     def operate(self, ticks: int) -> None:
         """Основной алгоритм работы, цель просто движется и обновляет время
 
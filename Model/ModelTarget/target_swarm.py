@@ -0,0 +1,60 @@
+import numpy as np
+
+from model_time import time_in_tick
+
+
+class TargetSwarm:
+    """Класс группы целей, хранит координаты и скорости всех целей в общих массивах и двигает их за один шаг.
+    Объекты целей остаются представлениями строк этих массивов, поэтому трассы и регистрация работают как прежде.
+    Время целей тоже хранится только в группе, цели читают его по ссылке на группу"""
+    __slots__ = ("ticks",
+                 "step_ticks",
+                 "target_list",
+                 "coordinates",
+                 "velocities")
+
+    def __init__(self, target_list: list) -> None:
+        """Собирает координаты и скорости целей в массивы размера (N, 3)
+        и подменяет векторы каждой цели на соответствующие строки этих массивов, а время - на время группы
+
+        :param target_list: Список целей
+        :type target_list: list
+        """
+        # Текущее время в тиках
+        self.ticks = 0
+        # Время последнего шага в тиках (до первого шага -1, так как шаг в нулевой тик уже сдвигает цели)
+        self.step_ticks = -1
+        # Список целей, порядок целей совпадает с порядком строк в массивах
+        self.target_list = target_list
+        # Массив координат всех целей
+        self.coordinates = np.array([target.coordinates for target in target_list], dtype=float).reshape(-1, 3)
+        # Массив скоростей всех целей
+        self.velocities = np.array([target.velocities for target in target_list], dtype=float).reshape(-1, 3)
+        # Цели теперь ссылаются на строки общих массивов и на время группы
+        for index, target in enumerate(target_list):
+            target.coordinates = self.coordinates[index]
+            target.velocities = self.velocities[index]
+            target.swarm = self
+
+    def __repr__(self) -> str:
+        return f"Группа из {len(self.target_list)!r} целей. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def __len__(self) -> int:
+        return len(self.target_list)
+
+    def operate(self, ticks: int) -> None:
+        """Основной алгоритм работы, все цели движутся за одну векторную операцию.
+        Тики можно пропускать: при равномерном движении цели сразу переносятся на нужный тик
+
+        :param ticks: Текущее время в тиках
+        :type ticks: int
+
+        :return: None
+        """
+        # Число тиков, прошедших с последнего шага
+        elapsed_ticks = ticks - self.step_ticks
+        # Время целей обновляется вместе со временем группы
+        self.ticks = self.step_ticks = ticks
+        # Гипотеза о равномерном прямолинейном движении
+        self.coordinates += self.velocities * (time_in_tick * elapsed_ticks)
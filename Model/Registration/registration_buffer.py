@@ -0,0 +1,121 @@
+"""Модуль содержит буфер регистрации и схемы регистрируемых данных МФР и ПБУ"""
+import numpy as np
+from numpy import ndarray
+
+
+# Элементы ковариационной матрицы в порядке elements_of_covariance_matrix
+_covariance_fields = [("var_x", "f8"), ("var_y", "f8"), ("var_z", "f8"),
+                      ("cov_xy", "f8"), ("cov_xz", "f8"), ("cov_yz", "f8")]
+
+# Схема регистрации МФР: время, номер МФР, признак юстированности, данные цели, данные трассы источника
+# (время МФР ведётся в вещественных тиках)
+MFR_REGISTRATION_DTYPE = np.dtype([("tick", "f8"),
+                                   ("mfr_number", "i8"),
+                                   ("is_adjustment", "?"),
+                                   ("target_x", "f8"), ("target_y", "f8"), ("target_z", "f8"),
+                                   ("target_vx", "f8"), ("target_vy", "f8"), ("target_vz", "f8"),
+                                   ("target_number", "i8"),
+                                   ("x", "f8"), ("y", "f8"), ("z", "f8"),
+                                   ("vx", "f8"), ("vy", "f8"), ("vz", "f8"),
+                                   *_covariance_fields,
+                                   ("is_bearing", "?"),
+                                   ("cta_number", "i8"),
+                                   ("probability_measure", "f8")])
+
+# Схема регистрации ПБУ: время и данные трассы ЕМТ
+CP_REGISTRATION_DTYPE = np.dtype([("tick", "i8"),
+                                  ("cta_number", "i8"),
+                                  ("x", "f8"), ("y", "f8"), ("z", "f8"),
+                                  ("vx", "f8"), ("vy", "f8"), ("vz", "f8"),
+                                  *_covariance_fields,
+                                  ("source_count", "i8")])
+
+
+class RegistrationBuffer:
+    """Буфер регистрации: строки пишутся на место в заранее выделенный структурированный массив,
+    при заполнении массив увеличивается в два раза. Если к буферу подключён приёмник (например, ShardWriter),
+    то вместо увеличения заполненный буфер сбрасывается в приёмник и заполняется заново"""
+    __slots__ = ("data",
+                 "size",
+                 "sink")
+
+    def __init__(self, dtype: np.dtype, capacity: int = 1024) -> None:
+        """
+        :param dtype: Схема регистрируемых данных
+        :type dtype: np.dtype
+        :param capacity: Начальное число строк
+        :type capacity: int
+        """
+        # Структурированный массив под строки регистрации
+        self.data = np.zeros(max(capacity, 1), dtype=dtype)
+        # Число записанных строк
+        self.size = 0
+        # Приёмник сбрасываемых строк (объект с методом write), по умолчанию строки копятся в памяти
+        self.sink = None
+
+    def __repr__(self) -> str:
+        return f"Буфер регистрации на {self.size!r} строк из {len(self.data)!r} выделенных. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return iter(self.array)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        :return: Схема регистрируемых данных
+        :rtype: np.dtype
+        """
+        return self.data.dtype
+
+    @property
+    def array(self) -> ndarray:
+        """
+        :return: Записанные и ещё не сброшенные строки (представление буфера, без копирования)
+        :rtype: ndarray
+        """
+        return self.data[:self.size]
+
+    def append(self, row: tuple) -> None:
+        """Запись одной строки регистрации
+
+        :param row: Значения всех полей схемы по порядку
+        :type row: tuple
+
+        :return: None
+        """
+        if self.size == len(self.data):
+            if self.sink is None:
+                self._grow()
+            else:
+                self.flush()
+        self.data[self.size] = row
+        self.size += 1
+
+    def flush(self) -> None:
+        """Сброс записанных строк в приёмник, после чего буфер заполняется с начала
+
+        :return: None
+        """
+        self.sink.write(self.array)
+        self.size = 0
+
+    def _grow(self) -> None:
+        """Увеличение буфера в два раза
+
+        :return: None
+        """
+        new_data = np.zeros(2 * len(self.data), dtype=self.data.dtype)
+        new_data[:self.size] = self.data[:self.size]
+        self.data = new_data
+
+    def tolist(self) -> list:
+        """Записанные строки в виде списка списков (например, для записи в csv файл)
+
+        :return: Список строк регистрации
+        :rtype: list
+        """
+        return [list(row) for row in self.array.tolist()]
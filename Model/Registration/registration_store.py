@@ -0,0 +1,237 @@
+"""Модуль содержит двоичное хранилище регистрации: таблица хранится в npy файле структурированного массива,
+рядом лежит json файл со схемой. Таблица читается через np.load(mmap_mode="r") без копирования в память"""
+import json
+import struct
+
+import numpy as np
+from numpy import ndarray
+
+from registration_buffer import RegistrationBuffer
+
+
+def join_realizations(buffers: list, realizations: list = None) -> ndarray:
+    """Объединяет регистрацию разных реализаций в одну таблицу с дополнительным столбцом номера реализации
+
+    :param buffers: Буферы регистрации (или их структурированные массивы)
+    :type buffers: list
+    :param realizations: Номер реализации для каждого буфера, по умолчанию - индекс буфера в списке
+    :type realizations: list
+
+    :return: Структурированный массив всех строк с полем realization
+    :rtype: ndarray
+    """
+    arrays = [buffer.array if isinstance(buffer, RegistrationBuffer) else buffer for buffer in buffers]
+    dtype = np.dtype(arrays[0].dtype.descr + [("realization", "i8")])
+    table = np.zeros(sum(len(array) for array in arrays), dtype=dtype)
+    if realizations is None:
+        realizations = range(len(arrays))
+    start = 0
+    for realization, array in zip(realizations, arrays):
+        rows = table[start:start + len(array)]
+        for name in array.dtype.names:
+            rows[name] = array[name]
+        rows["realization"] = realization
+        start += len(array)
+    return table
+
+
+def save_registration(table: ndarray, path: str, metadata: dict = None) -> None:
+    """Записывает таблицу регистрации в path.npy, а её схему в path.json
+
+    :param table: Структурированный массив регистрации
+    :type table: ndarray
+    :param path: Путь к файлам без расширения
+    :type path: str
+    :param metadata: Сведения о моделировании, записываемые в схему (например, зерно генератора)
+    :type metadata: dict
+
+    :return: None
+    """
+    np.save(f"{path}.npy", table, allow_pickle=False)
+    save_schema(table.dtype, len(table), path, metadata)
+
+
+def save_schema(dtype: np.dtype, rows: int, path: str, metadata: dict = None) -> None:
+    """Записывает схему таблицы регистрации в path.json
+
+    :param dtype: Схема регистрируемых данных
+    :type dtype: np.dtype
+    :param rows: Число строк таблицы
+    :type rows: int
+    :param path: Путь к файлам без расширения
+    :type path: str
+    :param metadata: Сведения о моделировании, записываемые в схему (например, зерно генератора)
+    :type metadata: dict
+
+    :return: None
+    """
+    schema = {"rows": rows,
+              "fields": [[name, dtype[name].str] for name in dtype.names],
+              "metadata": {} if metadata is None else metadata}
+    with open(f"{path}.json", "w") as json_file:
+        json.dump(schema, json_file, indent=4)
+
+
+def load_schema(path: str) -> dict:
+    """Читает схему таблицы регистрации, записанную save_schema
+
+    :param path: Путь к файлам без расширения
+    :type path: str
+
+    :return: Схема: число строк, поля и сведения о моделировании
+    :rtype: dict
+    """
+    with open(f"{path}.json") as json_file:
+        return json.load(json_file)
+
+
+def load_registration(path: str, mmap_mode: str = "r") -> ndarray:
+    """Читает таблицу регистрации, записанную save_registration, и сверяет её со схемой
+
+    :param path: Путь к файлам без расширения
+    :type path: str
+    :param mmap_mode: Режим отображения файла в память (None - чтение файла целиком)
+    :type mmap_mode: str
+
+    :return: Структурированный массив регистрации
+    :rtype: ndarray
+    """
+    schema = load_schema(path)
+    table = np.load(f"{path}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+    fields = [[name, table.dtype[name].str] for name in table.dtype.names]
+    if fields != schema["fields"] or len(table) != schema["rows"]:
+        raise ValueError(f"Таблица {path}.npy не соответствует схеме {path}.json")
+    return table
+
+
+def merge_shards(shard_paths: list, realizations: list, path: str, metadata: dict = None) -> None:
+    """Собирает файлы частей регистрации отдельных реализаций в одну таблицу path.npy со схемой path.json.
+    Части читаются через отображение в память, поэтому таблица целиком в памяти не собирается
+
+    :param shard_paths: Пути к npy файлам частей
+    :type shard_paths: list
+    :param realizations: Номер реализации для каждой части
+    :type realizations: list
+    :param path: Путь к файлам таблицы без расширения
+    :type path: str
+    :param metadata: Сведения о моделировании, записываемые в схему (например, зерно генератора)
+    :type metadata: dict
+
+    :return: None
+    """
+    shards = [np.load(shard_path, mmap_mode="r", allow_pickle=False) for shard_path in shard_paths]
+    dtype = np.dtype(shards[0].dtype.descr + [("realization", "i8")])
+    rows = sum(len(shard) for shard in shards)
+    # Отображение в память пустого файла невозможно
+    if not rows:
+        save_registration(np.zeros(0, dtype=dtype), path, metadata)
+        return
+    table = np.lib.format.open_memmap(f"{path}.npy", mode="w+", dtype=dtype, shape=(rows,))
+    start = 0
+    for realization, shard in zip(realizations, shards):
+        part = table[start:start + len(shard)]
+        for name in shard.dtype.names:
+            part[name] = shard[name]
+        part["realization"] = realization
+        start += len(shard)
+    table.flush()
+    del table
+    save_schema(dtype, rows, path, metadata)
+
+
+class ShardWriter:
+    """Потоковая запись части регистрации одной реализации в npy файл.
+    Заголовок файла имеет фиксированный размер: при открытии пишется с нулём строк,
+    а при закрытии переписывается с итоговым числом строк"""
+    __slots__ = ("path",
+                 "dtype",
+                 "rows",
+                 "header_size",
+                 "file")
+
+    # Наибольшее число цифр в числе строк, под которое резервируется заголовок
+    max_rows_digits = 20
+
+    def __init__(self, path: str, dtype: np.dtype) -> None:
+        """
+        :param path: Путь к npy файлу
+        :type path: str
+        :param dtype: Схема регистрируемых данных
+        :type dtype: np.dtype
+        """
+        # Путь к файлу
+        self.path = path
+        # Схема регистрируемых данных
+        self.dtype = np.dtype(dtype)
+        # Число записанных строк
+        self.rows = 0
+        # Размер заголовка без магической строки и длины, считается один раз по наибольшему числу строк
+        self.header_size = self.calc_header_size(self.dtype)
+        # Файл открыт до вызова close
+        self.file = open(path, "wb")
+        self.file.write(self.header)
+
+    def __repr__(self) -> str:
+        return f"Запись части регистрации в файл {self.path!r}, записано {self.rows!r} строк. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    @staticmethod
+    def make_header_text(dtype: np.dtype, rows: str) -> str:
+        """Текст заголовка npy файла версии 1.0 без дополнения пробелами
+
+        :param dtype: Схема регистрируемых данных
+        :type dtype: np.dtype
+        :param rows: Число строк в виде строки
+        :type rows: str
+
+        :return: Текст заголовка
+        :rtype: str
+        """
+        return f"{{'descr': {np.lib.format.dtype_to_descr(dtype)!r}, 'fortran_order': False, 'shape': ({rows},), }}"
+
+    @classmethod
+    def calc_header_size(cls, dtype: np.dtype) -> int:
+        """Размер заголовка для наибольшего числа строк, чтобы вместе с магической строкой и длиной
+        он был кратен 64 байтам
+
+        :param dtype: Схема регистрируемых данных
+        :type dtype: np.dtype
+
+        :return: Размер заголовка вместе с завершающим переводом строки
+        :rtype: int
+        """
+        header = cls.make_header_text(dtype, "9" * cls.max_rows_digits)
+        # Магическая строка с версией и два байта длины заголовка
+        preamble_size = len(np.lib.format.magic(1, 0)) + 2
+        return -(-(preamble_size + len(header) + 1) // 64) * 64 - preamble_size
+
+    @property
+    def header(self) -> bytes:
+        """Заголовок npy файла версии 1.0 с текущим числом строк, дополненный пробелами до размера,
+        посчитанного при открытии файла
+
+        :return: Заголовок файла
+        :rtype: bytes
+        """
+        header = self.make_header_text(self.dtype, str(self.rows)).ljust(self.header_size - 1) + "\n"
+        return np.lib.format.magic(1, 0) + struct.pack("<H", self.header_size) + header.encode("latin1")
+
+    def write(self, array: ndarray) -> None:
+        """Дописывает строки в конец файла
+
+        :param array: Структурированный массив строк той же схемы
+        :type array: ndarray
+
+        :return: None
+        """
+        self.file.write(np.ascontiguousarray(array, dtype=self.dtype).tobytes())
+        self.rows += len(array)
+
+    def close(self) -> None:
+        """Переписывает заголовок с итоговым числом строк и закрывает файл
+
+        :return: None
+        """
+        self.file.seek(0)
+        self.file.write(self.header)
+        self.file.close()
@@ -0,0 +1,97 @@
+"""Модуль содержит необязательный сбор времени работы этапов МФР и ПБУ.
+Объекты моделирования хранят ссылку на профилировщик, по умолчанию None: тогда этапы вызываются как обычно,
+и профилирование ничего не стоит"""
+from time import perf_counter
+
+
+class StageProfiler:
+    """Профилировщик этапов: для каждого этапа копит число вызовов, суммарное и наибольшее время одного вызова
+    и суммарный размер обрабатываемых данных (число трасс, число пар при отождествлении и т.п.)"""
+    __slots__ = ("stages",)
+
+    def __init__(self) -> None:
+        # Словарь: имя этапа - [число вызовов, суммарное время, наибольшее время, суммарный размер]
+        self.stages = {}
+
+    def __repr__(self) -> str:
+        return f"Профилировщик {len(self.stages)!r} этапов. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def run(self, name: str, func, *args, size=0) -> None:
+        """Вызов этапа с измерением времени
+
+        :param name: Имя этапа
+        :type name: str
+        :param func: Функция этапа
+        :param args: Аргументы функции
+        :param size: Размер обрабатываемых данных или функция без аргументов, которая возвращает его после этапа
+        (для этапов, которые сами формируют свои данные)
+
+        :return: None
+        """
+        starting_time = perf_counter()
+        func(*args)
+        elapsed_time = perf_counter() - starting_time
+        self.add(name, elapsed_time, size() if callable(size) else size)
+
+    def add(self, name: str, elapsed_time: float, size: int = 0) -> None:
+        """Учёт одного вызова этапа
+
+        :param name: Имя этапа
+        :type name: str
+        :param elapsed_time: Время вызова в секундах
+        :type elapsed_time: float
+        :param size: Размер обрабатываемых данных
+        :type size: int
+
+        :return: None
+        """
+        stage = self.stages.setdefault(name, [0, 0., 0., 0])
+        stage[0] += 1
+        stage[1] += elapsed_time
+        stage[2] = max(stage[2], elapsed_time)
+        stage[3] += size
+
+    def merge(self, other: "StageProfiler") -> None:
+        """Добавление статистики другого профилировщика (например, из другого процесса пула)
+
+        :param other: Другой профилировщик
+        :type other: StageProfiler
+
+        :return: None
+        """
+        for name, (calls, total_time, max_time, total_size) in other.stages.items():
+            stage = self.stages.setdefault(name, [0, 0., 0., 0])
+            stage[0] += calls
+            stage[1] += total_time
+            stage[2] = max(stage[2], max_time)
+            stage[3] += total_size
+
+    @classmethod
+    def merged(cls, profilers: list) -> "StageProfiler":
+        """
+        :param profilers: Профилировщики (None пропускаются)
+        :type profilers: list
+
+        :return: Профилировщик с объединённой статистикой
+        :rtype: StageProfiler
+        """
+        profiler = cls()
+        for other in profilers:
+            if other is not None:
+                profiler.merge(other)
+        return profiler
+
+    def report(self) -> dict:
+        """Отчёт по этапам, этапы упорядочены по убыванию суммарного времени
+
+        :return: Словарь: имя этапа - словарь со статистикой
+        :rtype: dict
+        """
+        stages = sorted(self.stages.items(), key=lambda item: item[1][1], reverse=True)
+        return {name: {"calls": calls,
+                       "total_time": total_time,
+                       "mean_time": total_time / calls,
+                       "max_time": max_time,
+                       "mean_size": total_size / calls}
+                for name, (calls, total_time, max_time, total_size) in stages}
@@ -6,6 +6,7 @@ import numpy as np
 from calc_covariance_matrix import calc_dec_derivative_matrix, calc_sph_derivative_matrix
 from calc_covariance_matrix import calc_derivative_r, calc_derivative_beta, calc_derivative_eps
 from calc_covariance_matrix import sph2dec_cov_matrix, dec2sph_cov_matrix, elements_of_covariance_matrix
+from calc_covariance_matrix import sph2dec_cov_matrix_array, dec2sph_cov_matrix_array
 from coordinate_system_math import dec2sph
 
 
@@ -55,6 +56,33 @@ class TestCalcCovarianceMatrix(TestCase):
         self.assertEqual(real_covariance_matrix_sph, covariance_matrix_sph, "После последовательного пересчета "
                                                                             "получились разные ковариационные матрицы")
 
+    def test_dec2sph_and_sph2dec_cov_matrix_array(self) -> None:
+        """Проверка пересчётов набора ковариационных матриц, результат должен совпадать с пересчётом каждой матрицы
+
+        :return: None
+        """
+        # Определим нужные для функции данные
+        coordinates_dec = np.array([[4_000., 5_000., 3_000.], [-10_000., 200., 7_000.]])
+        coordinates_sph = np.array([dec2sph(coordinate_dec) for coordinate_dec in coordinates_dec])
+        covariance_matrices_sph = np.array([np.diag([25, 0.01, 1]), np.diag([4, 0.0001, 0.0004])])
+
+        # Применяем последовательно тестируемые функции
+        covariance_matrices_dec = sph2dec_cov_matrix_array(covariance_matrices_sph, coordinates_sph)
+        covariance_matrices = dec2sph_cov_matrix_array(covariance_matrices_dec, coordinates_dec)
+
+        for index in range(len(coordinates_dec)):
+            # Проверка совпадения с пересчётом одной матрицы
+            real_covariance_matrix_dec = sph2dec_cov_matrix(covariance_matrices_sph[index], coordinates_sph[index])
+            self.assertTrue(np.allclose(real_covariance_matrix_dec, covariance_matrices_dec[index]),
+                            "Ковариационные матрицы в декартовых координатах не совпадают")
+            real_covariance_matrix_sph = dec2sph_cov_matrix(covariance_matrices_dec[index], coordinates_dec[index])
+            self.assertTrue(np.allclose(real_covariance_matrix_sph, covariance_matrices[index]),
+                            "Ковариационные матрицы в сферических координатах не совпадают")
+
+        # Проверка для ковариационных матриц после последовательного пересчёта
+        self.assertTrue(np.allclose(covariance_matrices_sph, covariance_matrices),
+                        "После последовательного пересчета получились разные ковариационные матрицы")
+
     def test_calc_derivative_r(self) -> None:
         """Проверка расчёта производной по дальности
 
@@ -3,7 +3,7 @@ from unittest import TestCase
 
 import numpy as np
 
-from coordinate_system_math import dec2sph, sph2dec
+from coordinate_system_math import dec2sph, dec2sph_array, sph2dec
 
 
 class TestCoordinateSystemMath(TestCase):
@@ -55,3 +55,23 @@ class TestCoordinateSystemMath(TestCase):
         coordinate_dec = coordinate_dec.round(7).tolist()
         real_coordinate_dec = [1565., 5650., 4540.]
         self.assertEqual(real_coordinate_dec, coordinate_dec, "После последовательного пересчета координаты изменились")
+
+    def test_dec2sph_array(self) -> None:
+        """Проверка пересчёта массива векторов, результат должен совпадать с пересчётом каждого вектора
+
+        :return: None
+        """
+        # Определим нужные для функции данные
+        coordinates_dec = np.array([[1565., 5650., 4540.], [-10_000., 200., -7_000.], [0., -300., 5.]])
+
+        # Оценка с помощью тестируемой функции
+        coordinates_sph = dec2sph_array(coordinates_dec)
+
+        # Проверка для размера массива
+        self.assertEqual((3, 3), coordinates_sph.shape, "Размер массива сферических координат неверен")
+
+        # Проверка совпадения с пересчётом одного вектора
+        for coordinate_dec, coordinate_sph in zip(coordinates_dec, coordinates_sph):
+            real_coordinate_sph = dec2sph(coordinate_dec)
+            self.assertTrue(np.allclose(real_coordinate_sph, coordinate_sph, rtol=1e-14),
+                            "Неверный расчёт координат в сферической СК")
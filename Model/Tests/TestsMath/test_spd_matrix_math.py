@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+import numpy as np
+from numpy.linalg import inv
+
+from spd_matrix_math import mahalanobis_distance_3x3, mahalanobis_distance_3x3_array
+from spd_matrix_math import right_divide_spd_3x3, right_divide_spd_3x3_array
+
+
+class TestSPDMatrixMath(TestCase):
+    def setUp(self) -> None:
+        """Набор симметричных положительно определённых матриц, среди них почти вырожденная матрица пеленга
+
+        :return: None
+        """
+        generator = np.random.default_rng(1)
+        factors = generator.normal(size=(4, 3, 3))
+        self.matrices = factors @ factors.transpose(0, 2, 1) + 0.01 * np.eye(3)
+        # Матрица пеленга: по дальности ошибка почти нулевая
+        self.matrices[3] = np.diag([1e-6, 2_500., 2_500.])
+        self.vectors = generator.normal(size=(4, 3))
+
+    def test_right_divide_spd_3x3(self) -> None:
+        """Проверка деления справа на матрицу
+
+        :return: None
+        """
+        matrix, first_numerator, second_numerator = self.matrices[:3]
+        quotients = right_divide_spd_3x3(matrix, first_numerator, second_numerator)
+        real_quotients = [first_numerator @ inv(matrix), second_numerator @ inv(matrix)]
+        self.assertTrue(np.allclose(real_quotients, quotients, rtol=1e-10), "Частные неверны")
+
+        # Проверка для набора матриц
+        quotients = right_divide_spd_3x3_array(self.matrices, self.matrices[::-1])
+        real_quotients = [self.matrices[::-1] @ inv(self.matrices)]
+        self.assertTrue(np.allclose(real_quotients, quotients, rtol=1e-10), "Частные неверны")
+
+    def test_right_divide_spd_3x3_not_positive_definite(self) -> None:
+        """Проверка деления справа на матрицы, которые не являются положительно определёнными
+
+        :return: None
+        """
+        matrix = np.array([[1., 2., 0.],
+                           [2., 1., 0.],
+                           [0., 0., 1.]])
+        numerator = self.matrices[0]
+        quotient, = right_divide_spd_3x3(matrix, numerator)
+        self.assertTrue(np.allclose(numerator @ inv(matrix), quotient), "Частное неверно")
+
+        # Проверка для набора, в котором одна матрица не положительно определена
+        matrices = self.matrices.copy()
+        matrices[1] = matrix
+        quotients = right_divide_spd_3x3_array(matrices, self.matrices[::-1])
+        real_quotients = [self.matrices[::-1] @ inv(matrices)]
+        self.assertTrue(np.allclose(real_quotients, quotients, rtol=1e-10), "Частные неверны")
+
+    def test_mahalanobis_distance_3x3(self) -> None:
+        """Проверка расчёта обобщённого расстояния
+
+        :return: None
+        """
+        real_distances = [vector @ inv(matrix) @ vector for matrix, vector in zip(self.matrices, self.vectors)]
+        distances = [mahalanobis_distance_3x3(matrix, vector) for matrix, vector in zip(self.matrices, self.vectors)]
+        self.assertTrue(np.allclose(real_distances, distances, rtol=1e-10), "Обобщённые расстояния неверны")
+
+        # Проверка для набора матриц
+        distances = mahalanobis_distance_3x3_array(self.matrices, self.vectors)
+        self.assertTrue(np.allclose(real_distances, distances, rtol=1e-10), "Обобщённые расстояния неверны")
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from tick_scheduler import TickScheduler
+
+
+class TestTickScheduler(TestCase):
+    def setUp(self) -> None:
+        """Планировщик с темпами работы трасс АС, ТС и ПБУ
+
+        :return: None
+        """
+        self.tick_scheduler = TickScheduler([(0, 2), (0, 20), (0, 20)])
+
+    def test___init__(self) -> None:
+        """Проверка удаления повторов из расписания
+
+        :return: None
+        """
+        schedule = self.tick_scheduler.schedule
+        real_schedule = [(0, 2), (0, 20)]
+        self.assertEqual(real_schedule, schedule, "Расписание задано неверно")
+
+    def test_next_tick(self) -> None:
+        """Проверка расчёта следующего тика с работой
+
+        :return: None
+        """
+        tick_scheduler = TickScheduler([(0, 20), (5, 7)])
+
+        # Проверка для первого тика
+        self.assertEqual(0, tick_scheduler.next_tick(-1), "Первый тик определён неверно")
+        # До старта второго объекта работает только первый
+        self.assertEqual(5, tick_scheduler.next_tick(0), "Следующий тик определён неверно")
+        # После старта учитываются оба периода
+        self.assertEqual(12, tick_scheduler.next_tick(5), "Следующий тик определён неверно")
+        self.assertEqual(19, tick_scheduler.next_tick(12), "Следующий тик определён неверно")
+        self.assertEqual(20, tick_scheduler.next_tick(19), "Следующий тик определён неверно")
+
+    def test_next_tick_with_empty_schedule(self) -> None:
+        """Проверка пустого расписания
+
+        :return: None
+        """
+        tick_scheduler = TickScheduler([])
+        self.assertEqual(-1, tick_scheduler.next_tick(10), "Следующий тик определён неверно")
+        self.assertEqual([], list(tick_scheduler.due_ticks(100)), "Список тиков определён неверно")
+
+    def test_due_ticks(self) -> None:
+        """Проверка генерации тиков с работой, результат должен совпадать с перебором всех тиков
+
+        :return: None
+        """
+        due_ticks = list(self.tick_scheduler.due_ticks(100))
+        real_due_ticks = [tick for tick in range(100) if not tick % 2 or not tick % 20]
+        self.assertEqual(real_due_ticks, due_ticks, "Тики с работой определены неверно")
+
+        # Только трассы ТС и ПБУ
+        due_ticks = list(TickScheduler([(0, 20)]).due_ticks(100))
+        real_due_ticks = [0, 20, 40, 60, 80]
+        self.assertEqual(real_due_ticks, due_ticks, "Тики с работой определены неверно")
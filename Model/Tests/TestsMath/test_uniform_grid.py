@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+import numpy as np
+
+from uniform_grid import UniformGrid
+
+
+class TestUniformGrid(TestCase):
+    def setUp(self) -> None:
+        """Сетка по случайным точкам в кубе со стороной 100 км
+
+        :return: None
+        """
+        self.points = np.random.RandomState(5).uniform(0., 100_000., (500, 3))
+        self.uniform_grid = UniformGrid(self.points, cell_size=2_000.)
+
+    def test___init__(self) -> None:
+        """Проверка раскладки точек по ячейкам
+
+        :return: None
+        """
+        # Проверка, что все точки попали в сетку
+        indexes = sorted(index for indexes in self.uniform_grid.cells.values() for index in indexes)
+        real_indexes = list(range(500))
+        self.assertEqual(real_indexes, indexes, "Точки разложены по ячейкам неверно")
+
+        # Проверка замены неположительного размера ячейки
+        cell_size = UniformGrid(self.points, cell_size=0.).cell_size
+        real_cell_size = 1.
+        self.assertEqual(real_cell_size, cell_size, "Размер ячейки задан неверно")
+
+    def test_query(self) -> None:
+        """Поиск должен вернуть все точки в шаре (и, возможно, лишние)
+
+        :return: None
+        """
+        for radius in [500., 2_000., 30_000.]:
+            for point in self.points[:20]:
+                # Вызов тестируемой функции
+                candidates = set(self.uniform_grid.query(point, radius))
+
+                # Проверка, что ни одна точка из шара не потеряна
+                distances = np.linalg.norm(self.points - point, axis=1)
+                real_indexes = set(np.flatnonzero(distances <= radius).tolist())
+                self.assertTrue(real_indexes <= candidates, "Потеряны точки из шара")
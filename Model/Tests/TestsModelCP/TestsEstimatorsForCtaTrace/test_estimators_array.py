@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+import numpy as np
+
+from calc_covariance_matrix import sph2dec_cov_matrix
+from coordinate_system_math import dec2sph, sph2dec
+from estimator_one_bearing_and_other_not_bearing_traces import EstimatorOneBearingAndOtherNotBearingTraces
+from estimator_only_head_source_trace import EstimatorOnlyHeadSourceTrace
+from estimator_two_bearing_traces import EstimatorTwoBearingTraces
+from estimator_two_not_bearing_traces import EstimatorTwoNotBearingTraces
+from estimators_fabric import EstimatorsFabric
+from source_trace import SourceTrace
+
+
+class TestEstimatorsArray(TestCase):
+    def setUp(self) -> None:
+        """Генератор случайных чисел для измерений трасс
+
+        :return: None
+        """
+        self.generator = np.random.default_rng(1)
+
+    def measure_trace(self, mfr_position: np.ndarray, coordinates: np.ndarray, is_bearing: bool) -> SourceTrace:
+        """Создание трассы источника по зашумлённому измерению цели
+
+        :param mfr_position: Координаты МФР
+        :type mfr_position: np.ndarray
+        :param coordinates: Истинные координаты цели
+        :type coordinates: np.ndarray
+        :param is_bearing: Признак пеленга
+        :type is_bearing: bool
+
+        :return: Трасса источника
+        :rtype: SourceTrace
+        """
+        # У пеленга дальность не измеряется
+        sigma = np.array([0. if is_bearing else 10., 0.0029, 0.0029])
+        sph_coordinates = self.generator.normal(dec2sph(coordinates - mfr_position), sigma)
+        trace = SourceTrace(mfr_position=mfr_position)
+        trace.is_bearing = is_bearing
+        trace.coordinates = sph2dec(sph_coordinates) + mfr_position
+        trace.velocities = self.generator.normal(0., 100., 3)
+        trace.coordinate_covariance_matrix = sph2dec_cov_matrix(np.diag(sigma ** 2) + np.diag([0., 1e-8, 1e-8]),
+                                                                sph_coordinates)
+        return trace
+
+    def generate_source_trace_lists(self, count: int, first_is_bearing: bool, second_is_bearing: bool) -> list:
+        """Создание списков трасс источников для группы трасс ЕМТ
+
+        :param count: Число трасс ЕМТ
+        :type count: int
+        :param first_is_bearing: Признак пеленга у трассы головного источника
+        :type first_is_bearing: bool
+        :param second_is_bearing: Признак пеленга у трассы дополнительного источника
+        :type second_is_bearing: bool
+
+        :return: Списки трасс источников
+        :rtype: list
+        """
+        source_trace_lists = []
+        for _ in range(count):
+            coordinates = self.generator.uniform([10_000., 1_000., -30_000.], [50_000., 10_000., 30_000.])
+            source_trace_lists.append([self.measure_trace(np.array([0., 0., -5_000.]), coordinates, first_is_bearing),
+                                       self.measure_trace(np.array([0., 0., 5_000.]), coordinates, second_is_bearing)])
+        return source_trace_lists
+
+    def assert_array_estimator(self, estimator_class: type, source_trace_lists: list) -> None:
+        """Сравнение оценок группы трасс ЕМТ с оценками каждой трассы ЕМТ отдельно
+
+        :param estimator_class: Ожидаемый вид оценивателя
+        :type estimator_class: type
+        :param source_trace_lists: Списки трасс источников
+        :type source_trace_lists: list
+
+        :return: None
+        """
+        array_estimator = EstimatorsFabric.generate_array(estimator_class, source_trace_lists)
+        for index, source_trace_list in enumerate(source_trace_lists):
+            estimator = EstimatorsFabric.generate(source_trace_list)
+            self.assertEqual(estimator_class, type(estimator), "Тип оценивателя неверен")
+            # Координаты считаются первыми, как в трассе ЕМТ
+            self.assertTrue(np.allclose(estimator.coordinates, array_estimator.coordinates[index], rtol=1e-9),
+                            "Координаты не совпадают")
+            self.assertTrue(np.allclose(estimator.velocities, array_estimator.velocities[index], rtol=1e-9),
+                            "Скорости не совпадают")
+            self.assertTrue(np.allclose(estimator.coordinates_covariance_matrix,
+                                        array_estimator.coordinates_covariance_matrix[index], rtol=1e-6),
+                            "Ковариационные матрицы не совпадают")
+
+    def test_generate_array(self) -> None:
+        """Проверка оценивателей для группы трасс ЕМТ для всех 4 случаев
+
+        :return: None
+        """
+        # Проверка для случая, когда есть только трасса головного источника
+        source_trace_lists = [source_traces[:1] for source_traces in self.generate_source_trace_lists(5, False, False)]
+        self.assert_array_estimator(EstimatorOnlyHeadSourceTrace, source_trace_lists)
+
+        # Проверка для случая, когда две чистые трассы
+        self.assert_array_estimator(EstimatorTwoNotBearingTraces, self.generate_source_trace_lists(5, False, False))
+
+        # Проверка для случая, когда две трассы по постановщикам АШП
+        self.assert_array_estimator(EstimatorTwoBearingTraces, self.generate_source_trace_lists(5, True, True))
+
+        # Проверка для случая, когда одна трасса по постановщику АШП, а вторая по чистой цели (в любом порядке)
+        self.assert_array_estimator(EstimatorOneBearingAndOtherNotBearingTraces,
+                                    self.generate_source_trace_lists(5, False, True))
+        self.assert_array_estimator(EstimatorOneBearingAndOtherNotBearingTraces,
+                                    self.generate_source_trace_lists(5, True, False))
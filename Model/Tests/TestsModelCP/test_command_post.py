@@ -6,6 +6,7 @@ from command_post import CommandPost
 from cta_trace import CTATrace
 from multi_functional_radar import MultiFunctionalRadar
 from source_trace import SourceTrace
+from stage_profiler import StageProfiler
 from target import Target
 
 
@@ -84,6 +85,34 @@ class TestCommandPost(TestCase):
         second_cta_trace: CTATrace = self.command_post.common_trace_array[1]
         self.assertIsNotNone(second_cta_trace.additional_source_trace_array)
 
+    def test_operate_with_profiler(self) -> None:
+        """Тест основного алгоритма работы с профилированием: размер формируемых массивов берётся после этапа
+
+        :return: None
+        """
+        # Локаторы успевают завязать трассы до первого цикла работы ПБУ
+        for time in range(300):
+            for target in self.target_list:
+                target.operate(time)
+            for radar in self.radar_list:
+                radar.operate(time)
+        profiler = StageProfiler()
+        self.command_post.set_profiler(profiler)
+
+        # Вызов тестируемой функции
+        self.command_post.operate(300)
+
+        # Проверка для размера массива трасс источников
+        source_trace_list_size = profiler.stages["cp.formation_source_trace_list"][3]
+        real_source_trace_list_size = len(self.command_post.source_trace_list)
+        self.assertGreater(real_source_trace_list_size, 0, "Массив трасс источников пуст")
+        self.assertEqual(real_source_trace_list_size, source_trace_list_size, "Размер этапа неверен")
+
+        # Проверка для размера ЕМТ
+        common_trace_array_size = profiler.stages["cp.formation_common_trace_array"][3]
+        real_common_trace_array_size = len(self.command_post.common_trace_array)
+        self.assertEqual(real_common_trace_array_size, common_trace_array_size, "Размер этапа неверен")
+
     def test_analyze_adjustment_when_it_ready(self) -> None:
         """Тест для анализа юстировок, когда они готовы
 
@@ -149,6 +178,6 @@ class TestCommandPost(TestCase):
         self.command_post.register()
 
         # Проверка для регистрации
-        registration = self.command_post.registration
+        registration = self.command_post.registration.tolist()
         real_registration = [[23, 88, 34.0, 323.0, -293.0, 200.0, 23.0, -21.0, 32.0, 34.0, 569.0, 0.0, 0.0, 0.0, 1]]
         self.assertEqual(real_registration, registration, "Регистрация посчитана неверно")
@@ -184,6 +184,7 @@ class TestCommandTraceArray(TestCase):
         self.common_trace_array.append(head_source_trace)
         cta_trace: CTATrace = self.common_trace_array[0]
         cta_trace.additional_source_trace_array.append(another_source_trace)
+        another_source_trace.cta_number = cta_trace.number
 
         # Вызов тестируемой функции
         self.common_trace_array.identification_with_head_source_trace_for_additional_source_trace(another_source_trace)
@@ -205,6 +206,7 @@ class TestCommandTraceArray(TestCase):
         self.common_trace_array.append(head_source_trace)
         cta_trace: CTATrace = self.common_trace_array[0]
         cta_trace.additional_source_trace_array.append(another_source_trace)
+        another_source_trace.cta_number = cta_trace.number
 
         # Вызов тестируемой функции
         self.common_trace_array.identification_with_head_source_trace_for_additional_source_trace(another_source_trace)
@@ -358,42 +360,86 @@ class TestCommandTraceArray(TestCase):
         real_len_cta = 1
         self.assertEqual(real_len_cta, len_cta, "Длина ЕМТ определена неверно")
 
-    def test_update_numbers_in_cta_traces(self) -> None:
-        """Тест обновления номеров в трассах ЕМТ
+    def test_calculate_data_in_cta_traces(self) -> None:
+        """Тест для расчёта оценок в трассах ЕМТ: оценка считается заново на каждом цикле
 
         :return: None
         """
-        # Подготвка данных для функции
-        # Первая трасса ЕМТ
-        first_head_source_trace = SourceTrace(mfr_number=1)
-        self.common_trace_array.append(first_head_source_trace)
-        first_cta_trace: CTATrace = self.common_trace_array[0]
+        # Подготовка данных для функции
+        head_source_trace = SourceTrace(mfr_number=1)
+        head_source_trace.coordinates = np.array([1_000., 2_000., 3_000.])
+        self.common_trace_array.append(head_source_trace)
+        cta_trace: CTATrace = self.common_trace_array[0]
 
-        # Вторая трасса ЕМТ
-        second_head_source_trace = SourceTrace(mfr_number=2)
-        self.common_trace_array.append(second_head_source_trace)
-        second_cta_trace: CTATrace = self.common_trace_array[1]
+        # Проверка для первого расчёта
+        self.common_trace_array.calculate_data_in_cta_traces()
+        coordinates = cta_trace.coordinates.tolist()
+        real_coordinates = [1_000., 2_000., 3_000.]
+        self.assertEqual(real_coordinates, coordinates, "Координаты неверны")
+
+        # Проверка для пересчёта после изменения трассы источника
+        head_source_trace.coordinates = np.array([4_000., 5_000., 6_000.])
+        self.common_trace_array.calculate_data_in_cta_traces()
+        coordinates = cta_trace.coordinates.tolist()
+        real_coordinates = [4_000., 5_000., 6_000.]
+        self.assertEqual(real_coordinates, coordinates, "Оценка не пересчитана после изменения трассы источника")
+
+    def test_allocate_number(self) -> None:
+        """Тест выдачи номеров трасс ЕМТ: номера остальных трасс не меняются при удалении,
+        освободившийся номер выдаётся снова
+
+        :return: None
+        """
+        # Подготвка данных для функции: три трассы ЕМТ
+        head_source_traces = [SourceTrace(mfr_number=number) for number in range(3)]
+        for head_source_trace in head_source_traces:
+            self.common_trace_array.append(head_source_trace)
+        first_cta_trace, second_cta_trace, third_cta_trace = self.common_trace_array
+
+        # Удаление второй трассы ЕМТ
+        self.common_trace_array.remove(second_cta_trace)
+
+        # Проверка для номера третьей трассы ЕМТ и номера в её головном источнике
+        third_cta_trace_num = third_cta_trace.number
+        real_third_cta_trace_num = 2
+        self.assertEqual(real_third_cta_trace_num, third_cta_trace_num, "Номер трассы ЕМТ изменился")
+        third_cta_trace_num_in_source_trace = head_source_traces[2].cta_number
+        self.assertEqual(real_third_cta_trace_num, third_cta_trace_num_in_source_trace, "Номер трассы ЕМТ изменился")
+
+        # Проверка для словаря трасс ЕМТ
+        cta_trace_dict = self.common_trace_array.cta_trace_dict
+        real_cta_trace_dict = {0: first_cta_trace, 2: third_cta_trace}
+        self.assertEqual(real_cta_trace_dict, cta_trace_dict, "Словарь трасс ЕМТ неверен")
 
         # Вызов тестируемой функции
-        self.common_trace_array.update_numbers_in_cta_traces()
+        number = self.common_trace_array.allocate_number()
 
-        # Проверка для номера первой трассы ЕМТ
-        first_cta_trace_num = first_cta_trace.number
-        real_first_cta_trace_num = 0
-        self.assertEqual(real_first_cta_trace_num, first_cta_trace_num, "Номер трассы ЕМТ неверный")
+        # Проверка для повторно выданного номера
+        real_number = 1
+        self.assertEqual(real_number, number, "Освободившийся номер не выдан повторно")
 
-        # Проверка для номера трассы ЕМТ головного источника первой трассы ЕМТ
-        first_cta_trace_num_in_source_trace = first_head_source_trace.cta_number
-        self.assertEqual(real_first_cta_trace_num, first_cta_trace_num_in_source_trace, "Номер трассы ЕМТ неверный")
+    def test_remove_keeps_order(self) -> None:
+        """Тест удаления трассы ЕМТ: порядок остальных трасс не меняется
+
+        :return: None
+        """
+        # Подготвка данных для функции: три трассы ЕМТ
+        for number in range(3):
+            self.common_trace_array.append(SourceTrace(mfr_number=number))
+        first_cta_trace, second_cta_trace, third_cta_trace = self.common_trace_array
+
+        # Вызов тестируемой функции
+        self.common_trace_array.remove(first_cta_trace)
 
-        # Проверка для номера второй трассы ЕМТ
-        second_cta_trace_num = second_cta_trace.number
-        real_second_cta_trace_num = 1
-        self.assertEqual(real_second_cta_trace_num, second_cta_trace_num, "Номер трассы ЕМТ неверный")
+        # Проверка для порядка трасс ЕМТ
+        self.assertEqual([second_cta_trace, third_cta_trace], list(self.common_trace_array), "ЕМТ неверен")
 
-        # Проверка для номера трассы ЕМТ головного источника второй трассы ЕМТ
-        second_cta_trace_num_in_source_trace = second_head_source_trace.cta_number
-        self.assertEqual(real_second_cta_trace_num, second_cta_trace_num_in_source_trace, "Номер трассы ЕМТ неверный")
+        # Проверка для порядка после добавления трассы с освободившимся номером
+        self.common_trace_array.append(SourceTrace(mfr_number=3))
+        fourth_cta_trace = self.common_trace_array[-1]
+        self.assertEqual(0, fourth_cta_trace.number, "Освободившийся номер не выдан повторно")
+        self.assertEqual([second_cta_trace, third_cta_trace, fourth_cta_trace], list(self.common_trace_array),
+                         "ЕМТ неверен")
 
     def test_append(self) -> None:
         """Тест добавления трассы источника как новой трассы ЕМТ
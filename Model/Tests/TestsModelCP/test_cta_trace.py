@@ -165,22 +165,3 @@ class TestCTATrace(TestCase):
 
         self.assertEqual([], self.cta_trace.additional_source_trace_array)
         self.assertIsNone(self.cta_trace.head_source_trace)
-
-    def test_change_numbers(self) -> None:
-        """
-
-        :return: None
-        """
-        add_source_trace = SourceTrace(mfr_number=2, mfr_position=np.array([100., 34., 43.]))
-        self.cta_trace.additional_source_trace_array.append(add_source_trace)
-        changed_num = 89
-
-        self.cta_trace.change_numbers(changed_num)
-
-        self.assertEqual(changed_num, self.cta_trace.number)
-        self.assertEqual(changed_num, self.head_source_trace.cta_number)
-        self.assertEqual(changed_num, add_source_trace.cta_number)
-
-    # TODO: Добавление реализации теста для calculate_self_data
-    def test_calculate_self_data(self):
-        pass
@@ -0,0 +1,148 @@
+from unittest import TestCase
+
+import numpy as np
+
+from common_trace_array import CommonTraceArray
+from identification_engine import IdentificationEngine
+from source_trace import SourceTrace
+
+
+class TestIdentificationEngine(TestCase):
+    @staticmethod
+    def create_source_traces(seed: int) -> list:
+        """Создание трасс источников от трёх МФР по близко расположенным целям, часть трасс - пеленги
+
+        :param seed: Начальное значение генератора случайных чисел
+        :type seed: int
+
+        :return: Список трасс источников
+        :rtype: list
+        """
+        random_generator = np.random.RandomState(seed)
+        source_traces = []
+        for number in range(30):
+            mfr_number = number % 3 + 1
+            trace = SourceTrace(mfr_number=mfr_number,
+                                mfr_position=np.array([mfr_number * 10_000., 0., 0.]),
+                                target_number=number)
+            trace.coordinates = random_generator.uniform(-300., 300., 3) + [50_000., 3_000., 10_000.]
+            trace.coordinate_covariance_matrix = np.diag(random_generator.uniform(1_000., 20_000., 3))
+            trace.is_bearing = number % 7 == 0
+            source_traces.append(trace)
+        return source_traces
+
+    def test_calc_generalized_distances(self) -> None:
+        """Матрица расстояний должна совпадать с попарным расчётом, для головных пеленгов расстояние бесконечно,
+        для пар вне строба тоже бесконечно, но только если настоящее расстояние больше порога
+
+        :return: None
+        """
+        # Подготовка данных для функции
+        source_traces = self.create_source_traces(seed=1)
+        common_trace_array = CommonTraceArray([])
+        for trace in source_traces[:10]:
+            common_trace_array.append(trace)
+        new_source_traces = source_traces[10:]
+
+        # Вызов тестируемой функции
+        identification_engine = IdentificationEngine(common_trace_array, new_source_traces)
+
+        # Проверка для размера матрицы
+        shape = identification_engine.generalized_distances.shape
+        real_shape = (len([trace for trace in new_source_traces if not trace.is_bearing]), 10)
+        self.assertEqual(real_shape, shape, "Размер матрицы расстояний неверен")
+
+        # Проверка совпадения с попарным расчётом
+        for trace in new_source_traces:
+            if trace.is_bearing:
+                continue
+            row = identification_engine.source_rows[id(trace)]
+            for index, cta_trace in enumerate(common_trace_array):
+                head_source_trace = cta_trace.head_source_trace
+                generalized_distance = identification_engine.generalized_distances[row, index]
+                if head_source_trace.is_bearing:
+                    self.assertEqual(np.inf, generalized_distance, "Расстояние до пеленга должно быть бесконечным")
+                    continue
+                real_generalized_distance = SourceTrace.calculate_generalized_distance(
+                    trace.coordinate_covariance_matrix + head_source_trace.coordinate_covariance_matrix,
+                    head_source_trace.coordinates - trace.coordinates)
+                if generalized_distance == np.inf:
+                    self.assertGreater(real_generalized_distance, SourceTrace.identification_threshold_3d,
+                                       "Строб отсёк пару, которая могла отождествиться")
+                else:
+                    self.assertAlmostEqual(real_generalized_distance, generalized_distance, 7,
+                                           "Обобщённое расстояние не совпадает")
+
+    def test_is_in_bearing_gate(self) -> None:
+        """Строб вдоль пеленга не должен отсекать пары, которые могут отождествиться
+
+        :return: None
+        """
+        # Пеленг от МФР в точке (10 км, 0, 0)
+        jammer_trace = SourceTrace(mfr_number=1, mfr_position=np.array([10_000., 0., 0.]))
+        jammer_trace.coordinates = np.array([50_000., 3_000., 10_000.])
+        jammer_trace.coordinate_covariance_matrix = np.diag([100., 400., 900.])
+        jammer_trace.is_bearing = True
+        # Направление пеленга и перпендикуляр к нему
+        direction = jammer_trace.coordinates - jammer_trace.mfr_position
+        normal = np.cross(direction, [0., 1., 0.])
+        normal /= np.linalg.norm(normal)
+
+        identified_count, gate_count = 0, 0
+        for along in [0.3, 1., 2.5]:
+            for offset in [0., 50., 200., 1_000., 5_000.]:
+                target_trace = SourceTrace(mfr_number=2, mfr_position=np.array([-10_000., 0., 0.]))
+                target_trace.coordinates = jammer_trace.mfr_position + along * direction + offset * normal
+                target_trace.coordinate_covariance_matrix = np.diag([2_500., 2_500., 2_500.])
+                # Попарное отождествление
+                target_trace.identification_with_trace(jammer_trace)
+
+                # Вызов тестируемой функции
+                max_eigenvalues = IdentificationEngine.calc_max_eigenvalues([jammer_trace, target_trace])
+                in_gate = IdentificationEngine.is_in_bearing_gate(jammer_trace.coordinates,
+                                                                  jammer_trace.mfr_position,
+                                                                  max_eigenvalues[0],
+                                                                  target_trace.coordinates,
+                                                                  max_eigenvalues[1])
+
+                # Проверка: отождествившаяся пара обязана быть в стробе
+                is_identified = bool(target_trace.identified_number_cta_trace_dict)
+                if is_identified:
+                    self.assertTrue(in_gate, "Строб отсёк пару, которая отождествилась")
+                identified_count += is_identified
+                gate_count += bool(in_gate)
+
+        # Проверка, что строб отсекает далёкие от пеленга цели
+        self.assertGreater(identified_count, 0, "Ни одна пара не отождествилась")
+        self.assertLess(gate_count, 15, "Строб не отсёк ни одной пары")
+
+    def test_identify(self) -> None:
+        """Отождествление через движок должно совпадать с попарным отождествлением
+
+        :return: None
+        """
+        # Два одинаковых набора трасс
+        engine_source_traces = self.create_source_traces(seed=2)
+        pair_source_traces = self.create_source_traces(seed=2)
+        engine_common_trace_array = CommonTraceArray([])
+        pair_common_trace_array = CommonTraceArray([])
+        for engine_trace, pair_trace in zip(engine_source_traces[:6], pair_source_traces[:6]):
+            engine_common_trace_array.append(engine_trace)
+            pair_common_trace_array.append(pair_trace)
+
+        # Вызов тестируемой функции
+        identification_engine = IdentificationEngine(engine_common_trace_array, engine_source_traces[6:])
+        for engine_trace, pair_trace in zip(engine_source_traces[6:], pair_source_traces[6:]):
+            engine_common_trace_array.identification_with_others_cta_traces_for_new_source_trace(
+                engine_trace, identification_engine)
+            pair_common_trace_array.identification_with_others_cta_traces_for_new_source_trace(pair_trace)
+
+        # Проверка для длины ЕМТ
+        self.assertEqual(len(pair_common_trace_array), len(engine_common_trace_array), "Длина ЕМТ не совпадает")
+
+        # Проверка для состава трасс ЕМТ и обобщённых расстояний
+        for engine_trace, pair_trace in zip(engine_source_traces, pair_source_traces):
+            self.assertEqual(pair_trace.cta_number, engine_trace.cta_number, "Номер трассы ЕМТ не совпадает")
+            self.assertEqual(pair_trace.is_head_source, engine_trace.is_head_source, "Признак головной не совпадает")
+            self.assertAlmostEqual(pair_trace.probability_measure, engine_trace.probability_measure, 7,
+                                   "Обобщённое расстояние не совпадает")
@@ -56,6 +56,33 @@ class TestSourceTraceList(TestCase):
         real_len_source_trace_list = len(initial_list)
         self.assertEqual(real_len_source_trace_list, len_source_trace_list, "Длина МТИ неверна")
 
+    def test_formation_with_added_and_removed_traces(self) -> None:
+        """Тест для формирования массива трасс источников с добавлением и удалением трасс
+
+        :return: None
+        """
+        # Подготовка данных для функции: несколько подряд идущих трасс пропадают, появляются новые
+        old_traces = [SourceTrace(target_number=number) for number in range(4)]
+        new_traces = [SourceTrace(target_number=number) for number in range(4, 6)]
+        self.source_trace_list.formation(init_list=[self.source_trace, *old_traces], tick=0)
+
+        # Вызов тестируемой функции
+        self.source_trace_list.formation(init_list=[old_traces[3], *new_traces, self.source_trace], tick=20)
+
+        # Проверка для состава МТИ (порядок оставшихся трасс сохраняется, новые добавляются в конец)
+        source_trace_list = list(self.source_trace_list)
+        real_source_trace_list = [self.source_trace, old_traces[3], *new_traces]
+        self.assertEqual(real_source_trace_list, source_trace_list, "Состав МТИ неверен")
+
+        # Проверка для добавленных трасс
+        added_traces = self.source_trace_list.added_traces
+        self.assertEqual(new_traces, added_traces, "Добавленные трассы определены неверно")
+
+        # Проверка для удалённых трасс
+        removed_traces = self.source_trace_list.removed_traces
+        real_removed_traces = old_traces[:3]
+        self.assertEqual(real_removed_traces, removed_traces, "Удалённые трассы определены неверно")
+
     # TODO: Реализация теста для совместной юстировки
     def test_adjustment(self) -> None:
         """Тестирование совместной юстировки
@@ -84,6 +84,39 @@ class TestPositionAntennaData(TestCase):
         real_velocities = [120., 100., 100.]
         self.assertEqual(real_velocities, velocities, "Скорости не совпадают")
 
+    def test_dec2bcs_array_and_bcs2dec_array(self) -> None:
+        """Проверка пересчётов массивов векторов из МЗСК в БСК и обратно,
+        результат должен совпадать с пересчётом каждого вектора по отдельности
+
+        :return: None
+        """
+        # Подготовка данных для функций
+        real_coordinates = np.array([[30_000., 5_000., 30_000.], [312_000., 5_000., 30_000.], [10_000., 0., -3_000.]])
+        real_velocities = np.array([[120., 100., 100.], [100., 100., 100.], [-200., 10., 0.]])
+
+        # Выполнение тестируемых функций
+        coordinates_bcs, velocities_bcs = self.position_data.dec2bcs_array(real_coordinates, real_velocities)
+        coordinates, velocities = self.position_data.bcs2dec_array(coordinates_bcs, velocities_bcs)
+
+        # Проверка для размеров массивов
+        shape = coordinates_bcs.shape
+        real_shape = (3, 3)
+        self.assertEqual(real_shape, shape, "Размер массива координат в БСК неверен")
+
+        # Проверка совпадения с пересчётом каждого вектора
+        for index in range(len(real_coordinates)):
+            coordinate_bcs, velocity_bcs = self.position_data.dec2bcs(real_coordinates[index], real_velocities[index])
+            self.assertTrue(np.allclose(coordinate_bcs, coordinates_bcs[index]), "Координаты в БСК не совпадают")
+            self.assertTrue(np.allclose(velocity_bcs, velocities_bcs[index]), "Скорости в БСК не совпадают")
+
+        # Проверка для координат после пересчёта обратно
+        coordinates = coordinates.round(7).tolist()
+        self.assertEqual(real_coordinates.tolist(), coordinates, "Координаты не совпадают")
+
+        # Проверка для скоростей после пересчёта обратно
+        velocities = velocities.round(7).tolist()
+        self.assertEqual(real_velocities.tolist(), velocities, "Скорости не совпадают")
+
     def test_calc_dec_covariance_matrix_from_bcs(self) -> None:
         """Проверка для расчёта ковариационной матрицы в прямоугольной декартовой СК, имея матрицу в БСК
 
@@ -100,3 +133,28 @@ class TestPositionAntennaData(TestCase):
                            [-339047.0, 587251.0, 0.0],
                            [0.0, 0.0, 783000.0]]
         self.assertEqual(real_cov_matrix, cov_matrix, "Ковариационная матрица оценена неверно")
+
+    def test_calc_dec_covariance_matrix_from_bcs_array(self) -> None:
+        """Проверка расчёта набора ковариационных матриц, результат должен совпадать с расчётом каждой матрицы
+
+        :return: None
+        """
+        # Подготовка данных для функции
+        coordinates_bcs = np.array([[10_000., 0.2, -0.1], [30_000., -0.4, 0.3], [5_000., 0., 0.]])
+        variances_bcs = np.array([[25., 7.5e-7, 7.5e-7], [4., 1e-6, 2e-6], [100., 1e-4, 1e-4]])
+
+        # Выполнение тестируемой функции
+        covariance_matrices = self.position_data.calc_dec_covariance_matrix_from_bcs_array(variances_bcs,
+                                                                                          coordinates_bcs)
+
+        # Проверка для размера массива
+        shape = covariance_matrices.shape
+        real_shape = (3, 3, 3)
+        self.assertEqual(real_shape, shape, "Размер массива ковариационных матриц неверен")
+
+        # Проверка совпадения с расчётом каждой матрицы
+        for index in range(len(coordinates_bcs)):
+            real_covariance_matrix = self.position_data.calc_dec_covariance_matrix_from_bcs(
+                np.diag(variances_bcs[index]), coordinates_bcs[index])
+            self.assertTrue(np.allclose(real_covariance_matrix, covariance_matrices[index]),
+                            "Ковариационные матрицы не совпадают")
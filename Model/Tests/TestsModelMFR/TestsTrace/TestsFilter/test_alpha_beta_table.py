@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from alpha_beta_table import AlphaBetaTable
+
+
+class TestAlphaBetaTable(unittest.TestCase):
+    def setUp(self) -> None:
+        """Создаём таблицу с параметрами по умолчанию и набор интенсивностей манёвра, в том числе вне таблицы
+        и вблизи излома формул
+
+        :return: None
+        """
+        self.table = AlphaBetaTable()
+        lg_manoeuvre_level = np.concatenate([np.linspace(-6., 4., 20_001), [0.19, 0.2, 0.21, -4.8, 3.2]])
+        self.manoeuvre_level = 10 ** lg_manoeuvre_level
+        self.real_alpha, self.real_beta = AlphaBetaTable.calc_alpha_beta_exact_array(lg_manoeuvre_level)
+
+    def test_calc_alpha_beta(self) -> None:
+        """Проверка коэффициентов для одной интенсивности манёвра, ошибка не больше 1e-7
+
+        :return: None
+        """
+        alpha, beta = np.array([self.table.calc_alpha_beta(level) for level in self.manoeuvre_level.tolist()]).T
+
+        # Проверка для коэффициента альфа
+        self.assertLessEqual(np.abs(alpha - self.real_alpha).max(), 1e-7, "Альфа оценена неверно")
+
+        # Проверка для коэффициента бета
+        self.assertLessEqual(np.abs(beta - self.real_beta).max(), 1e-7, "Бета оценена неверно")
+
+    def test_calc_alpha_beta_array(self) -> None:
+        """Проверка коэффициентов для массива интенсивностей манёвра, результат совпадает с расчётом по одной
+
+        :return: None
+        """
+        manoeuvre_level = self.manoeuvre_level.reshape(-1, 1)
+        alpha, beta = self.table.calc_alpha_beta_array(manoeuvre_level)
+
+        # Проверка для формы массивов
+        self.assertEqual(manoeuvre_level.shape, alpha.shape, "Форма массива альфа неверна")
+        self.assertEqual(manoeuvre_level.shape, beta.shape, "Форма массива бета неверна")
+
+        # Проверка для коэффициентов
+        real_alpha, real_beta = np.array([self.table.calc_alpha_beta(level)
+                                          for level in self.manoeuvre_level.tolist()]).T
+        self.assertTrue(np.allclose(real_alpha, alpha.ravel(), rtol=0., atol=1e-12), "Альфа оценена неверно")
+        self.assertTrue(np.allclose(real_beta, beta.ravel(), rtol=0., atol=1e-12), "Бета оценена неверно")
@@ -0,0 +1,121 @@
+import unittest
+
+import numpy as np
+
+from filter_alpha_beta import FilterAB
+from filter_bank_alpha_beta import FilterBankAB
+
+
+class TestFilterBankAB(unittest.TestCase):
+    def setUp(self) -> None:
+        """Создаём банк фильтров на две строки и два одиночных фильтра с теми же параметрами
+
+        :return: None
+        """
+        self.filter_bank = FilterBankAB(capacity=2)
+        self.rows = np.array([self.filter_bank.append(frame_time=0.1, manoeuvre_overload=4),
+                              self.filter_bank.append(frame_time=1, manoeuvre_overload=2)])
+        self.single_filters = [FilterAB(frame_time=0.1, manoeuvre_overload=4),
+                               FilterAB(frame_time=1, manoeuvre_overload=2)]
+
+    def test_append(self) -> None:
+        """Проверка выделения строк банка и его расширения
+
+        :return: None
+        """
+        # Проверка для выделенных строк
+        rows = self.rows.tolist()
+        real_rows = [0, 1]
+        self.assertEqual(real_rows, rows, "Строки банка выделены неверно")
+
+        # Добавление фильтра в заполненный банк
+        row = self.filter_bank.append(frame_time=0.1, manoeuvre_overload=4)
+
+        # Проверка для новой строки
+        real_row = 2
+        self.assertEqual(real_row, row, "Строка банка выделена неверно")
+
+        # Проверка для размера банка
+        capacity = self.filter_bank.capacity
+        real_capacity = 4
+        self.assertEqual(real_capacity, capacity, "Банк расширен неверно")
+
+        # Проверка, что массивы расширились вместе с банком
+        shape = self.filter_bank.estimate_coordinates.shape
+        real_shape = (4, 3)
+        self.assertEqual(real_shape, shape, "Массивы банка расширены неверно")
+
+    def test_remove(self) -> None:
+        """Проверка повторного использования освобождённой строки
+
+        :return: None
+        """
+        # Сделаем шаг фильтрации, чтобы в строке было состояние
+        self.filter_bank.set_measurements(self.rows, [[30_000., 0.1, 0.2], [50_000., 0.3, 0.4]], [5., 0.00087, 0.00087])
+        self.filter_bank.operate(self.rows)
+
+        # Вызов тестируемой функции
+        self.filter_bank.remove(0)
+        row = self.filter_bank.append(frame_time=0.1, manoeuvre_overload=4)
+
+        # Проверка для номера строки
+        real_row = 0
+        self.assertEqual(real_row, row, "Освобождённая строка не использована")
+
+        # Проверка, что состояние строки сброшено
+        counter = self.filter_bank.counter[row]
+        real_counter = 0
+        self.assertEqual(real_counter, counter, "Счётчик фильтра не сброшен")
+        estimate_coordinates = self.filter_bank.estimate_coordinates[row].tolist()
+        real_estimate_coordinates = [0., 0., 0.]
+        self.assertEqual(real_estimate_coordinates, estimate_coordinates, "Состояние фильтра не сброшено")
+
+    def test_operate(self) -> None:
+        """Проверка основного алгоритма работы, результат должен совпадать с работой одиночных фильтров
+
+        :return: None
+        """
+        np.random.seed(7)
+        sigma_bcs = np.array([5., 0.00087, 0.00087])
+        true_coordinates = np.array([[30_000., 0.1, 0.2], [50_000., 0.3, 0.4]])
+        for step in range(10):
+            true_coordinates += [[-20., 0.0001, 0.], [100., 0., -0.0002]]
+            measure_coordinates = true_coordinates + sigma_bcs * np.random.randn(2, 3)
+
+            # Работа одиночных фильтров
+            for single_filter, coordinates in zip(self.single_filters, measure_coordinates):
+                single_filter.current_data.measure_coordinates = coordinates
+                single_filter.current_data.sigma_bcs = sigma_bcs
+                single_filter.operate()
+
+            # Вызов тестируемой функции
+            self.filter_bank.set_measurements(self.rows, measure_coordinates, sigma_bcs)
+            self.filter_bank.operate(self.rows)
+
+            # Проверка для всех данных, которые использует трасса
+            filtered_data = self.filter_bank.get_current_data(self.rows)
+            for index, single_filter in enumerate(self.single_filters):
+                for field, data in filtered_data.items():
+                    real_data = getattr(single_filter.current_data, field)
+                    self.assertTrue(np.allclose(real_data, data[index]),
+                                    f"Данные {field} не совпадают с одиночным фильтром на шаге {step}")
+
+    def test_operate_part_of_rows(self) -> None:
+        """Проверка, что шаг фильтрации не затрагивает строки, не переданные в функцию
+
+        :return: None
+        """
+        self.filter_bank.set_measurements(self.rows, [[30_000., 0.1, 0.2], [50_000., 0.3, 0.4]], [5., 0.00087, 0.00087])
+
+        # Вызов тестируемой функции только для второй строки
+        self.filter_bank.operate(self.rows[1:])
+
+        # Проверка для счётчиков фильтров
+        counter = self.filter_bank.counter[self.rows].tolist()
+        real_counter = [0, 1]
+        self.assertEqual(real_counter, counter, "Счётчики фильтров изменены неверно")
+
+        # Проверка для оценки координат первой строки
+        estimate_coordinates = self.filter_bank.estimate_coordinates[0].tolist()
+        real_estimate_coordinates = [0., 0., 0.]
+        self.assertEqual(real_estimate_coordinates, estimate_coordinates, "Изменена строка, не участвующая в шаге")
@@ -61,6 +61,16 @@ class TestTrace(TestCase):
         real_frame_tick = 20
         self.assertEqual(real_frame_tick, frame_tick, "Временные тики между измерениями неверны")
 
+        # Проверка для темпа обновления информации
+        frame_time = self.trace.frame_time
+        real_frame_time = 1.
+        self.assertAlmostEqual(real_frame_time, frame_time, msg="Темп обновления информации неверен")
+
+        # Проверка для перегрузки манёвра
+        manoeuvre_overload = self.trace.manoeuvre_overload
+        real_manoeuvre_overload = 4
+        self.assertEqual(real_manoeuvre_overload, manoeuvre_overload, "Перегрузка манёвра неверна")
+
     def test_measure(self) -> None:
         """Проверка измерений корординат цели
 
@@ -73,10 +83,12 @@ class TestTrace(TestCase):
         n = 100
         # Массив для хранения измерений
         measure_coordinates_bcs = np.zeros((3, n))
+        # Стандартные нормальные величины, которые в моделировании выдаёт поставщик шума МФР
+        standard_normals = np.random.default_rng(1).standard_normal((n, 3))
 
         # Вызов тестируемой функции в цикле
         for index in range(n):
-            self.trace.measure(mean_coordinate_bcs, sigma_measure)
+            self.trace.measure(mean_coordinate_bcs, sigma_measure, standard_normals[index])
             # Запись измерений в отдельный массив
             measure_coordinates_bcs[:, index] = self.trace.coordinates_data.measure_coordinates_bcs
 
@@ -94,105 +106,22 @@ class TestTrace(TestCase):
         difference_sigma = (abs(estimated_sigma_measure - sigma_measure) / sigma_measure).tolist()
         self.assertLess(difference_sigma, threshold)
 
-    def test_filtrate(self) -> None:
-        """Тестить нечего, тестируемая функция это просто обёртка над тремя функциями этого же класса
-
-        :return: None
-        """
-        # Подготовка нужных для функции данных
-        real_sigma_measure = np.array([5.0, 0.00087, 0.00087])
-        real_coordinates = np.array([30_000., pi / 6, pi / 6])
-        coordinates_data = self.trace.coordinates_data
-        coordinates_data.measure_coordinates_bcs = real_coordinates
-        variance_bcs_data = self.trace.variance_bcs_data
-        variance_bcs_data.sigma_measure_coordinates = real_sigma_measure
-
-        # Запуск тестируемой функции
-        self.trace.filtrate()
-
-        # Проверка для измеренных координат
-        measure_coordinates = coordinates_data.measure_coordinates_bcs.tolist()
-        real_measure_coordinates = real_coordinates.tolist()
-        self.assertEqual(real_measure_coordinates, measure_coordinates, "Координаты измерены неверно")
-
-        # Проверка для оценных координат
-        estimate_coordinates = coordinates_data.estimate_coordinates_bcs.tolist()
-        real_estimate_coordinates = real_coordinates.tolist()
-        self.assertEqual(real_estimate_coordinates, estimate_coordinates, "Координаты оценены неверно")
-
-        # Проверка для экстраполированных координат
-        extrapolate_coordinates = coordinates_data.extrapolate_coordinates_bcs.tolist()
-        real_extrapolate_coordinates = real_coordinates.tolist()
-        self.assertEqual(real_extrapolate_coordinates, extrapolate_coordinates, "Координаты экстраполированы неверно")
-
-        # Проверка для экстраполированной скоростей
-        extrapolate_velocities = self.trace.velocities_data.extrapolate_velocities_bcs.tolist()
-        real_extrapolate_velocities = [0., 0., 0.]
-        self.assertEqual(real_extrapolate_velocities, extrapolate_velocities, "Скорость экстраполирована неверно")
-
-        # Проверка для дисперсий оцененных координат
-        variance_estimate_coordinates = variance_bcs_data.variance_estimate_coordinates.tolist()
-        real_variance_estimate_coordinates = [25.0, 7.569e-07, 7.569e-07]
-        self.assertEqual(real_variance_estimate_coordinates, variance_estimate_coordinates, "Дисперсии неверны")
-
-        # Проверка для дисперсий экстраполированных координат
-        variance_extrapolate_coordinates = variance_bcs_data.variance_extrapolate_coordinates.tolist()
-        real_variance_extrapolate_coordinates = [100.0, 3.0276e-06, 3.0276e-06]
-        self.assertEqual(real_variance_extrapolate_coordinates, variance_extrapolate_coordinates, "Дипсерсии неверны")
-
-    def test_update_filter_data(self) -> None:
-        """Тест обновления данных фильтра
-
-        :return: None
-        """
-        # Подготовка нужных для функции данных
-        self.trace.coordinates_data.measure_coordinates_bcs = np.array([30000, pi / 6, pi / 6])
-        self.trace.variance_bcs_data.sigma_measure_coordinates = np.array([5.0, 0.00087, 0.00087])
-
-        # Запуск тестируемой функции
-        self.trace.update_filter_data()
-
-        # Проверка для измеренных координат
-        measure_coordinates = self.trace.filter.current_data.measure_coordinates.tolist()
-        real_measure_coordinates = [30000, pi / 6, pi / 6]
-        self.assertEqual(real_measure_coordinates, measure_coordinates, "Координаты записались неправильно")
-
-        # Проверка для СКО измеренных координат
-        sigma = self.trace.filter.current_data.sigma_bcs.tolist()
-        real_sigma = [5.0, 0.00087, 0.00087]
-        self.assertEqual(real_sigma, sigma, "СКО записались неправильно")
-
-    def test_run_filter(self) -> None:
-        """Тест для обёртки над запуском operate фильтра, тестировать нечего
-
-        :return: None
-        """
-        self.trace.filter.current_data.measure_coordinates = np.array([30000, pi / 6, pi / 6])
-        self.trace.filter.current_data.sigma_bcs = np.array([5.0, 0.00087, 0.00087])
-        try:
-            self.trace.run_filter()
-        except AttributeError:
-            self.fail(self.failure_msg)
-
-    def test_update_self_data(self) -> None:
-        """Обновление собсивенных данных резултатами работы фильтра
+    def test_update_self_data_from_filter_bank(self) -> None:
+        """Обновление собственных данных результатами работы банка фильтров
 
         :return: None
         """
-        # Подготовка нужных для функции данных
-        current_data = self.trace.filter.current_data
-        # Координаты
-        current_data.measure_coordinates = np.array([10_000., pi/6, 0.])
-        current_data.estimate_coordinates = np.array([10_033., pi/7, 0.2])
-        current_data.extrapolate_coordinates = np.array([10_040., pi/8, 0.4])
-        # Скорость
-        current_data.extrapolate_velocities = np.array([20., -0.00009, 0.9])
-        # Дисперсии
-        current_data.variance_estimate_coordinates = np.array([25.0, 7.569e-07, 7.569e-07])
-        current_data.variance_extrapolate_coordinates = np.array([100.0, 3.0276e-06, 3.0276e-06])
+        # Подготовка нужных для функции данных: результаты банка фильтров по двум трассам, наша вторая
+        filtered_data = {
+            "measure_coordinates": np.array([[0., 0., 0.], [10_000., pi / 6, 0.]]),
+            "estimate_coordinates": np.array([[0., 0., 0.], [10_033., pi / 7, 0.2]]),
+            "extrapolate_coordinates": np.array([[0., 0., 0.], [10_040., pi / 8, 0.4]]),
+            "extrapolate_velocities": np.array([[0., 0., 0.], [20., -0.00009, 0.9]]),
+            "variance_estimate_coordinates": np.array([[0., 0., 0.], [25.0, 7.569e-07, 7.569e-07]]),
+            "variance_extrapolate_coordinates": np.array([[0., 0., 0.], [100.0, 3.0276e-06, 3.0276e-06]])}
 
         # Вызов тестируемой функции
-        self.trace.update_self_data()
+        self.trace.update_self_data_from_filter_bank(filtered_data, 1)
 
         # Проверка для измеренных координат
         measure_coordinates = self.trace.coordinates_data.measure_coordinates_bcs.tolist()
@@ -376,4 +305,4 @@ class TestTrace(TestCase):
         real_covariance_matrix = [[30., 0., 0.],
                                   [0., 20., 0.],
                                   [0., 0., 10.]]
-        self.assertEqual(real_covariance_matrix, covariance_matrix, "Ковариационная матрица неверна")
\ No newline at end of file
+        self.assertEqual(real_covariance_matrix, covariance_matrix, "Ковариационная матрица неверна")
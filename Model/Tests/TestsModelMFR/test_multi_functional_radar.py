@@ -72,7 +72,7 @@ class TestMultiFunctionalRadar(TestCase):
         self.assertEqual(real_target_list, target_list, "Массив целей задан неверно")
 
         # Проверка для массива информации о каждой трассе этого МФР
-        registration = self.multi_functional_radar.registration
+        registration = self.multi_functional_radar.registration.tolist()
         real_registration = []
         self.assertEqual(real_registration, registration, "Регистрация задана неверно")
 
@@ -406,7 +406,7 @@ class TestMultiFunctionalRadar(TestCase):
         self.multi_functional_radar.register()
 
         # Проверка для регистрации
-        registration = self.multi_functional_radar.registration
+        registration = self.multi_functional_radar.registration.tolist()
         real_registration = [[20, 2, False, 10000.0, 5000.0, 1000.0, 300.0, 0.0, 10.0,
                               0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, False, -1, 0.0]]
         self.assertEqual(real_registration, registration, "Регистрация не совпадает")
@@ -422,4 +422,52 @@ class TestMultiFunctionalRadar(TestCase):
                               0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, False, -1, 0.0],
                              [40, 2, False, 10000.0, 5000.0, 1000.0, 300.0, 0.0, 10.0,
                               0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, False, -1, 0.0]]
+        registration = self.multi_functional_radar.registration.tolist()
         self.assertEqual(real_registration, registration, "Регистрация не совпадает")
+
+    def test_trace_dict(self) -> None:
+        """Проверка словаря трасс: трасса по вновь сопровождаемой цели встаёт в конец,
+        строка банка фильтров удалённой трассы используется повторно
+
+        :return: None
+        """
+        # Подготовка нужных данных для функций
+        targets = [Target(coordinates=np.array([10_000. * number, 5_000., 1_000.])) for number in range(1, 4)]
+        mfr = MultiFunctionalRadar(target_list=targets)
+        filter_row = mfr.trace_dict[targets[0]].filter_row
+
+        # Вызов тестируемых функций
+        mfr.remove_trace_for_target(targets[0])
+        mfr.append_trace_for_target(targets[0])
+
+        # Проверка для порядка трасс
+        trace_targets = [trace.target for trace in mfr.trace_list]
+        real_trace_targets = [targets[1], targets[2], targets[0]]
+        self.assertEqual(real_trace_targets, trace_targets, "Порядок трасс определён неверно")
+
+        # Проверка для строки банка фильтров
+        new_filter_row = mfr.trace_dict[targets[0]].filter_row
+        self.assertEqual(filter_row, new_filter_row, "Строка банка фильтров не использована повторно")
+
+    def test_set_seed_sequence(self) -> None:
+        """Проверка воспроизводимости измерений: МФР с одинаковым зерном измеряют одинаково,
+        независимо от глобального генератора случайных чисел
+
+        :return: None
+        """
+        # Подготовка нужных данных для функций
+        measurements = []
+        for _ in range(2):
+            targets = [Target(coordinates=np.array([10_000. * number, 5_000., 1_000.])) for number in range(1, 4)]
+            mfr = MultiFunctionalRadar(target_list=targets)
+            # Вызов тестируемой функции
+            mfr.set_seed_sequence(np.random.SeedSequence(13, spawn_key=(2, 0)))
+            np.random.seed(len(measurements))
+            mfr.create_measurements(mfr.trace_list)
+            measurements.append([trace.coordinates_data.measure_coordinates_bcs.tolist() for trace in mfr.trace_list])
+
+        # Проверка для измерений
+        self.assertEqual(measurements[0], measurements[1], "Измерения с одинаковым зерном не совпадают")
+
+        # Проверка, что у трасс разные потоки случайных чисел
+        self.assertNotEqual(measurements[0][0], measurements[0][1], "Измерения трасс совпадают")
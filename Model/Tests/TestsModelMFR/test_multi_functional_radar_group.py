@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+import numpy as np
+
+from multi_functional_radar import MultiFunctionalRadar
+from multi_functional_radar_group import MultiFunctionalRadarGroup
+from target import Target
+from target_swarm import TargetSwarm
+
+
+class TestMultiFunctionalRadarGroup(TestCase):
+    @staticmethod
+    def create_mfr(target_list: list, realization: int) -> MultiFunctionalRadar:
+        """Создаёт МФР с зерном, зависящим только от номера реализации
+
+        :param target_list: Список целей
+        :type target_list: list
+        :param realization: Номер реализации
+        :type realization: int
+
+        :return: МФР
+        :rtype: MultiFunctionalRadar
+        """
+        return MultiFunctionalRadar(target_list=target_list,
+                                    stable_point=np.array([1_100., 20., -800.]),
+                                    mfr_number=2,
+                                    seed_sequence=np.random.SeedSequence(3, spawn_key=(realization,)))
+
+    @staticmethod
+    def create_targets() -> list:
+        """Создаёт цели, одна из которых не сопровождается в начале моделирования
+
+        :return: Список целей
+        :rtype: list
+        """
+        return [Target(number=0, coordinates=np.array([10_000., 5_000., 1_000.]), velocities=np.array([300., 0., 10.])),
+                Target(number=1, coordinates=np.array([-30_000., 2_000., 500.]), velocities=np.array([200., 0., 0.])),
+                Target(number=2, coordinates=np.array([40_000., 0., 9_000.]), velocities=np.array([-250., 10., 0.]))]
+
+    def test_operate(self) -> None:
+        """Результат каждой копии в группе должен совпадать с результатом отдельного МФР с тем же зерном
+
+        :return: None
+        """
+        realization_count = 3
+
+        # Отдельные МФР, у каждого свои цели
+        single_mfr_list = []
+        single_target_swarms = []
+        for realization in range(realization_count):
+            target_list = self.create_targets()
+            single_target_swarms.append(TargetSwarm(target_list))
+            single_mfr_list.append(self.create_mfr(target_list, realization))
+
+        # Группа копий МФР с общими целями
+        target_list = self.create_targets()
+        target_swarm = TargetSwarm(target_list)
+        mfr_group = MultiFunctionalRadarGroup([self.create_mfr(target_list, realization)
+                                               for realization in range(realization_count)])
+
+        # Проверка, что банк фильтров общий
+        self.assertTrue(all(mfr.filter_bank is mfr_group.leader.filter_bank for mfr in mfr_group.mfr_list),
+                        "Банк фильтров не общий")
+
+        # Вызов тестируемой функции
+        for tick in range(0, 200, 2):
+            target_swarm.operate(tick)
+            mfr_group.operate(tick)
+            for single_target_swarm, single_mfr in zip(single_target_swarms, single_mfr_list):
+                single_target_swarm.operate(tick)
+                single_mfr.operate(tick)
+
+        for mfr, single_mfr in zip(mfr_group.mfr_list, single_mfr_list):
+            registration = mfr.registration.array
+            real_registration = single_mfr.registration.array
+
+            # Проверка для числа строк регистрации
+            self.assertEqual(len(real_registration), len(registration), "Число строк регистрации не совпадает")
+
+            # Проверка для значений регистрации
+            for name in real_registration.dtype.names:
+                self.assertTrue(np.allclose(real_registration[name], registration[name], rtol=1e-12),
+                                f"Регистрация поля {name} не совпадает")
+
+        # Проверка, что реализации различаются шумом
+        self.assertFalse(np.array_equal(mfr_group.mfr_list[0].registration.array["x"],
+                                        mfr_group.mfr_list[1].registration.array["x"]),
+                         "Реализации не различаются")
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+import numpy as np
+
+from noise_provider import NoiseProvider
+
+
+class TestNoiseProvider(TestCase):
+    def setUp(self) -> None:
+        """Поставщик шума с маленьким блоком, чтобы блоки часто заканчивались
+
+        :return: None
+        """
+        self.noise_provider = NoiseProvider(np.random.default_rng(11), block_size=5)
+
+    def test_take(self) -> None:
+        """Выдача по частям должна совпадать с одной генерацией всех величин сразу
+
+        :return: None
+        """
+        # Вызов тестируемой функции: части меньше, равные и больше блока
+        counts = [2, 3, 4, 7, 1, 5]
+        noise = np.concatenate([self.noise_provider.take(count) for count in counts])
+
+        # Проверка для размера
+        shape = noise.shape
+        real_shape = (sum(counts), 3)
+        self.assertEqual(real_shape, shape, "Размер массива шума неверен")
+
+        # Проверка для значений
+        real_noise = np.random.default_rng(11).standard_normal((sum(counts), 3))
+        self.assertTrue(np.array_equal(real_noise, noise), "Последовательность шума зависит от размера частей")
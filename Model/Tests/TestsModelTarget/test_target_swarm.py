@@ -0,0 +1,113 @@
+from unittest import TestCase
+
+import numpy as np
+
+from target import Target
+from target_swarm import TargetSwarm
+
+
+class TestTargetSwarm(TestCase):
+    def setUp(self) -> None:
+        """Сохраняем ссылки на цели и группу целей
+
+        :return: None
+        """
+        self.first_target = Target(number=1,
+                                   coordinates=np.array([100_000., 5_000., 30_000.]),
+                                   velocities=np.array([-100., -100., 100.]))
+        self.second_target = Target(number=2,
+                                    coordinates=np.array([20_000., 1_000., 2_430.]),
+                                    velocities=np.array([100, 250, -50]))
+        self.target_swarm = TargetSwarm([self.first_target, self.second_target])
+
+    def test___init__(self) -> None:
+        """Проверяет, что цели стали представлениями строк общих массивов
+
+        :return: None
+        """
+        # Проверка для размера массива координат
+        shape = self.target_swarm.coordinates.shape
+        real_shape = (2, 3)
+        self.assertEqual(real_shape, shape, "Размер массива координат неверен")
+
+        # Проверка для координат второй цели
+        coordinates = self.target_swarm.coordinates[1].tolist()
+        real_coordinates = [20_000., 1_000., 2_430.]
+        self.assertEqual(real_coordinates, coordinates, "Координаты установлены неверно")
+
+        # Проверка, что векторы цели ссылаются на общие массивы
+        self.assertTrue(np.shares_memory(self.first_target.coordinates, self.target_swarm.coordinates),
+                        "Координаты цели не являются строкой общего массива")
+        self.assertTrue(np.shares_memory(self.second_target.velocities, self.target_swarm.velocities),
+                        "Скорости цели не являются строкой общего массива")
+
+        # Проверка, что время цели берётся из группы целей
+        self.assertIs(self.target_swarm, self.first_target.swarm, "Цель не ссылается на группу целей")
+        target_ticks = self.first_target.ticks
+        real_target_ticks = 0
+        self.assertEqual(real_target_ticks, target_ticks, "Не совпадают временные тики")
+
+        # Проверка, что время цели в группе нельзя изменить в обход группы
+        with self.assertRaises(AttributeError):
+            self.first_target.ticks = 10
+        with self.assertRaises(AttributeError):
+            self.first_target.operate(10)
+
+    def test___init__without_targets(self) -> None:
+        """Проверяет создание пустой группы целей
+
+        :return: None
+        """
+        target_swarm = TargetSwarm([])
+
+        # Проверка для размера массива координат
+        shape = target_swarm.coordinates.shape
+        real_shape = (0, 3)
+        self.assertEqual(real_shape, shape, "Размер массива координат неверен")
+
+    def test_operate(self) -> None:
+        """Тест для основного алгоритма работы, результат должен совпадать с поштучным движением целей
+
+        :return: None
+        """
+        # Те же цели, которые будут двигаться по одной
+        single_targets = [Target(coordinates=np.array([100_000., 5_000., 30_000.]),
+                                 velocities=np.array([-100., -100., 100.])),
+                          Target(coordinates=np.array([20_000., 1_000., 2_430.]),
+                                 velocities=np.array([100, 250, -50]))]
+
+        # Вызов тестируемой функции
+        for tick in range(100):
+            self.target_swarm.operate(tick)
+            for target in single_targets:
+                target.operate(tick)
+
+        # Проверка для координат
+        for target, single_target in zip(self.target_swarm.target_list, single_targets):
+            coordinates = target.coordinates.tolist()
+            real_coordinates = single_target.coordinates.tolist()
+            self.assertEqual(real_coordinates, coordinates, "Координаты цели не совпадают")
+
+        # Проверка для временных тиков
+        target_ticks = self.first_target.ticks
+        real_target_ticks = 99
+        self.assertEqual(real_target_ticks, target_ticks, "Не совпадают временные тики")
+
+    def test_operate_with_skipped_ticks(self) -> None:
+        """Тест для основного алгоритма работы с пропуском тиков
+
+        :return: None
+        """
+        # Вызов тестируемой функции только на каждый двадцатый тик
+        for tick in range(0, 100, 20):
+            self.target_swarm.operate(tick)
+
+        # Проверка для координат (цели сделали 81 шаг: с нулевого по восьмидесятый тик)
+        coordinates = self.first_target.coordinates.round(6).tolist()
+        real_coordinates = [99_595., 4_595., 30_405.]
+        self.assertEqual(real_coordinates, coordinates, "Координаты цели не совпадают")
+
+        # Проверка для временных тиков
+        target_ticks = self.second_target.ticks
+        real_target_ticks = 80
+        self.assertEqual(real_target_ticks, target_ticks, "Не совпадают временные тики")
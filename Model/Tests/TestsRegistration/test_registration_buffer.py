@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+import numpy as np
+
+from registration_buffer import RegistrationBuffer, CP_REGISTRATION_DTYPE, MFR_REGISTRATION_DTYPE
+
+
+class TestRegistrationBuffer(TestCase):
+    def setUp(self) -> None:
+        """Буфер регистрации ПБУ на две строки
+
+        :return: None
+        """
+        self.registration_buffer = RegistrationBuffer(CP_REGISTRATION_DTYPE, capacity=2)
+
+    def test___init__(self) -> None:
+        """Проверка пустого буфера
+
+        :return: None
+        """
+        # Проверка для длины
+        self.assertEqual(0, len(self.registration_buffer), "Длина буфера неверна")
+
+        # Проверка для списка строк
+        self.assertEqual([], self.registration_buffer.tolist(), "Пустой буфер содержит строки")
+
+        # Проверка для числа полей схем регистрации
+        self.assertEqual(15, len(CP_REGISTRATION_DTYPE.names), "Число полей регистрации ПБУ неверно")
+        self.assertEqual(25, len(MFR_REGISTRATION_DTYPE.names), "Число полей регистрации МФР неверно")
+
+    def test_append(self) -> None:
+        """Проверка записи строк с расширением буфера
+
+        :return: None
+        """
+        rows = [[20 * tick, tick, 34., 323., -293., 200., 23., -21., 32., 34., 569., 0., 0., 0., 1] for tick in range(5)]
+
+        # Вызов тестируемой функции
+        for row in rows:
+            self.registration_buffer.append(tuple(row))
+
+        # Проверка для длины и выделенного места
+        self.assertEqual(5, len(self.registration_buffer), "Длина буфера неверна")
+        self.assertEqual(8, len(self.registration_buffer.data), "Буфер расширен неверно")
+
+        # Проверка для записанных строк
+        self.assertEqual(rows, self.registration_buffer.tolist(), "Строки записаны неверно")
+
+        # Проверка для столбца
+        ticks = self.registration_buffer.array["tick"].tolist()
+        real_ticks = [0, 20, 40, 60, 80]
+        self.assertEqual(real_ticks, ticks, "Столбец времени неверен")
+
+        # Проверка, что массив строк - представление буфера
+        self.assertTrue(np.shares_memory(self.registration_buffer.array, self.registration_buffer.data),
+                        "Массив строк не является представлением буфера")
+
+    def test_flush(self) -> None:
+        """Проверка сброса заполненного буфера в приёмник вместо расширения
+
+        :return: None
+        """
+        chunks = []
+
+        class Sink:
+            @staticmethod
+            def write(array) -> None:
+                chunks.append(array.tolist())
+
+        self.registration_buffer.sink = Sink()
+        rows = [(20 * tick, tick, 34., 323., -293., 200., 23., -21., 32., 34., 569., 0., 0., 0., 1) for tick in range(5)]
+
+        # Вызов тестируемой функции
+        for row in rows:
+            self.registration_buffer.append(row)
+        self.registration_buffer.flush()
+
+        # Проверка, что буфер не расширялся
+        self.assertEqual(2, len(self.registration_buffer.data), "Буфер расширен, хотя подключён приёмник")
+
+        # Проверка для сброшенных частей
+        real_chunks = [rows[:2], rows[2:4], rows[4:]]
+        self.assertEqual(real_chunks, chunks, "Строки сброшены неверно")
@@ -0,0 +1,120 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from registration_buffer import RegistrationBuffer, CP_REGISTRATION_DTYPE
+from registration_store import ShardWriter, join_realizations, load_registration, load_schema, merge_shards
+from registration_store import save_registration
+
+
+class TestRegistrationStore(TestCase):
+    def setUp(self) -> None:
+        """Регистрация ПБУ двух реализаций
+
+        :return: None
+        """
+        self.buffers = [RegistrationBuffer(CP_REGISTRATION_DTYPE, capacity=1) for _ in range(2)]
+        self.buffers[0].append((20, 1, 34., 323., -293., 200., 23., -21., 32., 34., 569., 0., 0., 0., 1))
+        self.buffers[1].append((20, 1, 35., 323., -293., 200., 23., -21., 32., 34., 569., 0., 0., 0., 2))
+        self.buffers[1].append((40, 2, 36., 323., -293., 200., 23., -21., 32., 34., 569., 0., 0., 0., 1))
+
+    def test_join_realizations(self) -> None:
+        """Проверка объединения реализаций
+
+        :return: None
+        """
+        table = join_realizations(self.buffers)
+
+        # Проверка для полей
+        names = table.dtype.names
+        real_names = (*CP_REGISTRATION_DTYPE.names, "realization")
+        self.assertEqual(real_names, names, "Поля таблицы неверны")
+
+        # Проверка для номера реализации
+        realization = table["realization"].tolist()
+        real_realization = [0, 1, 1]
+        self.assertEqual(real_realization, realization, "Номера реализаций неверны")
+
+        # Проверка для данных
+        x = table["x"].tolist()
+        real_x = [34., 35., 36.]
+        self.assertEqual(real_x, x, "Данные перенесены неверно")
+
+    def test_save_and_load_registration(self) -> None:
+        """Проверка записи таблицы и её чтения через отображение в память
+
+        :return: None
+        """
+        table = join_realizations(self.buffers)
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "registry_cp")
+            save_registration(table, path)
+
+            loaded_table = load_registration(path)
+
+            # Проверка, что таблица отображена в память
+            self.assertIsInstance(loaded_table, np.memmap, "Таблица не отображена в память")
+
+            # Проверка для данных
+            self.assertEqual(table.tolist(), loaded_table.tolist(), "Таблица прочитана неверно")
+            del loaded_table
+
+            # Проверка для несоответствия схеме
+            save_registration(table[:1], path + "_short")
+            os.replace(path + "_short.npy", path + ".npy")
+            with self.assertRaises(ValueError):
+                load_registration(path)
+
+    def test_shard_writer_and_merge_shards(self) -> None:
+        """Проверка потоковой записи частей и их сборки в одну таблицу
+
+        :return: None
+        """
+        with TemporaryDirectory() as directory:
+            shard_paths = [os.path.join(directory, f"cp_{realization}.npy") for realization in range(2)]
+            for shard_path, buffer in zip(shard_paths, self.buffers):
+                shard_writer = ShardWriter(shard_path, CP_REGISTRATION_DTYPE)
+                # Строки пишутся по одной, как при сбросе заполненного буфера
+                for row in buffer.array:
+                    shard_writer.write(row.reshape(1))
+                shard_writer.close()
+
+            # Проверка для части, прочитанной средствами numpy
+            shard = np.load(shard_paths[1])
+            self.assertEqual(self.buffers[1].tolist(), [list(row) for row in shard.tolist()], "Часть записана неверно")
+
+            # Вызов тестируемой функции
+            path = os.path.join(directory, "registry_cp")
+            merge_shards(shard_paths, [0, 1], path, {"seed": 2 ** 100})
+
+            # Проверка для собранной таблицы
+            table = load_registration(path, mmap_mode=None)
+            real_table = join_realizations(self.buffers)
+            self.assertEqual(real_table.tolist(), table.tolist(), "Таблица собрана неверно")
+
+            # Проверка для сведений о моделировании в схеме
+            metadata = load_schema(path)["metadata"]
+            real_metadata = {"seed": 2 ** 100}
+            self.assertEqual(real_metadata, metadata, "Зерно генератора не записано в схему")
+
+    def test_shard_writer_header_size(self) -> None:
+        """Проверка постоянного размера заголовка при росте числа цифр в числе строк
+
+        :return: None
+        """
+        # Длинное имя единственного поля: без запаса заголовок вырос бы с 128 до 192 байт
+        dtype = np.dtype([("a" * 30, "f8")])
+        with TemporaryDirectory() as directory:
+            shard_path = os.path.join(directory, "shard.npy")
+            shard_writer = ShardWriter(shard_path, dtype)
+            header_size = len(shard_writer.header)
+            shard_writer.write(np.arange(1_000.).astype(dtype))
+            self.assertEqual(header_size, len(shard_writer.header), "Размер заголовка изменился")
+            shard_writer.close()
+
+            # Проверка для строк, прочитанных средствами numpy
+            shard = np.load(shard_path)
+            self.assertEqual(np.arange(1_000.).tolist(), shard["a" * 30].tolist(), "Часть записана неверно")
@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from stage_profiler import StageProfiler
+
+
+class TestStageProfiler(TestCase):
+    def setUp(self) -> None:
+        """Профилировщик с двумя вызовами одного этапа
+
+        :return: None
+        """
+        self.stage_profiler = StageProfiler()
+        self.stage_profiler.add("cp.register", 0.5, size=4)
+        self.stage_profiler.add("cp.register", 1.5, size=2)
+
+    def test_run(self) -> None:
+        """Проверка вызова этапа через профилировщик
+
+        :return: None
+        """
+        calls = []
+
+        # Вызов тестируемой функции
+        self.stage_profiler.run("mfr.tracking", calls.append, 7, size=3)
+
+        # Проверка, что функция этапа вызвана с аргументами
+        self.assertEqual([7], calls, "Функция этапа вызвана неверно")
+
+        # Проверка для статистики этапа
+        calls_count, _, _, size = self.stage_profiler.stages["mfr.tracking"]
+        self.assertEqual((1, 3), (calls_count, size), "Статистика этапа посчитана неверно")
+
+        # Проверка для размера, который известен только после этапа
+        self.stage_profiler.run("cp.formation_source_trace_list", calls.append, 8, size=lambda: len(calls))
+        _, _, _, size = self.stage_profiler.stages["cp.formation_source_trace_list"]
+        self.assertEqual(2, size, "Размер этапа взят не после этапа")
+
+    def test_merged(self) -> None:
+        """Проверка объединения профилировщиков разных процессов
+
+        :return: None
+        """
+        other_profiler = StageProfiler()
+        other_profiler.add("cp.register", 3., size=6)
+        other_profiler.add("mfr.tracking", 1., size=1)
+
+        # Вызов тестируемой функции
+        report = StageProfiler.merged([self.stage_profiler, None, other_profiler]).report()
+
+        # Проверка для порядка этапов (по убыванию суммарного времени)
+        self.assertEqual(["cp.register", "mfr.tracking"], list(report), "Порядок этапов неверен")
+
+        # Проверка для статистики этапа
+        real_report = {"calls": 3, "total_time": 5., "mean_time": 5. / 3, "max_time": 3., "mean_size": 4.}
+        self.assertEqual(real_report, report["cp.register"], "Статистика этапа объединена неверно")
+
+        # Проверка, что исходный профилировщик не изменился
+        self.assertEqual(2, self.stage_profiler.stages["cp.register"][0], "Исходный профилировщик изменён")
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from batch_progress import BatchProgress
+
+
+class TestBatchProgress(TestCase):
+    def setUp(self) -> None:
+        """Статистика для пяти реализаций и записи о них от двух пачек: пачка из трёх реализаций
+        выполнялась дольше, но в среднем на одну реализацию быстрее пачки из двух
+
+        :return: None
+        """
+        self.batch_progress = BatchProgress(count_of_iteration=5, starting_time=0.)
+        self.records = [{"realization": realization, "batch": [0, 1, 2], "batch_duration": 6., "ticks": 1_200}
+                        for realization in [0, 1, 2]]
+        self.records += [{"realization": realization, "batch": [3, 4], "batch_duration": 5., "ticks": 600}
+                         for realization in [3, 4]]
+
+    def test_update(self) -> None:
+        """Проверка учёта выполненных реализаций
+
+        :return: None
+        """
+        # Пачки приходят целиком, сначала более быстрая
+        for record in self.records[3:] + self.records[:3]:
+            self.batch_progress.update(record)
+
+        # Проверка для числа выполненных реализаций и тиков
+        self.assertEqual(5, self.batch_progress.completed, "Число выполненных реализаций неверно")
+        self.assertEqual(4_800, self.batch_progress.completed_ticks, "Число выполненных тиков неверно")
+
+        # Проверка для самой долгой пачки: сравнивается время пачек, а не реализаций
+        self.assertEqual([0, 1, 2], self.batch_progress.slowest_batch_record["batch"], "Самая долгая пачка неверна")
+        self.assertEqual(6., self.batch_progress.slowest_batch_record["batch_duration"],
+                         "Время самой долгой пачки неверно")
+
+    def test_eta(self) -> None:
+        """Проверка оценки оставшегося времени
+
+        :return: None
+        """
+        # Проверка для случая, когда нет выполненных реализаций
+        self.assertEqual(float("inf"), self.batch_progress.eta(1.), "Оставшееся время неверно")
+
+        # Проверка для случая, когда выполнена одна пачка
+        for record in self.records[3:]:
+            self.batch_progress.update(record)
+        self.assertAlmostEqual(7.5, self.batch_progress.eta(5.), msg="Оставшееся время неверно")
@@ -0,0 +1,58 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import simulation_func
+from load_variant_function_for_json import object_pairs_hook
+from simulation_func import init_simulation_worker, simulation_to_shards
+
+
+class TestSimulationFunc(TestCase):
+    def setUp(self) -> None:
+        """Вариант моделирования процесса пула по тестовому варианту с коротким временем моделирования
+
+        :return: None
+        """
+        root_path = os.path.join(os.path.dirname(__file__), "..", "..", "..")
+        with open(os.path.join(root_path, "ProfileSimulation", "TestVariant.json")) as json_file:
+            json_variant = json.load(json_file, object_pairs_hook=object_pairs_hook)
+        self.json_variant = json_variant
+        init_simulation_worker(json_variant, seed=1, is_profiling=False)
+        simulation_func.worker_variant.modelling_time = 2
+
+    def test_simulation_to_shards(self) -> None:
+        """Проверка записей о реализациях пачки: время известно только для пачки целиком
+
+        :return: None
+        """
+        with TemporaryDirectory() as directory:
+            records = simulation_to_shards([[3, 5], directory])
+
+        # Проверка для номеров реализаций
+        self.assertEqual([3, 5], [record["realization"] for record in records], "Номера реализаций неверны")
+
+        # Проверка для пачки и времени её выполнения, общих для всех реализаций пачки
+        self.assertEqual([[3, 5], [3, 5]], [record["batch"] for record in records], "Пачка реализаций неверна")
+        self.assertEqual(1, len({record["batch_duration"] for record in records}), "Время пачки различается")
+        self.assertGreater(records[0]["batch_duration"], 0., "Время пачки неверно")
+
+    def test_simulation_to_shards_with_profiling(self) -> None:
+        """Проверка профилировщиков: общие этапы пачки учитываются отдельно от этапов ПБУ реализаций
+
+        :return: None
+        """
+        init_simulation_worker(self.json_variant, seed=1, is_profiling=True)
+        simulation_func.worker_variant.modelling_time = 2
+        with TemporaryDirectory() as directory:
+            records = simulation_to_shards([[3, 5], directory])
+
+        # Проверка для профилировщика пачки: он передаётся только в первой записи
+        batch_profiler = records[0]["batch_profiler"]
+        self.assertIsNone(records[1]["batch_profiler"], "Профилировщик пачки передан дважды")
+        self.assertIn("targets.operate", batch_profiler.stages, "Этапы целей не учтены в пачке")
+
+        # Проверка для профилировщиков реализаций: в них только этапы ПБУ
+        for record in records:
+            self.assertNotIn("targets.operate", record["profiler"].stages, "Этапы пачки учтены в реализации")
+            self.assertIn("cp.register", record["profiler"].stages, "Этапы ПБУ не учтены в реализации")
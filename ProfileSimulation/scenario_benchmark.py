@@ -0,0 +1,186 @@
+"""Файл предназначен для измерения производительности моделирования на сетке сценариев.
+Сценарии генерируются по числу целей, числу МФР, доле постановщиков АШП, доле целей на АС и времени моделирования.
+Результаты вместе с описанием окружения записываются в json файл, чтобы сравнивать версии модели между собой
+
+Пример запуска:
+python scenario_benchmark.py --targets 1 10 100 --mfrs 1 3 --anj 0 0.5 --auto 0 1 --duration 60 --output bench.json"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from itertools import product
+from time import perf_counter
+
+import numpy as np
+
+from generated_variant import GeneratedVariant
+from simulation_func import run_vectorised_simulation
+from stage_profiler import StageProfiler
+from structure_of_variant import KeyMFR, KeyMFRError, KeyMFRForTarget, KeyTarget, KeyTime, KeyVariant
+
+
+def generate_scenario(target_count: int,
+                      mfr_count: int,
+                      anj_fraction: float,
+                      auto_tracking_fraction: float,
+                      modelling_time: int,
+                      seed: int) -> dict:
+    """Генерирует вариант моделирования в том же виде, что и json файл варианта после загрузки
+
+    :param target_count: Число целей
+    :type target_count: int
+    :param mfr_count: Число МФР
+    :type mfr_count: int
+    :param anj_fraction: Доля постановщиков АШП среди целей
+    :type anj_fraction: float
+    :param auto_tracking_fraction: Доля целей на автосопровождении
+    :type auto_tracking_fraction: float
+    :param modelling_time: Время моделирования в секундах
+    :type modelling_time: int
+    :param seed: Зерно генератора случайных чисел (и для сценария, и для моделирования)
+    :type seed: int
+
+    :return: Словарь словарей варианта моделирования
+    :rtype: dict
+    """
+    generator = np.random.default_rng(seed)
+    mfr_numbers = list(range(1, mfr_count + 1))
+
+    # МФР стоят на линии через 10 км
+    mfr_parameters = {number: {KeyMFR.coordinates: [10_000. * (number - 1), 0., 0.],
+                               KeyMFR.errors: {KeyMFRError.beta_north: 0., KeyMFRError.beta: 0.}}
+                      for number in mfr_numbers}
+
+    # Цели в кольце 20-80 км на высотах 1-10 км, летят горизонтально в сторону МФР
+    ranges = generator.uniform(20_000., 80_000., target_count)
+    azimuths = generator.uniform(0., 2 * np.pi, target_count)
+    heights = generator.uniform(1_000., 10_000., target_count)
+    speeds = generator.uniform(100., 300., target_count)
+    is_anj = generator.random(target_count) < anj_fraction
+    is_auto_tracking = generator.random(target_count) < auto_tracking_fraction
+
+    target_parameters = {}
+    for number in range(target_count):
+        direction = np.array([np.cos(azimuths[number]), 0., np.sin(azimuths[number])])
+        target_parameters[number] = {
+            KeyTarget.coordinates: (ranges[number] * direction + [0., heights[number], 0.]).tolist(),
+            KeyTarget.velocities: (-speeds[number] * direction).tolist(),
+            KeyTarget.type: "Aerodynamic",
+            KeyTarget.mfr: {mfr_number: {KeyMFRForTarget.tracked: True,
+                                         KeyMFRForTarget.is_anj: bool(is_anj[number]),
+                                         KeyMFRForTarget.is_auto_tracking: bool(is_auto_tracking[number])}
+                            for mfr_number in mfr_numbers}}
+
+    return {KeyVariant.time: {KeyTime.modelling: modelling_time, KeyTime.repeating: 1, KeyTime.seed: seed},
+            KeyVariant.mfr: mfr_parameters,
+            KeyVariant.target: target_parameters}
+
+
+def run_scenario(json_variant: dict) -> dict:
+    """Моделирует одну реализацию сценария тем же циклом, что и процессы пула (run_vectorised_simulation),
+    и собирает время этапов целей, МФР, ПБУ и ЕМТ через StageProfiler
+
+    :param json_variant: Словарь словарей варианта моделирования
+    :type json_variant: dict
+
+    :return: Времена этапов (в том числе внутренних этапов МФР, ПБУ и ЕМТ), число тиков и циклов ПБУ
+    :rtype: dict
+    """
+    starting_time = perf_counter()
+    variant = GeneratedVariant(json_variant)
+    target_list, mfr_lists, command_posts = variant.objects_for_realizations([0])
+    # Один профилировщик на цели, группы МФР и ПБУ
+    profiler = StageProfiler()
+    for command_post in command_posts:
+        command_post.set_profiler(profiler)
+    setup_time = perf_counter() - starting_time
+
+    simulation_starting_time = perf_counter()
+    run_vectorised_simulation(variant.modelling_time, target_list, mfr_lists, command_posts, profiler)
+    simulation_time = perf_counter() - simulation_starting_time
+
+    # Суммарное время верхних этапов по префиксам имён (этапы ЕМТ входят в этап ПБУ формирования ЕМТ)
+    stage_times = {prefix: sum(total_time for name, (_, total_time, _, _) in profiler.stages.items()
+                               if name.startswith(f"{prefix}."))
+                   for prefix in ("targets", "mfr", "cp")}
+    # Цели двигаются на каждом тике с работой, ПБУ регистрирует результат один раз за цикл
+    due_tick_count = profiler.stages.get("targets.operate", [0])[0]
+    cp_cycle_count = profiler.stages.get("cp.register", [0])[0]
+    ticks = 20 * variant.modelling_time
+    command_post = command_posts[0]
+    return {"setup_time": setup_time,
+            "simulation_time": simulation_time,
+            "stage_times": stage_times,
+            "stages": profiler.report(),
+            "ticks": ticks,
+            "due_ticks": due_tick_count,
+            "ticks_per_second": ticks / simulation_time,
+            "cp_cycles": cp_cycle_count,
+            "cp_cycle_time": stage_times["cp"] / cp_cycle_count if cp_cycle_count else 0.,
+            "cta_traces": len(command_post.common_trace_array),
+            "mfr_registration_rows": sum(len(mfr.registration) for mfr in mfr_lists[0]),
+            "cp_registration_rows": len(command_post.registration)}
+
+
+def get_environment() -> dict:
+    """Описание окружения, в котором проводилось измерение
+
+    :return: Версии python и numpy, платформа, число ядер, версия модели (git), время запуска
+    :rtype: dict
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"python": sys.version,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "commit": commit,
+            "date": datetime.now().isoformat(timespec="seconds")}
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Разбор аргументов командной строки: каждая величина сетки задаётся списком значений
+
+    :return: Аргументы
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Измерение производительности моделирования на сетке сценариев")
+    parser.add_argument("--targets", type=int, nargs="+", default=[1, 10, 100, 1000], help="Число целей")
+    parser.add_argument("--mfrs", type=int, nargs="+", default=[1, 2, 3], help="Число МФР")
+    parser.add_argument("--anj", type=float, nargs="+", default=[0.], help="Доля постановщиков АШП")
+    parser.add_argument("--auto", type=float, nargs="+", default=[0., 1.], help="Доля целей на АС")
+    parser.add_argument("--duration", type=int, nargs="+", default=[60], help="Время моделирования в секундах")
+    parser.add_argument("--seed", type=int, default=1, help="Зерно генератора случайных чисел")
+    parser.add_argument("--output", default="scenario_benchmark.json", help="Файл для результатов")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    results = []
+    grid = list(product(arguments.targets, arguments.mfrs, arguments.anj, arguments.auto, arguments.duration))
+    for index, (target_count, mfr_count, anj_fraction, auto_tracking_fraction, modelling_time) in enumerate(grid):
+        scenario = {"targets": target_count,
+                    "mfrs": mfr_count,
+                    "anj_fraction": anj_fraction,
+                    "auto_tracking_fraction": auto_tracking_fraction,
+                    "duration": modelling_time,
+                    "seed": arguments.seed}
+        json_variant = generate_scenario(target_count, mfr_count, anj_fraction, auto_tracking_fraction,
+                                         modelling_time, arguments.seed)
+        result = run_scenario(json_variant)
+        results.append({"scenario": scenario, "result": result})
+        print(f"{index + 1}/{len(grid)} {scenario}: {result['simulation_time']:.2f} c., "
+              f"{result['ticks_per_second']:.0f} тиков/с, цикл ПБУ {1000 * result['cp_cycle_time']:.2f} мс")
+
+    with open(arguments.output, "w") as json_file:
+        json.dump({"environment": get_environment(), "results": results}, json_file, indent=4)
@@ -4,7 +4,9 @@ import numpy as np
 
 from command_post import CommandPost
 from multi_functional_radar import MultiFunctionalRadar
+from simulation_func import create_tick_scheduler
 from target import Target
+from target_swarm import TargetSwarm
 
 if __name__ == "__main__":
     # Цель
@@ -20,14 +22,20 @@ if __name__ == "__main__":
                                                  stable_point=np.array([1_000., 0., 0.]),
                                                  mfr_number=0)
 
+    # Группа целей
+    target_swarm = TargetSwarm([target])
+
     # ПБУ
     command_post = CommandPost(mfr_list=[multifunctional_radar])
 
+    # Планировщик тиков, на которых есть работа для МФР или ПБУ
+    tick_scheduler = create_tick_scheduler([multifunctional_radar], command_post)
+
     # Время моделирования в секундах
     modelling_time = 2_000
 
     # Моделирование (цикл по времени)
-    for time in range(20 * modelling_time):
-        target.operate(time)
+    for time in tick_scheduler.due_ticks(20 * modelling_time):
+        target_swarm.operate(time)
         multifunctional_radar.operate(time)
         command_post.operate(time)
@@ -5,6 +5,8 @@ import sys
 
 from generated_variant import GeneratedVariant
 from load_variant_function_for_json import object_pairs_hook
+from simulation_func import create_tick_scheduler
+from target_swarm import TargetSwarm
 
 if __name__ == "__main__":
     try:
@@ -21,12 +23,13 @@ if __name__ == "__main__":
 
     # Объекты
     target_list, mfr_list, command_post = variant.objects
+    target_swarm = TargetSwarm(target_list)
+    tick_scheduler = create_tick_scheduler(mfr_list, command_post)
 
     # Не имеет смысла профилировать многократное моделирование одного и того же, поэтому цикл только один
-    for time in range(20 * variant.modelling_time):
+    for time in tick_scheduler.due_ticks(20 * variant.modelling_time):
         # Моделирование
-        for target in target_list:
-            target.operate(time)
+        target_swarm.operate(time)
         for mfr in mfr_list:
             mfr.operate(time)
         command_post.operate(time)
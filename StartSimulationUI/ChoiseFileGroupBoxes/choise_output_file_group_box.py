@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import QGroupBox, QPushButton, QHBoxLayout, QLabel
+from PyQt5.QtWidgets import QGroupBox, QPushButton, QHBoxLayout, QLabel, QCheckBox
 
 
 class ChoiceOutputFileGroupBox(QGroupBox):
@@ -9,10 +9,44 @@ class ChoiceOutputFileGroupBox(QGroupBox):
         # Все компоненты
         self.path_label = QLabel("Путь к файлу")
         self.button = QPushButton("Выберите файл")
+        # Дополнительная запись регистрации в csv файлы (по умолчанию включена, как было до двоичного хранилища)
+        self.csv_export_check_box = QCheckBox("Записать также csv файлы")
+        self.csv_export_check_box.setChecked(True)
+        # Профилирование этапов МФР и ПБУ с записью отчёта в profile_report.json
+        self.profiling_check_box = QCheckBox("Профилировать этапы моделирования")
 
         # Основной контейнер
         layout = QHBoxLayout(self)
         layout.addWidget(self.path_label)
         layout.addWidget(self.button)
+        layout.addWidget(self.csv_export_check_box)
+        layout.addWidget(self.profiling_check_box)
 
         self.button.setEnabled(False)
+
+    @property
+    def is_csv_export(self) -> bool:
+        """
+        :return: Признак дополнительной записи регистрации в csv файлы
+        :rtype: bool
+        """
+        return self.csv_export_check_box.isChecked()
+
+    @property
+    def is_profiling(self) -> bool:
+        """
+        :return: Признак профилирования этапов моделирования
+        :rtype: bool
+        """
+        return self.profiling_check_box.isChecked()
+
+    def set_options_enabled(self, is_enabled: bool) -> None:
+        """Включение или отключение выбора параметров записи (на время моделирования они не меняются)
+
+        :param is_enabled: Признак включения
+        :type is_enabled: bool
+
+        :return: None
+        """
+        self.csv_export_check_box.setEnabled(is_enabled)
+        self.profiling_check_box.setEnabled(is_enabled)
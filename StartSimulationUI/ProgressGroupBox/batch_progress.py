@@ -0,0 +1,82 @@
+class BatchProgress:
+    """Статистика выполнения реализаций: пропускная способность, оценка оставшегося времени
+    и самая долгая пачка реализаций (для поиска отстающих процессов).
+    Реализации пачки моделируются процессом одним векторным циклом и приходят одновременно,
+    поэтому время выполнения известно только для пачки целиком"""
+    __slots__ = ("count_of_iteration",
+                 "starting_time",
+                 "completed",
+                 "completed_ticks",
+                 "slowest_batch_record")
+
+    def __init__(self, count_of_iteration: int, starting_time: float) -> None:
+        """
+        :param count_of_iteration: Число реализаций
+        :type count_of_iteration: int
+        :param starting_time: Время старта моделирования (perf_counter)
+        :type starting_time: float
+        """
+        # Число реализаций
+        self.count_of_iteration = count_of_iteration
+        # Время старта моделирования
+        self.starting_time = starting_time
+        # Число выполненных реализаций
+        self.completed = 0
+        # Число тиков моделирования в выполненных реализациях
+        self.completed_ticks = 0
+        # Запись об одной из реализаций самой долгой пачки
+        self.slowest_batch_record = None
+
+    def __repr__(self) -> str:
+        return f"Выполнено {self.completed!r} из {self.count_of_iteration!r} реализаций. " \
+               f"Объект класса {self.__class__.__name__} по адресу в памяти {hex(id(self))}"
+
+    def update(self, record: dict) -> None:
+        """Учёт выполненной реализации
+
+        :param record: Запись о реализации от процесса пула (нужны ключи batch, batch_duration и ticks)
+        :type record: dict
+
+        :return: None
+        """
+        self.completed += 1
+        self.completed_ticks += record["ticks"]
+        if self.slowest_batch_record is None or \
+                record["batch_duration"] > self.slowest_batch_record["batch_duration"]:
+            self.slowest_batch_record = record
+
+    def realizations_per_second(self, now: float) -> float:
+        """
+        :param now: Текущее время (perf_counter)
+        :type now: float
+
+        :return: Число реализаций, выполняемых за секунду
+        :rtype: float
+        """
+        elapsed_time = now - self.starting_time
+        return self.completed / elapsed_time if elapsed_time > 0 else 0.
+
+    def ticks_per_second(self, now: float) -> float:
+        """
+        :param now: Текущее время (perf_counter)
+        :type now: float
+
+        :return: Число тиков моделирования, выполняемых за секунду всеми процессами
+        :rtype: float
+        """
+        elapsed_time = now - self.starting_time
+        return self.completed_ticks / elapsed_time if elapsed_time > 0 else 0.
+
+    def eta(self, now: float) -> float:
+        """Оценка оставшегося времени по средней скорости выполнения реализаций
+
+        :param now: Текущее время (perf_counter)
+        :type now: float
+
+        :return: Оставшееся время в секундах (бесконечность, пока нет ни одной выполненной реализации)
+        :rtype: float
+        """
+        realizations_per_second = self.realizations_per_second(now)
+        if not realizations_per_second:
+            return float("inf")
+        return (self.count_of_iteration - self.completed) / realizations_per_second
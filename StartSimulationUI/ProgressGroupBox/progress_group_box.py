@@ -3,6 +3,8 @@ from time import perf_counter
 from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QProgressBar, QLabel
 
+from batch_progress import BatchProgress
+
 
 class ProgressGroupBox(QGroupBox):
     """GroupBox для отображения состояния моделирования"""
@@ -14,6 +16,8 @@ class ProgressGroupBox(QGroupBox):
         self.starting_writing_time = 0.
         # Число выполянемых итераций
         self.count_of_iteration = 0
+        # Статистика выполнения реализаций
+        self.batch_progress = None
 
         # Все компоненты
         # Прогресс бар
@@ -52,14 +56,37 @@ class ProgressGroupBox(QGroupBox):
 
         # Сохраним число моделирований
         self.count_of_iteration = repeating_time_max
+        self.batch_progress = BatchProgress(repeating_time_max, self.starting_simulation_time)
 
         # Очистка надписей
         self.simulation_label.setText(f"Идёт моделирование...")
         self.iteration_label.clear()
         self.writing_label.clear()
 
-        # Псевдоиндикация
-        self.bar.setValue(int(0.5 * self.bar.maximum()))
+        # Шкала по числу реализаций, последнее деление - запись в файл
+        self.bar.setRange(0, repeating_time_max + 1)
+        self.bar.setValue(0)
+
+    @pyqtSlot(dict)
+    def show_realization(self, record: dict) -> None:
+        """Показывает прогресс после окончания очередной реализации
+
+        :param record: Запись о реализации от процесса пула
+        :type record: dict
+
+        :return: None
+        """
+        self.batch_progress.update(record)
+        now = perf_counter()
+
+        self.bar.setValue(self.batch_progress.completed)
+
+        # Покажем пропускную способность и оставшееся время
+        self.simulation_label.setText(f"Идёт моделирование: выполнено {self.batch_progress.completed} "
+                                      f"из {self.count_of_iteration} реализаций")
+        self.iteration_label.setText(f"{self.batch_progress.realizations_per_second(now):.2f} реализаций/с, "
+                                     f"{self.batch_progress.ticks_per_second(now):.0f} тиков/с, "
+                                     f"осталось {self.batch_progress.eta(now):.0f} c.")
 
     @pyqtSlot()
     def show_simulation_time(self) -> None:
@@ -73,12 +100,16 @@ class ProgressGroupBox(QGroupBox):
         # Время выполнения одной итерации
         iteration_time = simulation_time / self.count_of_iteration
 
-        # Псевдоиндикация
-        self.bar.setValue(int(0.9 * self.bar.maximum()))
+        # Все реализации выполнены
+        self.bar.setValue(self.count_of_iteration)
 
-        # Покажем время моделирования
+        # Покажем время моделирования и самую долгую пачку реализаций
+        slowest_batch = self.batch_progress.slowest_batch_record["batch"]
+        slowest_batch_duration = self.batch_progress.slowest_batch_record["batch_duration"]
         self.simulation_label.setText(f"Моделирование проведено за {simulation_time:.2f} c.")
-        self.iteration_label.setText(f"Одна итерация выполняется за {iteration_time:.2f} c.")
+        self.iteration_label.setText(f"Одна итерация выполняется в среднем за {iteration_time:.2f} c., "
+                                     f"самая долгая пачка (№ {slowest_batch[0]}-{slowest_batch[-1]}) "
+                                     f"за {slowest_batch_duration:.2f} c.")
 
         # Если закончилось моделирование, то сейчас идёт запись в файл
         self.writing_label.setText("Идёт запись в файл")
@@ -94,7 +125,7 @@ class ProgressGroupBox(QGroupBox):
         ending_writing_time = perf_counter()
         writing_time = ending_writing_time - self.starting_writing_time
 
-        # Псевдоиндикация
+        # Запись в файл закончена
         self.bar.setValue(self.bar.maximum())
 
         # Покажем время записи в файл
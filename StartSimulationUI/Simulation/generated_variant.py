@@ -1,6 +1,7 @@
 from copy import deepcopy
 
 import numpy as np
+from numpy.random import SeedSequence
 
 from command_post import CommandPost
 from errors_namedtuple import SurveillanceErrors
@@ -17,8 +18,14 @@ class GeneratedVariant:
         :param json_variant: Словарь словарей из json файла
         :type json_variant: dict
         """
+        # Исходный словарь варианта: по нему процессы пула сами создают объекты моделирования
+        self.json_variant = json_variant
         self.modelling_time = json_variant[KeyVariant.time][KeyTime.modelling]
         self.repeating_time = json_variant[KeyVariant.time][KeyTime.repeating]
+        # Зерно генератора случайных чисел, если в варианте не задано - берётся из энтропии системы
+        self.seed = json_variant[KeyVariant.time].get(KeyTime.seed)
+        if self.seed is None:
+            self.seed = SeedSequence().entropy
         self._target_list = self._generate_target_list(json_variant[KeyVariant.target])
         self._mfr_list = self._generate_mfr_list(json_variant)
         self._command_post = self._generate_command_post()
@@ -32,6 +39,54 @@ class GeneratedVariant:
         """
         return deepcopy((self._target_list, self._mfr_list, self._command_post))
 
+    def realization_seed_sequence(self, realization: int) -> SeedSequence:
+        """Зерно реализации в дереве зёрен варианта: вариант -> реализация -> МФР.
+        Совпадает с зерном, порождённым SeedSequence(seed).spawn, но не зависит от порядка вызовов
+
+        :param realization: Номер реализации
+        :type realization: int
+
+        :return: Зерно реализации
+        :rtype: SeedSequence
+        """
+        return SeedSequence(self.seed, spawn_key=(realization,))
+
+    def objects_for_realization(self, realization: int) -> tuple:
+        """Глубокая копия объектов, у которой МФР получили свои зёрна из дерева зёрен реализации
+
+        :param realization: Номер реализации
+        :type realization: int
+
+        :return: Глубокая копия кортежа из сгенерированных объектов
+        :rtype: tuple
+        """
+        target_list, (mfr_list,), (command_post,) = self.objects_for_realizations([realization])
+        return target_list, mfr_list, command_post
+
+    def objects_for_realizations(self, realizations: list) -> tuple:
+        """Объекты для нескольких реализаций, моделируемых вместе: цели одни на все реализации,
+        а МФР и ПБУ у каждой реализации свои (МФР с зёрнами из дерева зёрен своей реализации)
+
+        :param realizations: Номера реализаций
+        :type realizations: list
+
+        :return: Список целей, список списков МФР и список ПБУ (по одному на реализацию)
+        :rtype: tuple
+        """
+        target_list = deepcopy(self._target_list)
+        mfr_lists = []
+        command_posts = []
+        for realization in realizations:
+            # Цели уже скопированы, МФР и ПБУ каждой реализации ссылаются на общие копии целей
+            memo = {id(template): target for template, target in zip(self._target_list, target_list)}
+            mfr_list, command_post = deepcopy((self._mfr_list, self._command_post), memo)
+            mfr_seed_sequences = self.realization_seed_sequence(realization).spawn(len(mfr_list))
+            for mfr, seed_sequence in zip(mfr_list, mfr_seed_sequences):
+                mfr.set_seed_sequence(seed_sequence)
+            mfr_lists.append(mfr_list)
+            command_posts.append(command_post)
+        return target_list, mfr_lists, command_posts
+
     def _generate_target_list(self, json_variant: dict) -> list:
         """Конструирует список целей
 
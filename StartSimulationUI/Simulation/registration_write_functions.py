@@ -1,51 +1,56 @@
-"""Модуль определяет жёстко связанные с результатом моделирования функции для записи в csv файл
-При изменении структуры возвращаемого функцией моделирования значения требует рефакторинга."""
+"""Модуль определяет жёстко связанные с результатом моделирования функции для записи в двоичное хранилище
+и (по желанию) в csv файл. При изменении структуры возвращаемого функцией моделирования значения требует рефакторинга."""
 import csv
 
+from registration_store import load_registration, merge_shards
 
-def write_cp_registration(registration: list, path: str) -> None:
-    """Записывает в файл регистрацию от ПБУ
 
-    :param registration: Регистрация в виде списка списков
-    :type registration: list
-    :param path: Путь к файлу, где будут храниться данные
+def save_cp_registration(records: list, path: str, seed: int = None) -> None:
+    """Собирает регистрацию от ПБУ из файлов частей всех реализаций в двоичное хранилище (path.npy и схема path.json)
+
+    :param records: Записи о файлах частей, возвращённые функцией моделирования
+    :type records: list
+    :param path: Путь к файлам без расширения
     :type path: str
+    :param seed: Зерно генератора случайных чисел варианта (записывается в схему для повторения результатов)
+    :type seed: int
 
     :return: None
     """
-    with open(path, "w", newline="") as csv_file:
-        writer = csv.writer(csv_file, delimiter=";")
-        # Первый цикл идёт по различным итерациям
-        for index_of_iteration, one_iteration in enumerate(registration):
-            # В каждой итерации в нулевом элементе лежит регистрация ПБУ
-            cp_registration = one_iteration[0]
-            # Одна строчка из регистрации ПБУ составляет строчку в csv файле
-            for line in cp_registration:
-                # Добавление последнего столбца с номером выполненной итерации
-                line.append(index_of_iteration)
-                writer.writerow(line)
-
-
-def write_mfr_registration(registration: list, path: str) -> None:
-    """Записывает в файл регистрацию от всех МФР
-
-    :param registration: Регистрация в виде списка списков
-    :type registration: list
-    :param path: Путь к файлу, где будут храниться данные
+    merge_shards([record["cp_path"] for record in records], [record["realization"] for record in records], path,
+                 {"seed": seed})
+
+
+def save_mfr_registration(records: list, path: str, seed: int = None) -> None:
+    """Собирает регистрацию от всех МФР из файлов частей всех реализаций в двоичное хранилище
+    (path.npy и схема path.json)
+
+    :param records: Записи о файлах частей, возвращённые функцией моделирования
+    :type records: list
+    :param path: Путь к файлам без расширения
+    :type path: str
+    :param seed: Зерно генератора случайных чисел варианта (записывается в схему для повторения результатов)
+    :type seed: int
+
+    :return: None
+    """
+    merge_shards([record["mfr_path"] for record in records], [record["realization"] for record in records], path,
+                 {"seed": seed})
+
+
+def write_registration_csv(path: str, chunk_size: int = 65536) -> None:
+    """Записывает таблицу регистрации из двоичного хранилища в path.csv.
+    Последний столбец - номер выполненной итерации. Таблица читается частями через отображение в память
+
+    :param path: Путь к файлам таблицы без расширения
     :type path: str
+    :param chunk_size: Число строк, переводимых в список за один раз
+    :type chunk_size: int
 
     :return: None
     """
-    with open(path, "w", newline="") as csv_file:
+    table = load_registration(path)
+    with open(f"{path}.csv", "w", newline="") as csv_file:
         writer = csv.writer(csv_file, delimiter=";")
-        # Первый цикл идёт по различным итерациям
-        for index_of_iteration, one_iteration in enumerate(registration):
-            # В каждой итерации в первом элементе лежит регистрация МФР в виде списка из регистраций каждого МФР
-            all_mfr_registration = one_iteration[1]
-            # Для регистрации от каждого МФР
-            for one_mfr_registration in all_mfr_registration:
-                # Одна строчка из регистрации МФР составляет строчку в csv файле
-                for line in one_mfr_registration:
-                    # Добавление последнего столбца с номером выполненной итерации
-                    line.append(index_of_iteration)
-                    writer.writerow(line)
+        for start in range(0, len(table), chunk_size):
+            writer.writerows(table[start:start + chunk_size].tolist())
@@ -1,3 +1,32 @@
+import os
+from time import perf_counter
+
+from generated_variant import GeneratedVariant
+from multi_functional_radar_group import MultiFunctionalRadarGroup
+from registration_buffer import CP_REGISTRATION_DTYPE, MFR_REGISTRATION_DTYPE
+from registration_store import ShardWriter
+from stage_profiler import StageProfiler
+from target_swarm import TargetSwarm
+from tick_scheduler import TickScheduler
+
+
+def create_tick_scheduler(mfr_list: list, command_post) -> TickScheduler:
+    """Создаёт планировщик тиков по темпам работы всех МФР и ПБУ.
+    На остальных тиках ни МФР, ни ПБУ ничего не делают, а цели можно сдвинуть сразу на нужный тик
+
+    :param mfr_list: Список МФР
+    :type mfr_list: list
+    :param command_post: ПБУ
+    :type command_post: CommandPost
+
+    :return: Планировщик тиков
+    :rtype: TickScheduler
+    """
+    schedule = [(mfr.start_tick, frame_tick) for mfr in mfr_list for frame_tick in mfr.frame_ticks]
+    schedule.append((command_post.start_tick, command_post.tick_period))
+    return TickScheduler(schedule)
+
+
 def simulation(simulation_variant: list) -> tuple:
     """Тело функции, исполненное процессом, должно быть объявлено на верхнем уровне модуля
     Функция запускает цикл по времени для моделируемых объектов
@@ -9,12 +38,193 @@ def simulation(simulation_variant: list) -> tuple:
     """
     # Распаковка
     _, modelling_time, target_list, mfr_list, command_post = simulation_variant
+    run_simulation(modelling_time, target_list, mfr_list, command_post)
+    return command_post.registration, [mfr.registration for mfr in mfr_list]
+
+
+# Вариант моделирования процесса пула, создаётся один раз при запуске процесса
+worker_variant = None
+# Признак профилирования этапов в процессе пула
+worker_is_profiling = False
+
+
+def init_simulation_worker(json_variant: dict, seed: int, is_profiling: bool = False) -> None:
+    """Инициализатор процесса пула: по словарю варианта один раз создаёт объекты моделирования,
+    для каждой реализации процесс делает их копию у себя, не получая объекты от родительского процесса
+
+    :param json_variant: Словарь словарей из json файла
+    :type json_variant: dict
+    :param seed: Зерно варианта (одно на все процессы, даже если в словаре его нет)
+    :type seed: int
+    :param is_profiling: Признак профилирования этапов МФР и ПБУ
+    :type is_profiling: bool
+
+    :return: None
+    """
+    global worker_variant, worker_is_profiling
+    worker_variant = GeneratedVariant(json_variant)
+    worker_variant.seed = seed
+    worker_is_profiling = is_profiling
+
+
+def simulation_to_shards(simulation_variant: list) -> list:
+    """Тело функции, исполненное процессом, должно быть объявлено на верхнем уровне модуля
+    Функция запускает цикл по времени для моделируемых объектов нескольких реализаций сразу
+    (МФР реализаций работают группами, см. run_vectorised_simulation), регистрация по мере заполнения буферов
+    пишется в файлы частей каждой реализации, а в родительский процесс возвращаются только короткие записи о них.
+    Объекты моделирования берутся из варианта, созданного init_simulation_worker
+
+    :param simulation_variant: Номера реализаций, директория для файлов частей
+    :type simulation_variant: list
+
+    :return: Записи о каждой реализации: номер реализации, пути к файлам частей ПБУ и МФР и число строк в них,
+    номера реализаций пачки и время выполнения всей пачки (реализации пачки моделируются одним циклом,
+    поэтому отдельно их время не измерить), число тиков моделирования, номер процесса,
+    профилировщик этапов ПБУ реализации и профилировщик общих для пачки этапов целей и МФР
+    (он есть только в записи о первой реализации пачки, в остальных None, как и при выключенном профилировании)
+    :rtype: list
+    """
+    starting_time = perf_counter()
+    # Распаковка
+    realizations, shard_directory = simulation_variant
+    modelling_time = worker_variant.modelling_time
+    # Реализация зависит только от зерна варианта и своего номера, а не от процесса, который её считает
+    target_list, mfr_lists, command_posts = worker_variant.objects_for_realizations(realizations)
+    # Регистрация ПБУ и всех МФР каждой реализации пишется в два файла
+    writers = []
+    for realization, mfr_list, command_post in zip(realizations, mfr_lists, command_posts):
+        cp_writer = ShardWriter(os.path.join(shard_directory, f"cp_{realization}.npy"), CP_REGISTRATION_DTYPE)
+        mfr_writer = ShardWriter(os.path.join(shard_directory, f"mfr_{realization}.npy"), MFR_REGISTRATION_DTYPE)
+        command_post.registration.sink = cp_writer
+        for mfr in mfr_list:
+            mfr.registration.sink = mfr_writer
+        writers.append((cp_writer, mfr_writer))
+    # Профилировщики: общий для целей и групп МФР и по одному на ПБУ каждой реализации
+    batch_profiler = StageProfiler() if worker_is_profiling else None
+    profilers = [StageProfiler() if worker_is_profiling else None for _ in realizations]
+    for command_post, profiler in zip(command_posts, profilers):
+        command_post.set_profiler(profiler)
+    run_vectorised_simulation(modelling_time, target_list, mfr_lists, command_posts, batch_profiler)
+    # Сброс остатков буферов
+    for mfr_list, command_post in zip(mfr_lists, command_posts):
+        for registration in [command_post.registration, *(mfr.registration for mfr in mfr_list)]:
+            registration.flush()
+    batch_duration = perf_counter() - starting_time
+    records = []
+    # Профилировщик пачки передаётся один раз, чтобы при объединении не учитывать его несколько раз
+    batch_profilers = [batch_profiler] + [None] * (len(realizations) - 1)
+    for realization, (cp_writer, mfr_writer), profiler, record_batch_profiler in zip(realizations, writers, profilers,
+                                                                                     batch_profilers):
+        cp_writer.close()
+        mfr_writer.close()
+        records.append({"realization": realization,
+                        "cp_path": cp_writer.path, "cp_rows": cp_writer.rows,
+                        "mfr_path": mfr_writer.path, "mfr_rows": mfr_writer.rows,
+                        "batch": realizations, "batch_duration": batch_duration,
+                        "ticks": 20 * modelling_time, "pid": os.getpid(),
+                        "profiler": profiler, "batch_profiler": record_batch_profiler})
+    return records
+
+
+def split_realizations(count: int, process_count: int, vectorised_size: int) -> list:
+    """Делит реализации на пачки, моделируемые процессом вместе. Пачка не больше vectorised_size,
+    но и не больше, чем нужно, чтобы каждому процессу досталась хотя бы одна пачка
+
+    :param count: Число реализаций
+    :type count: int
+    :param process_count: Число процессов
+    :type process_count: int
+    :param vectorised_size: Наибольший размер пачки
+    :type vectorised_size: int
+
+    :return: Список списков номеров реализаций
+    :rtype: list
+    """
+    size = max(1, min(vectorised_size, -(-count // process_count)))
+    return [list(range(start, min(start + size, count))) for start in range(0, count, size)]
+
+
+def calc_chunk_size(task_count: int, process_count: int) -> int:
+    """Число пачек реализаций, отдаваемых процессу за один раз (chunksize пула).
+    Большие значения уменьшают накладные расходы пула, маленькие - выравнивают загрузку процессов
+    и делают индикацию прогресса плавной, поэтому каждый процесс получает задания не меньше восьми раз
+
+    :param task_count: Число пачек реализаций
+    :type task_count: int
+    :param process_count: Число процессов
+    :type process_count: int
+
+    :return: Число пачек
+    :rtype: int
+    """
+    return max(1, min(16, task_count // (8 * process_count)))
+
+
+def run_vectorised_simulation(modelling_time: int,
+                              target_list: list,
+                              mfr_lists: list,
+                              command_posts: list,
+                              profiler: StageProfiler = None) -> None:
+    """Цикл по времени для нескольких реализаций сразу. Цели общие для всех реализаций,
+    копии одного МФР из разных реализаций работают группой (измерение, фильтрация и пересчёт координат
+    выполняются одним вызовом), а ПБУ работает в каждой реализации отдельно
+
+    :param modelling_time: Время моделирования в секундах
+    :type modelling_time: int
+    :param target_list: Список целей
+    :type target_list: list
+    :param mfr_lists: Списки МФР каждой реализации
+    :type mfr_lists: list
+    :param command_posts: ПБУ каждой реализации
+    :type command_posts: list
+    :param profiler: Профилировщик этапов целей и групп МФР (None - без профилирования)
+    :type profiler: StageProfiler
+
+    :return: None
+    """
+    # Все цели двигаются одной векторной операцией
+    target_swarm = TargetSwarm(target_list)
+    # Группы копий каждого МФР
+    mfr_groups = [MultiFunctionalRadarGroup(list(mfr_copies)) for mfr_copies in zip(*mfr_lists)]
+    for mfr_group in mfr_groups:
+        mfr_group.profiler = profiler
+    # Планировщик тиков одинаков для всех реализаций
+    tick_scheduler = create_tick_scheduler(mfr_lists[0], command_posts[0])
+    # Внутренний цикл по времени
+    for time in tick_scheduler.due_ticks(20 * modelling_time):
+        # Моделирование
+        if profiler is None:
+            target_swarm.operate(time)
+        else:
+            profiler.run("targets.operate", target_swarm.operate, time, size=len(target_swarm))
+        for mfr_group in mfr_groups:
+            mfr_group.operate(time)
+        for command_post in command_posts:
+            command_post.operate(time)
+
+
+def run_simulation(modelling_time: int, target_list: list, mfr_list: list, command_post) -> None:
+    """Цикл по времени для моделируемых объектов
+
+    :param modelling_time: Время моделирования в секундах
+    :type modelling_time: int
+    :param target_list: Список целей
+    :type target_list: list
+    :param mfr_list: Список МФР
+    :type mfr_list: list
+    :param command_post: ПБУ
+    :type command_post: CommandPost
+
+    :return: None
+    """
+    # Все цели двигаются одной векторной операцией
+    target_swarm = TargetSwarm(target_list)
+    # Планировщик тиков, на которых есть работа для МФР или ПБУ
+    tick_scheduler = create_tick_scheduler(mfr_list, command_post)
     # Внутренний цикл по времени
-    for time in range(20 * modelling_time):
+    for time in tick_scheduler.due_ticks(20 * modelling_time):
         # Моделирование
-        for target in target_list:
-            target.operate(time)
+        target_swarm.operate(time)
         for mfr in mfr_list:
             mfr.operate(time)
         command_post.operate(time)
-    return command_post.registration, [mfr.registration for mfr in mfr_list]
@@ -1,47 +1,113 @@
+import json
 from multiprocessing import Pool
 from os import cpu_count
+from tempfile import TemporaryDirectory
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from generated_variant import GeneratedVariant
-from registration_write_functions import write_cp_registration, write_mfr_registration
-from simulation_func import simulation
+from registration_write_functions import save_cp_registration, save_mfr_registration, write_registration_csv
+from simulation_func import calc_chunk_size, init_simulation_worker, simulation_to_shards, split_realizations
+from stage_profiler import StageProfiler
 
 
 class SimulationThread(QThread):
     """Отдельный от GUI поток для моделирования"""
+    # Сигнал для окончания одной реализации, передаёт запись о ней (номер, пачку и время её выполнения, число тиков)
+    ending_realization = pyqtSignal(dict)
     # Сигнал для окончания моделирования
     ending_simulation = pyqtSignal()
 
-    def __init__(self, variant: GeneratedVariant, parent=None) -> None:
+    def __init__(self,
+                 variant: GeneratedVariant,
+                 parent=None,
+                 is_csv_export: bool = False,
+                 vectorised_size: int = 8,
+                 is_profiling: bool = False) -> None:
         """Конструктор потока для запуска пула процессов, экземпляр сохраняет ссылку на вариант моделирования.
 
         :param variant: Сгенерированный вариант моделрования
         :type variant: GeneratedVariant
         :param parent: Родительский виджет
         :type parent: QWidget
+        :param is_csv_export: Признак дополнительной записи регистрации в csv файлы
+        :type is_csv_export: bool
+        :param vectorised_size: Наибольшее число реализаций, моделируемых процессом вместе
+        :type vectorised_size: int
+        :param is_profiling: Признак профилирования этапов МФР и ПБУ с записью отчёта в profile_report.json
+        :type is_profiling: bool
         """
         QThread.__init__(self, parent)
         self.variant = variant
+        self.is_csv_export = is_csv_export
+        self.vectorised_size = vectorised_size
+        self.is_profiling = is_profiling
 
     def run(self) -> None:
         """Тело функции, исполненное потоком после вызова метода start().
         Поток запускает пул из процессов.
         Перед пулом стоит задача выполнить моделирование столько раз, сколько указал пользователь.
-        После выполнения моделирования пул уничтожается и идёт запись в файл регистрации данных от ПБУ и МФР
+        Каждый процесс один раз создаёт объекты моделирования по словарю варианта и копирует их для каждой реализации,
+        от потока он получает только номера реализаций, которые моделирует вместе.
+        Процессы по ходу моделирования пишут регистрацию в файлы частей во временной директории
+        и возвращают только записи о них. После выполнения моделирования (или при ошибке) пул уничтожается,
+        а части собираются в двоичное хранилище данных от ПБУ и МФР (npy файлы со схемой в json),
+        при необходимости и в csv файлы
 
         :return: None
         """
-        # Получение нужных ссылок из варианта моделирования
-        simulation_variant = [(time, self.variant.modelling_time, *self.variant.objects)
-                              for time in range(self.variant.repeating_time)]
-        # Создание пула процессов, которые будут производить моделирование
-        process_count = cpu_count()
-        pool = Pool(processes=process_count)
-        registration = pool.map(simulation, simulation_variant)
-        self.ending_simulation.emit()
-        # Убъём процессы, чтобы не висели
-        pool.close()
-        # Запись в файлы
-        write_cp_registration(registration, "registry_cp.csv")
-        write_mfr_registration(registration, "registry_mfr.csv")
+        with TemporaryDirectory(prefix="registry_shards_", dir=".") as shard_directory:
+            # Создание пула процессов, которые будут производить моделирование
+            process_count = cpu_count()
+            # Для каждой пачки реализаций процессу нужны только номера реализаций и директория для частей
+            simulation_variant = [(realizations, shard_directory) for realizations in
+                                  split_realizations(self.variant.repeating_time, process_count, self.vectorised_size)]
+            # При выходе из блока пул уничтожается, в том числе при ошибке в процессе,
+            # поэтому временная директория удаляется только после завершения всех процессов
+            with Pool(processes=process_count,
+                      initializer=init_simulation_worker,
+                      initargs=(self.variant.json_variant, self.variant.seed, self.is_profiling)) as pool:
+                # Реализации приходят по мере готовности, о каждой сообщаем GUI
+                records = []
+                chunk_size = calc_chunk_size(len(simulation_variant), process_count)
+                for batch_records in pool.imap_unordered(simulation_to_shards, simulation_variant,
+                                                         chunksize=chunk_size):
+                    for record in batch_records:
+                        records.append(record)
+                        self.ending_realization.emit(record)
+                # Все реализации готовы, дождёмся завершения процессов, чтобы не висели
+                pool.close()
+                pool.join()
+            self.ending_simulation.emit()
+            # Сборка частей в файлы в порядке номеров реализаций
+            records.sort(key=lambda record: record["realization"])
+            # Действующее зерно (в том числе взятое из энтропии системы) пишется в схемы для повторения результатов
+            save_cp_registration(records, "registry_cp", self.variant.seed)
+            save_mfr_registration(records, "registry_mfr", self.variant.seed)
+        if self.is_profiling:
+            self.write_profile_report(records, self.variant.seed)
+        if self.is_csv_export:
+            write_registration_csv("registry_cp")
+            write_registration_csv("registry_mfr")
+
+    @staticmethod
+    def write_profile_report(records: list, seed: int) -> None:
+        """Записывает в profile_report.json отчёт профилирования по всем процессам, по общим этапам каждой пачки
+        (цели и МФР) и по этапам ПБУ каждой реализации, вместе с зерном генератора варианта
+
+        :param records: Записи о реализациях, возвращённые функцией моделирования
+        :type records: list
+        :param seed: Зерно генератора случайных чисел варианта
+        :type seed: int
+
+        :return: None
+        """
+        batch_records = [record for record in records if record["batch_profiler"] is not None]
+        profilers = [record["profiler"] for record in records] + [record["batch_profiler"] for record in batch_records]
+        report = {"seed": seed,
+                  "total": StageProfiler.merged(profilers).report(),
+                  "batches": {f"{record['batch'][0]}-{record['batch'][-1]}": record["batch_profiler"].report()
+                              for record in batch_records},
+                  "realizations": {record["realization"]: record["profiler"].report() for record in records}}
+        with open("profile_report.json", "w") as json_file:
+            json.dump(report, json_file, indent=4)
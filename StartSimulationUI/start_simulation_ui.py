@@ -42,6 +42,7 @@ class StartSimulationUI(QWidget):
         # Включение кнопок старта моделирования и выбора файлов
         self.control_buttons_layout.start_button.setEnabled(True)
         self.choice_input_file_group_box.button.setEnabled(True)
+        self.choice_output_file_group_box.set_options_enabled(True)
         # Показать время записи в файл
         self.progress_group_box.show_writing_time()
 
@@ -54,13 +55,17 @@ class StartSimulationUI(QWidget):
         # Отключили кнопки
         self.choice_input_file_group_box.button.setEnabled(False)
         self.control_buttons_layout.start_button.setEnabled(False)
+        self.choice_output_file_group_box.set_options_enabled(False)
         # Укажем тип варианта, чтобы потом избежать ошибок при рефакторинге
         variant: GeneratedVariant = self.choice_input_file_group_box.variant
         # Подготовим виджеты с прогрессбаром
         self.progress_group_box.prepare_for_simulation(variant.repeating_time)
-        # Создали экземпляр потока, который будет запускать пул процессов
-        self.simulation_thread = SimulationThread(variant)
+        # Создали экземпляр потока, который будет запускать пул процессов, с выбранными параметрами записи
+        self.simulation_thread = SimulationThread(variant,
+                                                  is_csv_export=self.choice_output_file_group_box.is_csv_export,
+                                                  is_profiling=self.choice_output_file_group_box.is_profiling)
         # Связь с прогресс баром
+        self.simulation_thread.ending_realization.connect(self.progress_group_box.show_realization)
         self.simulation_thread.ending_simulation.connect(self.progress_group_box.show_simulation_time)
         self.simulation_thread.finished.connect(self.on_ending)
         # Запуск потока